@@ -0,0 +1,55 @@
+"""
+Shared Test Fixtures
+
+sample_data builds seeded random-walk OHLCV bars for the strategy, simulator,
+portfolio, robustness, kernel and replay tests.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+
+def make_bars(n: int = 500, seed: int = 0, drift: float = 0.0, volatility: float = 0.01,
+              clustered: bool = False, start: str = '2024-01-01', freq: str = 'h') -> pd.DataFrame:
+    """
+    Generate random-walk OHLCV bars
+
+    Args:
+        n: Number of bars
+        seed: Random seed
+        drift: Mean log return per bar
+        volatility: Standard deviation of the log return per bar
+        clustered: Alternate calm (volatility / 2) and wild (2 x volatility)
+            stretches of 40 bars, so every volatility regime occurs
+        start: First timestamp
+        freq: Bar frequency
+
+    Returns:
+        DataFrame with open/high/low/close/volume and a DatetimeIndex; every
+        bar has a valid OHLC shape
+    """
+    rng = np.random.default_rng(seed)
+    vol = np.full(n, float(volatility))
+    if clustered:
+        vol = np.where(np.sin(np.arange(n) / 40.0) > 0, 2.0 * volatility, 0.5 * volatility)
+    close = 100 * np.exp(np.cumsum(rng.normal(drift, vol)))
+    open_ = close * np.exp(rng.normal(0, 0.2 * vol))
+    return pd.DataFrame({
+        'open': open_,
+        'high': np.maximum(open_, close) * (1 + np.abs(rng.normal(0, 0.5 * vol))),
+        'low': np.minimum(open_, close) * (1 - np.abs(rng.normal(0, 0.5 * vol))),
+        'close': close,
+        'volume': rng.integers(1000, 5000, n).astype(float),
+    }, index=pd.date_range(start, periods=n, freq=freq))
+
+
+@pytest.fixture
+def sample_data():
+    """Factory fixture: sample_data(n, seed=..., ...) -> OHLCV bars (see make_bars)"""
+    return make_bars
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Python Parameter Optimizer
+Usage: python3 optimizer.py TICKER INTERVAL [--strategy NAME] [--candles N] [--warmup-tolerance TOL] [--no-cache] [--nosave]
+Example: python3 optimizer.py QQQ 1h
+
+CPU counterpart of opencl/optimize. Reads default parameters and
+SEARCH_PERCENT_* ranges from opencl/strategies/<strategy>/config_<interval>.h,
+evaluates every valid candidate with the vectorized simulator and stores the
+best run in opencl/results.db.
+
+Evaluated candidates are memoized in a persistent result cache, so re-running
+an overlapping sweep only evaluates the new points.
+
+The warmup is derived from the slowest parameters in the search range
+(exact, or EMA convergence within --warmup-tolerance); with --candles only
+the last N candles plus that warmup are evaluated.
+"""
+
+import argparse
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from strategies import get_strategy_factory, list_strategies
+from utils.config_header import parse_config_header, search_ranges, strategy_settings, iter_candidates
+from utils.data_loader import load_data, dataset_checksum, dataset_fingerprint
+from utils.result_cache import ResultCache, make_key, strategy_version
+from utils.result_store import ResultStore
+from utils.simulator import simulate, trade_log, BARS_PER_YEAR, FILL_MODES
+from utils.validation import format_report, validate_file
+from utils.warmup import search_warmup
+
+
+OPENCL_DIR = Path(__file__).parent.parent / 'opencl'
+
+
+def evaluate(strategy, data, include_equity: bool = False, **settings) -> dict:
+    """
+    Evaluate one strategy instance on a dataset
+
+    Args:
+        strategy: Strategy instance
+        data: OHLCV DataFrame
+        include_equity: Also return the equity and position series
+        **settings: Simulation settings passed to utils.simulator.simulate
+            (initial_capital, warmup, bars_per_year, commission_bps,
+            slippage_bps, fill, position_size)
+
+    Returns:
+        Metrics dictionary from utils.simulator.simulate
+    """
+    signals = strategy.generate_signals(data)['signal']
+    return simulate(data, signals, include_equity=include_equity, **settings)
+
+
+def optimize(create_strategy, data, candidates, initial_capital: float = 10000.0,
+             warmup: int = 0, bars_per_year: float = BARS_PER_YEAR['1h'],
+             commission_bps: float = 0.0, slippage_bps: float = 0.0,
+             fill: str = 'close', position_size: float = 1.0,
+             min_trades: int = 1, max_drawdown_filter: float = 100.0,
+             cache: ResultCache = None) -> list:
+    """
+    Evaluate parameter candidates and rank them by Calmar ratio
+
+    Args:
+        create_strategy: Factory taking a params dict and returning a strategy
+        data: OHLCV DataFrame
+        candidates: Iterable of parameter dictionaries
+        initial_capital, warmup, bars_per_year: Simulation settings
+        commission_bps, slippage_bps, fill, position_size: Fill model
+            (see utils.simulator)
+        min_trades: Minimum completed trades for a result to be kept
+        max_drawdown_filter: Maximum drawdown (%) for a result to be kept
+        cache: Optional ResultCache consulted before each evaluation
+
+    Returns:
+        List of (parameters, metrics) tuples, best first
+    """
+    settings = {
+        'initial_capital': initial_capital,
+        'warmup': warmup,
+        'bars_per_year': bars_per_year,
+        'commission_bps': commission_bps,
+        'slippage_bps': slippage_bps,
+        'fill': fill,
+        'position_size': position_size,
+    }
+    dataset = dataset_checksum(data) if cache is not None else None
+    start, end = data.index[0], data.index[-1]
+    version = None
+
+    results = []
+    for candidate in candidates:
+        strategy = create_strategy(candidate)
+        params = strategy.get_parameters()
+
+        metrics = None
+        if cache is not None:
+            version = version or strategy_version(strategy)
+            key = make_key(dataset, start, end, version, {**params, **settings})
+            metrics = cache.get(key)
+        if metrics is None:
+            metrics = evaluate(strategy, data, **settings)
+            if cache is not None:
+                cache.put(key, metrics)
+
+        if metrics['total_trades'] < min_trades or metrics['max_drawdown'] > max_drawdown_filter:
+            continue
+        results.append((params, metrics))
+
+    results.sort(key=lambda r: r[1]['calmar_ratio'], reverse=True)
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Optimize strategy parameters on the CPU')
+    parser.add_argument('ticker')
+    parser.add_argument('interval')
+    parser.add_argument('--strategy', default='adaptive_ema_v1', choices=list_strategies())
+    parser.add_argument('--commission-bps', type=float, help='Commission per side (default: from config)')
+    parser.add_argument('--slippage-bps', type=float, help='Spread/slippage per side (default: from config)')
+    parser.add_argument('--fill', choices=FILL_MODES, default='close', help='Execution price')
+    parser.add_argument('--position-size', type=float, default=1.0, help='Fraction of equity per trade')
+    parser.add_argument('--candles', type=int, help='Evaluate only the last N candles (plus warmup)')
+    parser.add_argument('--warmup', type=int, help='Warmup bars (default: derived from the search range)')
+    parser.add_argument('--warmup-tolerance', type=float,
+                        help='Derive the warmup from EMA convergence within this tolerance (e.g. 0.01)')
+    parser.add_argument('--cache', default=str(OPENCL_DIR / 'result_cache.db'), help='Result cache path')
+    parser.add_argument('--max-cache-entries', type=int, default=1_000_000)
+    parser.add_argument('--no-cache', action='store_true', help='Evaluate every candidate')
+    parser.add_argument('--nosave', action='store_true', help='Do not store the best run')
+    args = parser.parse_args(argv)
+
+    ticker = args.ticker.upper()
+    interval = args.interval.lower()
+    data_file = OPENCL_DIR / 'data' / f"{ticker.lower()}_{interval}.csv"
+    config_file = OPENCL_DIR / 'strategies' / args.strategy / f"config_{interval}.h"
+
+    if not data_file.exists():
+        print(f"❌ Error: Could not open {data_file}")
+        print(f"   Run: cd ../opencl && python3 fetch_data.py {ticker} {interval} 600")
+        return 1
+
+    report = validate_file(data_file, interval)
+    if not report['valid']:
+        print('\n'.join(format_report(report)))
+        print(f"   Run: cd ../opencl && python3 validate_data.py {ticker} {interval} --repair")
+        return 1
+
+    data = load_data(data_file)
+    config = parse_config_header(config_file)
+    settings = strategy_settings(config, interval)
+    ranges = search_ranges(config, interval)
+    create_strategy = get_strategy_factory(args.strategy, interval)
+
+    if args.warmup is not None:
+        warmup = args.warmup
+    else:
+        warmup = search_warmup(create_strategy, ranges, tolerance=args.warmup_tolerance)
+        if args.warmup_tolerance is None and settings['warmup'] < warmup:
+            print(f"⚠️  WARMUP_PERIOD_{interval.upper()} is {settings['warmup']} in {config_file.name}, "
+                  f"but the search range needs {warmup} bars")
+    if args.candles:
+        data = data.tail(args.candles + warmup)
+
+    sim_settings = {
+        'initial_capital': settings['initial_capital'],
+        'warmup': warmup,
+        'bars_per_year': BARS_PER_YEAR.get(interval, BARS_PER_YEAR['1h']),
+        'commission_bps': settings['commission_bps'] if args.commission_bps is None else args.commission_bps,
+        'slippage_bps': settings['slippage_bps'] if args.slippage_bps is None else args.slippage_bps,
+        'fill': args.fill,
+        'position_size': args.position_size,
+    }
+
+    print(f"🔍 Optimizing {ticker} {interval} - {args.strategy}")
+    print(f"   Candles: {len(data)} ({warmup} warmup) | Config: {config_file.name}")
+    for line in format_report(report):
+        print(f"   {line}")
+    print(f"   Costs: {sim_settings['commission_bps']:g} bps commission + {sim_settings['slippage_bps']:g} bps slippage, "
+          f"fill at {sim_settings['fill']}")
+
+    cache = None if args.no_cache else ResultCache(args.cache, max_entries=args.max_cache_entries)
+    started = time.time()
+    try:
+        results = optimize(
+            create_strategy, data, iter_candidates(ranges),
+            **sim_settings,
+            min_trades=settings['min_trades'],
+            max_drawdown_filter=settings['max_drawdown_filter'],
+            cache=cache,
+        )
+    finally:
+        if cache is not None:
+            print(f"   {cache.report()}")
+            cache.close()
+    elapsed = time.time() - started
+
+    print(f"   Valid: {len(results)} results in {elapsed:.1f}s")
+    if not results:
+        print("❌ No parameter set passed the filters")
+        return 1
+
+    params, metrics = results[0]
+    print(f"\n🏆 BEST PARAMETERS FOR {ticker}")
+    print(f"   Total Return: {metrics['total_return']:.2f}%")
+    print(f"   Max Drawdown: {metrics['max_drawdown']:.2f}%")
+    print(f"   Calmar Ratio: {metrics['calmar_ratio']:.2f}")
+    print(f"   Sharpe Ratio: {metrics['sharpe_ratio']:.2f}")
+    print(f"   Total Trades: {metrics['total_trades']}")
+    print(f"   Parameters: {params}")
+
+    if not args.nosave:
+        best = evaluate(create_strategy(params), data, include_equity=True, **sim_settings)
+        run = {
+            'ticker': ticker,
+            'interval': interval,
+            'strategy': args.strategy,
+            'timestamp': datetime.now().strftime('%Y%m%d_%H%M%S'),
+            'candles': len(data),
+            'dataset': dataset_fingerprint(data),
+            'performance': metrics,
+            'parameters': params,
+            'trades': trade_log(data, best['position'], fill=sim_settings['fill']),
+        }
+        with ResultStore(OPENCL_DIR / 'results.db') as store:
+            run_id = store.add_run(run, source='optimizer.py')
+        print(f"\n💾 Stored as run {run_id} in {OPENCL_DIR / 'results.db'}")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
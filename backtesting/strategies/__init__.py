@@ -0,0 +1,11 @@
+"""Trading strategies - base class, shared vectorized indicators and the strategy registry"""
+
+from . import indicators
+from .base_strategy import BaseStrategy
+from .registry import (
+    StrategyFactory, discover_strategies, get_strategy, get_strategy_factory,
+    list_strategies, make_strategy, register_strategy, strategy_intervals,
+)
+
+__all__ = ['BaseStrategy', 'StrategyFactory', 'discover_strategies', 'get_strategy', 'get_strategy_factory',
+           'indicators', 'list_strategies', 'make_strategy', 'register_strategy', 'strategy_intervals']
@@ -17,9 +17,12 @@ Strategy Logic:
 
 import pandas as pd
 import numpy as np
+from .. import indicators
 from ..base_strategy import BaseStrategy
+from ..registry import register_strategy
 
 
+@register_strategy('adaptive_ema_v1')
 class AdaptiveEmaV1Strategy(BaseStrategy):
     """
     Adaptive Volatility EMA Crossover Strategy
@@ -28,6 +31,9 @@ class AdaptiveEmaV1Strategy(BaseStrategy):
     appropriate EMA lengths for different market conditions.
     """
     
+    # Volatility regime labels, indexed by the 'regime' code
+    REGIMES = np.array(['low', 'medium', 'high'])
+    
     def __init__(self, params: dict):
         """
         Initialize strategy with parameters
@@ -44,8 +50,13 @@ class AdaptiveEmaV1Strategy(BaseStrategy):
                 - volatility_length: Volatility lookback window (default: 63)
                 - low_vol_percentile: Low volatility threshold (default: 25)
                 - high_vol_percentile: High volatility threshold (default: 73)
+                
+        Raises:
+            ValueError: A fast EMA is not shorter than its slow EMA, or the
+                low percentile is not below the high percentile
         """
         # Initialize base class
+        params = dict(params)
         initial_capital = params.pop('initial_capital', 10000)
         super().__init__(initial_capital=initial_capital)
         
@@ -62,78 +73,59 @@ class AdaptiveEmaV1Strategy(BaseStrategy):
         self.low_pct = params.get('low_vol_percentile', 25)
         self.high_pct = params.get('high_vol_percentile', 73)
         
-        # Validation
-        assert self.fast_low < self.slow_low, "Fast EMA must be < Slow EMA (low vol)"
-        assert self.fast_med < self.slow_med, "Fast EMA must be < Slow EMA (med vol)"
-        assert self.fast_high < self.slow_high, "Fast EMA must be < Slow EMA (high vol)"
-        assert self.low_pct < self.high_pct, "Low percentile must be < High percentile"
+        # Validation (ValueError, not assert, so it also holds under python -O)
+        if not self.fast_low < self.slow_low:
+            raise ValueError("Fast EMA must be < Slow EMA (low vol)")
+        if not self.fast_med < self.slow_med:
+            raise ValueError("Fast EMA must be < Slow EMA (med vol)")
+        if not self.fast_high < self.slow_high:
+            raise ValueError("Fast EMA must be < Slow EMA (high vol)")
+        if not self.low_pct < self.high_pct:
+            raise ValueError("Low percentile must be < High percentile")
         
         # Cache for indicators (calculated once per run)
         self.indicators_df = None
-    
-    def calculate_ema(self, series: pd.Series, period: int) -> pd.Series:
-        """Calculate Exponential Moving Average"""
-        return series.ewm(span=period, adjust=False).mean()
-    
-    def calculate_atr(self, df: pd.DataFrame) -> pd.Series:
-        """
-        Calculate Average True Range
         
-        Args:
-            df: DataFrame with 'high', 'low', 'close' columns
-            
-        Returns:
-            Series of ATR values
-        """
-        high = df['high']
-        low = df['low']
-        close = df['close']
-        
-        # True Range components
-        tr1 = high - low
-        tr2 = abs(high - close.shift(1))
-        tr3 = abs(low - close.shift(1))
-        
-        # True Range is max of the three
-        tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-        
-        # ATR is EMA of True Range
-        atr = tr.ewm(span=self.atr_length, adjust=False).mean()
-        
-        return atr
+        # Incremental state for update()
+        self.reset()
     
-    def calculate_volatility_percentile(self, normalized_atr: pd.Series) -> pd.Series:
+    def compute_indicators(self, high, low, close) -> dict:
         """
-        Calculate volatility percentile rank (matches Pine Script logic)
-        
-        For each bar, counts how many values in the lookback window are <= current value,
-        then calculates percentile as (count / window_size) * 100
+        Vectorized indicators for one series or a batch of series
         
         Args:
-            normalized_atr: Series of normalized ATR values (ATR / close * 100)
-            
+            high, low, close: Arrays of shape (bars,) or (bars, columns), where
+                columns are independent series (e.g. bootstrap paths)
+                
         Returns:
-            Series of percentile ranks (0-100)
+            Dictionary of arrays with the input shape: atr, normalized_atr,
+            vol_percentile, ema_fast, ema_slow, regime (0 = low, 1 = medium,
+            2 = high volatility) and signal (1 = BUY, -1 = SELL, 0)
         """
-        percentiles = pd.Series(index=normalized_atr.index, dtype=float)
+        close = np.asarray(close, dtype=float)
         
-        for i in range(len(normalized_atr)):
-            if i < self.vol_length:
-                percentiles.iloc[i] = 50.0  # Default to medium volatility during warmup
-                continue
-            
-            # Get lookback window
-            window = normalized_atr.iloc[i - self.vol_length:i]
-            current_value = normalized_atr.iloc[i]
-            
-            # Count values <= current value
-            count_below = (window <= current_value).sum()
-            
-            # Calculate percentile: (count / window_size) * 100
-            percentile = (count_below / self.vol_length) * 100.0
-            percentiles.iloc[i] = percentile
+        # ATR normalized by price, ranked against its lookback window
+        atr = indicators.atr(high, low, close, self.atr_length)
+        normalized_atr = atr / close * 100
+        pct = indicators.rolling_rank(normalized_atr, self.vol_length)
+        
+        # Low volatility - faster EMAs, high volatility - slower EMAs, otherwise medium
+        is_low = pct < self.low_pct
+        is_high = pct >= self.high_pct
+        ema_fast = np.where(is_low, indicators.ema(close, self.fast_low),
+                            np.where(is_high, indicators.ema(close, self.fast_high), indicators.ema(close, self.fast_med)))
+        ema_slow = np.where(is_low, indicators.ema(close, self.slow_low),
+                            np.where(is_high, indicators.ema(close, self.slow_high), indicators.ema(close, self.slow_med)))
         
-        return percentiles
+        return {
+            'atr': atr,
+            'normalized_atr': normalized_atr,
+            'vol_percentile': pct,
+            'ema_fast': ema_fast,
+            'ema_slow': ema_slow,
+            'regime': np.where(is_low, 0, np.where(is_high, 2, 1)),
+            'signal': indicators.crossover_signals(ema_fast, ema_slow),
+        }
     
     def calculate_indicators(self, data: pd.DataFrame) -> pd.DataFrame:
         """
@@ -143,70 +135,40 @@ class AdaptiveEmaV1Strategy(BaseStrategy):
             data: DataFrame with OHLCV columns
             
         Returns:
-            DataFrame with indicators added
+            DataFrame with indicators and the crossover 'signal' added
         """
         df = data.copy()
-        
-        # Calculate ATR and normalize by price
-        atr = self.calculate_atr(df)
-        df['atr'] = atr
-        df['normalized_atr'] = (atr / df['close']) * 100
-        
-        # Calculate volatility percentile rank
-        df['vol_percentile'] = self.calculate_volatility_percentile(df['normalized_atr'])
-        
-        # Calculate all EMAs
-        ema_fast_low = self.calculate_ema(df['close'], self.fast_low)
-        ema_slow_low = self.calculate_ema(df['close'], self.slow_low)
-        ema_fast_med = self.calculate_ema(df['close'], self.fast_med)
-        ema_slow_med = self.calculate_ema(df['close'], self.slow_med)
-        ema_fast_high = self.calculate_ema(df['close'], self.fast_high)
-        ema_slow_high = self.calculate_ema(df['close'], self.slow_high)
-        
-        # Select EMAs based on volatility regime
-        ema_fast_values = []
-        ema_slow_values = []
-        regime_values = []
-        
-        for i in range(len(df)):
-            pct = df['vol_percentile'].iloc[i]
-            
-            if pct < self.low_pct:
-                # Low volatility - use faster EMAs
-                ema_fast_values.append(ema_fast_low.iloc[i])
-                ema_slow_values.append(ema_slow_low.iloc[i])
-                regime_values.append('low')
-            elif pct >= self.high_pct:
-                # High volatility - use slower EMAs
-                ema_fast_values.append(ema_fast_high.iloc[i])
-                ema_slow_values.append(ema_slow_high.iloc[i])
-                regime_values.append('high')
-            else:
-                # Medium volatility - use medium EMAs
-                ema_fast_values.append(ema_fast_med.iloc[i])
-                ema_slow_values.append(ema_slow_med.iloc[i])
-                regime_values.append('medium')
-        
-        df['ema_fast'] = ema_fast_values
-        df['ema_slow'] = ema_slow_values
-        df['volatility_regime'] = regime_values
+        values = self.compute_indicators(df['high'], df['low'], df['close'])
+        for name in ('atr', 'normalized_atr', 'vol_percentile', 'ema_fast', 'ema_slow'):
+            df[name] = values[name]
+        df['volatility_regime'] = self.REGIMES[values['regime']]
+        df['signal'] = values['signal']
         
         # Cache for use in generate_signals
         self.indicators_df = df
         
         return df
     
-    def generate_signals(self, data: pd.DataFrame, idx: int) -> str:
+    def batch_signals(self, bars: dict, index=None) -> np.ndarray:
+        """Signals for a batch of series in one vectorized pass"""
+        return self.compute_indicators(bars['high'], bars['low'], bars['close'])['signal']
+    
+    def generate_signals(self, data: pd.DataFrame, idx: int = None):
         """
-        Generate trading signal at specific index.
+        Generate trading signal at specific index, or for every bar.
         
         Args:
             data: DataFrame with indicators (from calculate_indicators)
-            idx: Index to check for signal
+            idx: Index to check for signal; when omitted, signals are
+                computed for all bars at once
             
         Returns:
-            'BUY', 'SELL', or None
+            'BUY', 'SELL', or None for a single index, otherwise a copy of the
+            indicators DataFrame with a 'signal' column (1 = BUY, -1 = SELL, 0)
         """
+        if idx is None:
+            return self.calculate_indicators(data)
+        
         # Use cached indicators if available, otherwise calculate
         if self.indicators_df is None:
             df = self.calculate_indicators(data)
@@ -237,6 +199,68 @@ class AdaptiveEmaV1Strategy(BaseStrategy):
         
         return None
     
+    def reset(self):
+        """Clear the incremental (update) state"""
+        self._atr = indicators.StreamingAtr(self.atr_length)
+        self._rank = indicators.StreamingRank(self.vol_length)
+        self._emas = {
+            name: indicators.StreamingEma(span) for name, span in (
+                ('fast_low', self.fast_low), ('slow_low', self.slow_low),
+                ('fast_med', self.fast_med), ('slow_med', self.slow_med),
+                ('fast_high', self.fast_high), ('slow_high', self.slow_high))
+        }
+        self._cross = indicators.StreamingCross()
+        self.last = None
+    
+    def update(self, bar) -> int:
+        """
+        Process one new bar incrementally
+        
+        O(1) per bar for the EMAs and ATR, O(volatility_length) for the
+        percentile ring buffer. Signals equal generate_signals on the same
+        bars.
+        
+        Args:
+            bar: Mapping with 'high', 'low' and 'close'
+            
+        Returns:
+            1 (BUY), -1 (SELL) or 0; the bar's indicators are kept in self.last
+        """
+        close = float(bar['close'])
+        atr = self._atr.update(float(bar['high']), float(bar['low']), close)
+        pct = self._rank.update(atr / close * 100)
+        emas = {name: ema.update(close) for name, ema in self._emas.items()}
+        
+        regime = 'low' if pct < self.low_pct else 'high' if pct >= self.high_pct else 'med'
+        fast, slow = emas[f"fast_{regime}"], emas[f"slow_{regime}"]
+        signal = self._cross.update(fast, slow)
+        
+        self.last = {'atr': atr, 'vol_percentile': pct, 'ema_fast': fast, 'ema_slow': slow, 'signal': signal}
+        return signal
+    
+    @classmethod
+    def warmup_for_params(cls, params: dict, tolerance: float = None) -> int:
+        """
+        Return the bars needed before the indicators are usable
+        
+        The slowest EMA must have its warmup, and the volatility percentile
+        needs a full window of normalized ATR values computed after the ATR's
+        warmup. One more bar is needed for the crossover to compare against.
+        In exact mode (tolerance=None) this is Pine Script's convention, not
+        convergence: an EMA still carries ~13.5% seed weight after its span.
+        
+        Args:
+            params: Complete parameter set (get_parameters() names)
+            tolerance: EMA convergence tolerance; None for exact (span bars)
+            
+        Returns:
+            Warmup in bars
+        """
+        spans = [params[f"{line}_length_{regime}"] for line in ('fast', 'slow') for regime in ('low', 'med', 'high')]
+        slowest = max(indicators.ema_lookback(span, tolerance) for span in spans)
+        percentile = indicators.ema_lookback(params['atr_length'], tolerance) + params['volatility_length']
+        return max(slowest, percentile) + 1
+    
     def get_strategy_name(self) -> str:
         """Return strategy name"""
         return f"Adaptive_EMA_v1_{self.fast_low}_{self.slow_low}_{self.fast_med}_{self.slow_med}_{self.fast_high}_{self.slow_high}"
@@ -0,0 +1,158 @@
+"""
+Base Strategy - Common interface for all backtesting strategies
+
+Strategies compute their indicators once per run (calculate_indicators) and
+then expose signals either per bar (generate_signals(data, idx) -> 'BUY' /
+'SELL' / None) or for the whole series at once (generate_signals(data) ->
+DataFrame with a 'signal' column of 1 / -1 / 0). batch_signals evaluates many
+series at once; strategies built on strategies.indicators override it with a
+single vectorized pass. update(bar) is the incremental path for live trading
+and replay: one bar in, one signal out. The default is a slow fallback that
+keeps the last get_warmup_period() + 1 bars and reruns generate_signals on
+them (O(warmup) per update); strategies with streaming indicators override
+reset and update with O(1) state.
+"""
+
+from abc import ABC, abstractmethod
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+
+class BaseStrategy(ABC):
+    """
+    Abstract base class for strategies
+
+    Subclasses hold their parameters as attributes and must implement
+    indicator calculation, signal generation and parameter reporting.
+    """
+
+    def __init__(self, initial_capital: float = 10000):
+        """
+        Initialize strategy
+
+        Args:
+            initial_capital: Starting capital for simulation
+        """
+        self.initial_capital = initial_capital
+        self._history = None
+
+    @abstractmethod
+    def calculate_indicators(self, data: pd.DataFrame) -> pd.DataFrame:
+        """Return a copy of data with all indicator columns added"""
+
+    @abstractmethod
+    def generate_signals(self, data: pd.DataFrame, idx: int = None):
+        """
+        Generate trading signals
+
+        Args:
+            data: DataFrame with OHLCV columns
+            idx: Bar index to check; when omitted, signals for every bar
+
+        Returns:
+            'BUY', 'SELL' or None for a single bar, or a DataFrame with a
+            'signal' column (1 = buy, -1 = sell, 0 = none) for all bars
+        """
+
+    @abstractmethod
+    def get_strategy_name(self) -> str:
+        """Return strategy name"""
+
+    @abstractmethod
+    def get_parameters(self) -> dict:
+        """Return current strategy parameters"""
+
+    def batch_signals(self, bars: dict, index=None) -> np.ndarray:
+        """
+        Generate signals for a batch of independent series
+
+        The default runs generate_signals once per column.
+
+        Args:
+            bars: Column name (open/high/low/close/volume) -> array of shape
+                  (bars, series)
+            index: Optional index for the per-series DataFrames
+
+        Returns:
+            int8 array (bars, series) of 1 / -1 / 0
+        """
+        close = np.asarray(bars['close'])
+        index = pd.RangeIndex(len(close)) if index is None else index
+        signals = np.zeros(close.shape, dtype=np.int8)
+        for j in range(close.shape[1]):
+            frame = pd.DataFrame({name: np.asarray(values)[:, j] for name, values in bars.items()}, index=index)
+            signals[:, j] = self.generate_signals(frame)['signal'].to_numpy()
+        return signals
+
+    def reset(self):
+        """Clear the incremental (update) state"""
+        self._history = deque(maxlen=self.get_warmup_period() + 1)
+
+    def update(self, bar) -> int:
+        """
+        Process one new bar incrementally
+
+        Slow fallback for strategies without streaming indicators: keeps the
+        last get_warmup_period() + 1 bars and reruns generate_signals on
+        them, so every update rebuilds a DataFrame and recomputes the
+        indicators over the whole window. Until the window is full the signal
+        equals the batch signal; after that, indicators that recurse over
+        all history (EMAs) restart at the window's first bar, so a signal can
+        differ from a full-history batch run by the seed weight the warmup
+        leaves (see get_warmup_period).
+
+        Args:
+            bar: Mapping with open/high/low/close/volume (and optionally
+                 timestamp) for the new bar
+
+        Returns:
+            1 (BUY), -1 (SELL) or 0, the batch signal of the window's last bar
+        """
+        if self._history is None:
+            self.reset()
+        self._history.append(bar)
+        frame = pd.DataFrame.from_records(list(self._history))
+        if 'timestamp' in frame.columns:
+            frame = frame.set_index('timestamp')
+        return int(self.generate_signals(frame)['signal'].iloc[-1])
+
+    @classmethod
+    def warmup_for_params(cls, params: dict, tolerance: float = None) -> int:
+        """
+        Return the warmup for a parameter set without constructing a strategy
+
+        Must not decrease when any length parameter grows, so the top of each
+        search range bounds a whole search (utils.warmup.search_warmup), even
+        when that combination is not itself a valid parameter set.
+
+        Args:
+            params: Complete parameter set, as returned by get_parameters()
+            tolerance: EMA convergence tolerance (see utils.warmup); None for
+                       the exact window-length convention
+
+        Returns:
+            Warmup in bars (0 for strategies without lookback)
+        """
+        return 0
+
+    def get_warmup_period(self, tolerance: float = None) -> int:
+        """
+        Return the bars of history needed before signals are meaningful
+
+        Args:
+            tolerance: EMA convergence tolerance (see utils.warmup); None for
+                       the exact window-length convention
+
+        Returns:
+            Warmup in bars
+        """
+        return self.warmup_for_params(self.get_parameters(), tolerance)
+
+    def get_strategy_info(self) -> dict:
+        """Return strategy information for display"""
+        return {
+            'name': self.get_strategy_name(),
+            'parameters': self.get_parameters()
+        }
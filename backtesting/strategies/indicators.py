@@ -0,0 +1,231 @@
+"""
+Indicators - Shared vectorized indicator library for all strategies
+
+Every function takes array-likes (Series or ndarrays) of shape (bars,) or
+(bars, columns) and returns an ndarray of the same shape. Columns are
+independent series (assets, bootstrap paths, parameter sets), so a strategy
+built on these functions evaluates a whole batch in one call.
+
+Conventions match Pine Script and the OpenCL kernels:
+- ema: seeded with the first value (pandas ewm adjust=False)
+- true_range: high - low on the first bar
+- rolling_rank: share of the previous `window` values <= the current value
+- ema_lookback: first usable bar of an EMA, exact (span bars) or within a
+  seed-weight tolerance (the warmup modes described in utils.warmup)
+
+The Streaming* classes compute the same indicators one bar at a time in O(1)
+per update (O(window) for the rank), for live trading and replay. They use
+the same floating-point recursion as pandas, so streamed values equal the
+batch values exactly.
+"""
+
+import math
+
+import numpy as np
+import pandas as pd
+
+
+# Elements compared per block in rolling_rank, to bound memory on long histories
+RANK_BLOCK_ELEMENTS = 1 << 22
+
+
+def _shift(arr: np.ndarray) -> np.ndarray:
+    """Shift along the bar axis by one bar (first bar repeats itself)"""
+    prev = np.empty_like(arr)
+    prev[1:] = arr[:-1]
+    prev[:1] = arr[:1]
+    return prev
+
+
+def ema(values, span: float) -> np.ndarray:
+    """
+    Exponential moving average, alpha = 2 / (span + 1)
+
+    Args:
+        values: Series or array (bars,) or (bars, columns)
+        span: EMA span
+
+    Returns:
+        Array of EMA values, same shape as values
+    """
+    arr = np.asarray(values, dtype=float)
+    out = pd.DataFrame(arr.reshape(len(arr), -1)).ewm(span=span, adjust=False).mean().to_numpy()
+    return out.reshape(arr.shape)
+
+
+def ema_lookback(span: float, tolerance: float = None) -> int:
+    """
+    Return the bar index from which an EMA seeded at bar 0 is used
+
+    Args:
+        span: EMA span (alpha = 2 / (span + 1))
+        tolerance: Maximum remaining seed weight; None for the exact
+                   span-length convention (seed weight ~13.5% remains)
+
+    Returns:
+        Zero-based index of the first usable EMA value
+    """
+    if tolerance is None:
+        return max(int(math.ceil(span)) - 1, 0)
+    if not 0 < tolerance < 1:
+        raise ValueError(f"tolerance must be in (0, 1), got {tolerance}")
+    alpha = 2.0 / (span + 1.0)
+    if alpha >= 1:
+        return 0
+    return int(math.ceil(math.log(tolerance) / math.log(1.0 - alpha)))
+
+
+def true_range(high, low, close) -> np.ndarray:
+    """
+    True range: max(high - low, |high - prev close|, |low - prev close|)
+
+    The first bar has no previous close and uses high - low.
+    """
+    high = np.asarray(high, dtype=float)
+    low = np.asarray(low, dtype=float)
+    prev_close = _shift(np.asarray(close, dtype=float))
+    tr = np.fmax(high - low, np.fmax(np.abs(high - prev_close), np.abs(low - prev_close)))
+    tr[:1] = high[:1] - low[:1]
+    return tr
+
+
+def atr(high, low, close, length: float) -> np.ndarray:
+    """Average true range: EMA of the true range"""
+    return ema(true_range(high, low, close), length)
+
+
+def rolling_rank(values, window: int, fill: float = 50.0) -> np.ndarray:
+    """
+    Percentile rank of each value against the previous `window` values
+
+    For bar i, counts the values in [i - window, i) that are <= values[i]
+    and returns count / window * 100. Bars without a full window get `fill`.
+
+    Args:
+        values: Series or array (bars,) or (bars, columns)
+        window: Lookback length
+        fill: Value for bars before the first full window
+
+    Returns:
+        Array of ranks (0-100), same shape as values
+    """
+    arr = np.asarray(values, dtype=float)
+    flat = arr.reshape(len(arr), -1)
+    ranks = np.full(flat.shape, float(fill))
+
+    if len(flat) > window:
+        windows = np.lib.stride_tricks.sliding_window_view(flat[:-1], window, axis=0)
+        current = flat[window:]
+        block = max(1, RANK_BLOCK_ELEMENTS // (window * flat.shape[1]))
+        for start in range(0, len(current), block):
+            stop = start + block
+            count_below = (windows[start:stop] <= current[start:stop, :, None]).sum(axis=2)
+            ranks[window + start:window + stop] = count_below / window * 100.0
+
+    return ranks.reshape(arr.shape)
+
+
+def crossover(a, b) -> np.ndarray:
+    """True where a crosses above b (a <= b on the previous bar, a > b now)"""
+    a = np.asarray(a, dtype=float)
+    b = np.asarray(b, dtype=float)
+    crossed = (_shift(a) <= _shift(b)) & (a > b)
+    crossed[:1] = False
+    return crossed
+
+
+def crossunder(a, b) -> np.ndarray:
+    """True where a crosses below b (a >= b on the previous bar, a < b now)"""
+    a = np.asarray(a, dtype=float)
+    b = np.asarray(b, dtype=float)
+    crossed = (_shift(a) >= _shift(b)) & (a < b)
+    crossed[:1] = False
+    return crossed
+
+
+def crossover_signals(fast, slow) -> np.ndarray:
+    """
+    BUY/SELL signals from two lines
+
+    Returns:
+        int8 array of 1 (fast crosses above slow), -1 (crosses below) or 0
+    """
+    signals = np.zeros(np.shape(fast), dtype=np.int8)
+    signals[crossover(fast, slow)] = 1
+    signals[crossunder(fast, slow)] = -1
+    return signals
+
+
+class StreamingEma:
+    """Incremental EMA with the same arithmetic as pandas ewm(span, adjust=False)"""
+
+    def __init__(self, span: float):
+        com = (span - 1) / 2.0
+        self.alpha = 1.0 / (1.0 + com)
+        self.decay = 1.0 - self.alpha
+        self.value = None
+
+    def update(self, x: float) -> float:
+        """Add one value and return the EMA"""
+        if self.value is None:
+            self.value = x
+        elif self.value != x:
+            self.value = (self.decay * self.value + self.alpha * x) / (self.decay + self.alpha)
+        return self.value
+
+
+class StreamingAtr:
+    """Incremental average true range (EMA of the true range)"""
+
+    def __init__(self, length: float):
+        self.ema = StreamingEma(length)
+        self.prev_close = None
+        self.value = None
+
+    def update(self, high: float, low: float, close: float) -> float:
+        """Add one bar and return the ATR"""
+        tr = high - low
+        if self.prev_close is not None:
+            tr = max(tr, abs(high - self.prev_close), abs(low - self.prev_close))
+        self.prev_close = close
+        self.value = self.ema.update(tr)
+        return self.value
+
+
+class StreamingRank:
+    """Incremental rolling_rank over a ring buffer of the previous `window` values"""
+
+    def __init__(self, window: int, fill: float = 50.0):
+        self.window = window
+        self.fill = fill
+        self.buffer = np.empty(window)
+        self.count = 0
+
+    def update(self, x: float) -> float:
+        """Add one value and return its rank against the previous window"""
+        if self.count >= self.window:
+            rank = np.count_nonzero(self.buffer <= x) / self.window * 100.0
+        else:
+            rank = self.fill
+        self.buffer[self.count % self.window] = x
+        self.count += 1
+        return rank
+
+
+class StreamingCross:
+    """Incremental crossover_signals"""
+
+    def __init__(self):
+        self.prev = None
+
+    def update(self, fast: float, slow: float) -> int:
+        """Add one bar of both lines and return 1 (cross above), -1 (below) or 0"""
+        signal = 0
+        if self.prev is not None:
+            prev_fast, prev_slow = self.prev
+            if prev_fast <= prev_slow and fast > slow:
+                signal = 1
+            elif prev_fast >= prev_slow and fast < slow:
+                signal = -1
+        self.prev = (fast, slow)
+        return signal
@@ -0,0 +1,122 @@
+"""
+Strategy Registry - Look up strategies and their interval configurations by name
+
+Strategies register their class with @register_strategy('<name>'), where the
+name is the strategy package under strategies/ (and under opencl/strategies/).
+Each interval is a subpackage (e.g. strategies/<name>/1h) defining
+DEFAULT_PARAMS and create_strategy = StrategyFactory(StrategyClass, DEFAULT_PARAMS).
+
+    from strategies import get_strategy_factory
+    create_strategy = get_strategy_factory('adaptive_ema_v1', '1h')
+    strategy = create_strategy({'atr_length': 10})
+"""
+
+import importlib
+import pkgutil
+from pathlib import Path
+
+
+_REGISTRY = {}
+
+
+def register_strategy(name: str):
+    """
+    Class decorator registering a strategy under a name
+
+    Args:
+        name: Strategy name, the same as its package directory
+    """
+    def decorator(cls):
+        existing = _REGISTRY.get(name)
+        if existing is not None and existing is not cls:
+            raise ValueError(f"Strategy {name} is already registered to {existing.__name__}")
+        cls.strategy_name = name
+        _REGISTRY[name] = cls
+        return cls
+    return decorator
+
+
+class StrategyFactory:
+    """
+    Create strategy instances with interval default parameters
+
+    Calling the factory merges the given parameters over the defaults and
+    rejects parameter names the defaults do not define, so a misspelled or
+    foreign name (e.g. an OpenCL results key) cannot silently fall back to a
+    default. Constructor settings that are not strategy parameters
+    (CONSTRUCTOR_PARAMS, e.g. initial_capital) are passed through. Factories
+    are plain objects (not closures), so they can be sent to worker processes.
+    """
+
+    # Settings every strategy constructor accepts besides its parameters
+    CONSTRUCTOR_PARAMS = ('initial_capital',)
+
+    def __init__(self, strategy_class, default_params: dict):
+        self.strategy_class = strategy_class
+        self.default_params = dict(default_params)
+
+    def __call__(self, params: dict = None):
+        merged = dict(self.default_params)
+        if params:
+            unknown = sorted(set(params) - set(merged) - set(self.CONSTRUCTOR_PARAMS))
+            if unknown:
+                raise ValueError(f"Unknown parameters for {self.strategy_class.__name__}: {', '.join(unknown)} "
+                                 f"(valid: {', '.join(sorted(merged))})")
+            merged.update(params)
+        return self.strategy_class(merged)
+
+    def __repr__(self) -> str:
+        return f"StrategyFactory({self.strategy_class.__name__})"
+
+
+def discover_strategies() -> list:
+    """Import every strategy package so its @register_strategy runs; return the names"""
+    for module in pkgutil.iter_modules([str(Path(__file__).parent)]):
+        if module.ispkg:
+            importlib.import_module(f"{__package__}.{module.name}")
+    return sorted(_REGISTRY)
+
+
+def list_strategies() -> list:
+    """Return the names of all available strategies"""
+    return discover_strategies()
+
+
+def get_strategy(name: str):
+    """
+    Return a registered strategy class
+
+    Raises:
+        ValueError: Unknown strategy
+    """
+    if name not in _REGISTRY:
+        discover_strategies()
+    if name not in _REGISTRY:
+        raise ValueError(f"Unknown strategy: {name} (available: {', '.join(sorted(_REGISTRY)) or 'none'})")
+    return _REGISTRY[name]
+
+
+def strategy_intervals(name: str) -> list:
+    """Return the intervals a strategy has configurations for"""
+    package = importlib.import_module(get_strategy(name).__module__.rsplit('.', 1)[0])
+    return sorted(m.name for m in pkgutil.iter_modules(package.__path__) if m.ispkg)
+
+
+def get_strategy_factory(name: str, interval: str) -> StrategyFactory:
+    """
+    Return the create_strategy factory for a strategy and interval
+
+    Raises:
+        ValueError: Unknown strategy or no configuration for the interval
+    """
+    cls = get_strategy(name)
+    package = cls.__module__.rsplit('.', 1)[0]
+    if interval not in strategy_intervals(name):
+        raise ValueError(f"No {interval} configuration for {name} "
+                         f"(available: {', '.join(strategy_intervals(name))})")
+    return importlib.import_module(f"{package}.{interval}").create_strategy
+
+
+def make_strategy(name: str, interval: str, params: dict = None):
+    """Create a strategy instance by name with interval defaults and overrides"""
+    return get_strategy_factory(name, interval)(params)
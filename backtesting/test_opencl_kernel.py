@@ -0,0 +1,97 @@
+"""
+Test OpenCL Kernel Conformance
+
+Verifies kernel.cl (via its NumPy emulation, and on a real OpenCL device when
+pyopencl is available) matches the Python strategy bar for bar
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from strategies import get_strategy_factory
+from utils.opencl_kernel import (
+    MAX_VOL_LENGTH, PARAM_ORDER, RESULT_FIELDS, compare_traces, emulate_kernel,
+    list_opencl_devices, params_to_array, reference_trace, run_opencl_kernel,
+)
+
+
+create_strategy = get_strategy_factory('adaptive_ema_v1', '1h')
+
+CANDIDATES = [
+    create_strategy({}).get_parameters(),
+    {'fast_length_low': 8, 'slow_length_low': 74, 'fast_length_med': 18, 'slow_length_med': 106,
+     'fast_length_high': 35, 'slow_length_high': 120, 'atr_length': 6, 'volatility_length': 61,
+     'low_vol_percentile': 15, 'high_vol_percentile': 67},
+    {'fast_length_low': 5, 'slow_length_low': 20, 'fast_length_med': 9, 'slow_length_med': 30,
+     'fast_length_high': 12, 'slow_length_high': 40, 'atr_length': 10, 'volatility_length': 20,
+     'low_vol_percentile': 30, 'high_vol_percentile': 60},
+]
+
+
+def _stack(traces: list) -> dict:
+    """Stack single-combination reference traces column-wise"""
+    return {k: np.concatenate([t[k] for t in traces], axis=-1) for k in traces[0]}
+
+
+@pytest.mark.parametrize('warmup', [0, 50])
+def test_emulation_matches_strategy(warmup, sample_data):
+    """float64 emulation reproduces the Python strategy exactly, float32 closely"""
+    data = sample_data(600, seed=7, clustered=True)
+    prices = (data['close'], data['high'], data['low'])
+    reference = _stack([reference_trace(data, create_strategy, c, warmup=warmup) for c in CANDIDATES])
+
+    exact = emulate_kernel(*prices, params_to_array(CANDIDATES), warmup=warmup, dtype=np.float64, trace=True)
+    for name, r in compare_traces(reference, exact).items():
+        assert r['mismatches'] == 0, name
+    for name in RESULT_FIELDS:
+        assert np.allclose(exact[name], reference[name], rtol=1e-9, atol=1e-9), name
+
+    device = emulate_kernel(*prices, params_to_array(CANDIDATES), warmup=warmup, trace=True)
+    assert compare_traces(reference, device, rtol=1e-5, atol=1e-3)['signal']['mismatches'] == 0
+    assert np.array_equal(device['total_trades'], reference['total_trades'])
+
+
+def test_volatility_length_boundary(sample_data):
+    """The largest window the kernel holds still conforms; a larger one is rejected, not capped"""
+    data = sample_data(600, seed=7, clustered=True)
+    prices = (data['close'], data['high'], data['low'])
+    widest = dict(CANDIDATES[2], volatility_length=MAX_VOL_LENGTH)
+    reference = reference_trace(data, create_strategy, widest)
+    exact = emulate_kernel(*prices, params_to_array([widest]), dtype=np.float64, trace=True)
+    for name, r in compare_traces(reference, exact).items():
+        assert r['mismatches'] == 0, name
+    devices = list_opencl_devices()
+    if devices:
+        device = run_opencl_kernel(*prices, params_to_array([widest]), device=devices[0][2], trace=True)
+        assert compare_traces(reference, device, rtol=1e-5, atol=1e-3)['signal']['mismatches'] == 0
+
+    with pytest.raises(ValueError, match='volatility_length'):
+        params_to_array([dict(widest, volatility_length=MAX_VOL_LENGTH + 1)])
+    packed = params_to_array(CANDIDATES)
+    packed[1, PARAM_ORDER.index('volatility_length')] = MAX_VOL_LENGTH + 1
+    with pytest.raises(ValueError, match='combination 1'):
+        emulate_kernel(*prices, packed)
+
+
+def test_opencl_device_matches_emulation(sample_data):
+    """kernel.cl on a real OpenCL device matches the float32 emulation"""
+    pytest.importorskip('pyopencl')
+    devices = list_opencl_devices()
+    if not devices:
+        pytest.skip('No OpenCL device available')
+
+    data = sample_data(600, seed=7, clustered=True)
+    prices = (data['close'], data['high'], data['low'])
+    packed = params_to_array(CANDIDATES)
+    emulated = emulate_kernel(*prices, packed, warmup=50, trace=True)
+    device = run_opencl_kernel(*prices, packed, warmup=50, device=devices[0][2], trace=True)
+
+    assert compare_traces(emulated, device, rtol=1e-5, atol=1e-3)['signal']['mismatches'] == 0
+    assert np.array_equal(device['total_trades'], emulated['total_trades'])
+    for name in ('total_return', 'max_drawdown'):
+        assert np.allclose(device[name], emulated[name], rtol=1e-4, atol=1e-3), name
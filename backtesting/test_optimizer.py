@@ -0,0 +1,125 @@
+"""
+Test Optimizer and Result Cache
+
+Verifies the vectorized simulator against a per-bar loop, and that overlapping
+sweeps only evaluate new candidates
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from optimizer import optimize
+from strategies import get_strategy_factory, indicators
+from utils.result_cache import ResultCache, strategy_modules
+from utils.simulator import simulate
+
+
+def test_simulate_matches_loop(sample_data):
+    """Vectorized simulation matches the all-in per-bar loop"""
+    data = sample_data(400, seed=42, drift=0.0005)
+    rng = np.random.default_rng(0)
+    signals = rng.choice([0, 0, 0, 1, -1], size=len(data))
+
+    capital, shares = 10000.0, 0.0
+    for signal, price in zip(signals, data['close']):
+        if signal == 1 and shares == 0:
+            shares, capital = capital / price, 0.0
+        elif signal == -1 and shares > 0:
+            capital, shares = shares * price, 0.0
+    final = capital + shares * data['close'].iloc[-1]
+
+    result = simulate(data, signals, initial_capital=10000.0)
+    assert np.isclose(result['total_return'], (final / 10000.0 - 1) * 100)
+
+
+def test_costs_and_next_open_fill_match_loop(sample_data):
+    """Commission, slippage and next-bar-open fills match a per-bar loop"""
+    data = sample_data(400, seed=42, drift=0.0005)
+    rng = np.random.default_rng(1)
+    signals = rng.choice([0, 0, 0, 1, -1], size=len(data))
+    cost = (1.0 + 4.0) / 10000.0
+
+    capital, shares, pending = 10000.0, 0.0, 0
+    for i, (open_price, signal) in enumerate(zip(data['open'], signals)):
+        if pending == 1 and shares == 0:
+            shares, capital = capital * (1 - cost) / open_price, 0.0
+        elif pending == -1 and shares > 0:
+            capital, shares = shares * open_price * (1 - cost), 0.0
+        pending = signal
+    final = capital + shares * data['close'].iloc[-1]
+
+    result = simulate(data, signals, commission_bps=1.0, slippage_bps=4.0, fill='next_open')
+    assert np.isclose(result['total_return'], (final / 10000.0 - 1) * 100)
+
+    no_cost = simulate(data, signals)
+    assert simulate(data, signals, commission_bps=0.0, fill='close') == no_cost
+    assert simulate(data, signals, commission_bps=5.0)['total_return'] < no_cost['total_return']
+
+
+def test_fractional_size_pays_rebalancing(sample_data):
+    """A fractional position is rebalanced every bar and pays for those trades"""
+    data = sample_data(400, seed=42, drift=0.0005)
+    rng = np.random.default_rng(1)
+    signals = rng.choice([0, 0, 0, 1, -1], size=len(data))
+    cost = 5.0 / 10000.0
+    close = data['close'].to_numpy()
+    position = simulate(data, signals, include_equity=True)['position'].to_numpy()
+
+    capital, shares, round_trips = 10000.0, 0.0, 1.0
+    for i, price in enumerate(close):
+        value = capital + shares * price
+        target = 0.5 * position[i]
+        value *= 1 - abs(target - shares * price / value) * cost
+        round_trips *= 1 - abs(position[i] - (position[i - 1] if i else 0.0)) * 0.5 * cost
+        shares, capital = target * value / price, value * (1 - target)
+    final = capital + shares * close[-1]
+
+    result = simulate(data, signals, commission_bps=5.0, position_size=0.5)
+    assert np.isclose(result['total_return'], (final / 10000.0 - 1) * 100)
+    cost_free = simulate(data, signals, position_size=0.5)['total_return']
+    assert (final / 10000.0 - 1) * 100 < ((1 + cost_free / 100) * round_trips - 1) * 100
+
+
+def test_overlapping_sweeps_hit_cache(tmp_path, sample_data):
+    """Re-running an overlapping sweep only evaluates the new points"""
+    data = sample_data(400, seed=42, drift=0.0005)
+    create_strategy = get_strategy_factory('adaptive_ema_v1', '1h')
+    first = [{'fast_length_low': f} for f in (10, 11, 12)]
+    second = [{'fast_length_low': f} for f in (11, 12, 13, 14)]
+
+    with ResultCache(tmp_path / 'cache.db') as cache:
+        cold = optimize(create_strategy, data, first, min_trades=0, cache=cache)
+        assert (cache.hits, cache.misses) == (0, 3)
+
+        optimize(create_strategy, data, second, min_trades=0, cache=cache)
+        assert (cache.hits, cache.misses) == (2, 5)
+
+    with ResultCache(tmp_path / 'cache.db') as cache:
+        warm = optimize(create_strategy, data, first, min_trades=0, cache=cache)
+        assert cache.hit_rate == 1.0
+        assert warm == cold
+
+
+def test_strategy_version_covers_dependencies():
+    """Editing a base class, shared indicator or the simulator changes the version"""
+    strategy = get_strategy_factory('adaptive_ema_v1', '1h')({})
+    names = [m.__name__ for m in strategy_modules(strategy)]
+    assert names[0] == type(strategy).__module__
+    assert {indicators.__name__, 'strategies.base_strategy', 'utils.simulator'} <= set(names)
+
+
+def test_cache_eviction(tmp_path):
+    """The cache stays within max_entries, evicting least recently used first"""
+    with ResultCache(tmp_path / 'cache.db', max_entries=3) as cache:
+        for key in 'abc':
+            cache.put(key, {'value': key})
+        cache.get('a')
+        cache.put('d', {'value': 'd'})
+
+        assert len(cache) == 3
+        assert cache.get('b') is None
+        assert cache.get('a') == {'value': 'a'}
@@ -0,0 +1,86 @@
+"""
+Test Portfolio Backtest
+
+Verifies the matrix-based portfolio engine against the single-symbol simulator
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from strategies import get_strategy_factory
+from utils.portfolio import align_bars, backtest_portfolio
+from utils.simulator import simulate
+
+
+create_strategy = get_strategy_factory('adaptive_ema_v1', '1h')
+
+
+def test_single_asset_matches_simulator(sample_data):
+    """A one-symbol portfolio reproduces the single-symbol simulation"""
+    data = sample_data(500, seed=3)
+    expected = simulate(data, create_strategy({}).generate_signals(data)['signal'])
+
+    result = backtest_portfolio({'QQQ': data}, lambda s: create_strategy({}), allocation='active')
+    for key in ('total_return', 'max_drawdown', 'total_trades', 'buy_hold_return'):
+        assert np.isclose(result[key], expected[key])
+
+
+def test_equal_weight_splits_capital(sample_data):
+    """Equal weighting of two symbols averages their returns bar by bar"""
+    a, b = sample_data(500, seed=1), sample_data(500, seed=2)
+    result = backtest_portfolio({'A': a, 'B': b}, lambda s: create_strategy({}), allocation='equal')
+
+    ra = simulate(a, create_strategy({}).generate_signals(a)['signal'], include_equity=True)['equity']
+    rb = simulate(b, create_strategy({}).generate_signals(b)['signal'], include_equity=True)['equity']
+    expected = 1 + (ra.pct_change().fillna(0) + rb.pct_change().fillna(0)) / 2
+    assert np.allclose(result['equity'].to_numpy(), 10000 * expected.cumprod().to_numpy())
+    assert (result['weights'].sum(axis=1) <= 1 + 1e-12).all()
+
+
+def test_ended_symbol_is_closed_out(sample_data):
+    """A symbol whose data ends holds no position or weight afterwards"""
+    # B is long on its last bar
+    a, b = sample_data(1500, seed=1), sample_data(600, seed=3)
+    result = backtest_portfolio({'A': a, 'B': b}, lambda s: create_strategy({}), allocation='active')
+
+    weights = result['weights']
+    assert weights['B'].iloc[599] > 0
+    assert (weights['B'].iloc[600:] == 0).all()
+    assert ((weights['A'].iloc[601:] == 0) | (weights['A'].iloc[601:] == 1)).all()
+
+
+def test_late_symbol_gets_own_warmup(sample_data):
+    """A symbol listed later skips its first warmup bars, not the panel's"""
+    # Without a warmup B would be long during its first 120 bars
+    a, b = sample_data(600, seed=1), sample_data(300, seed=4, start='2024-01-13 12:00')
+    result = backtest_portfolio({'A': a, 'B': b}, lambda s: create_strategy({}), allocation='active', warmup=120)
+
+    expected = simulate(b, create_strategy({}).generate_signals(b)['signal'], warmup=120, include_equity=True)
+    assert expected['position'].iloc[:120].sum() == 0
+    assert np.array_equal(result['weights']['B'].iloc[300:].to_numpy() > 0, expected['position'].to_numpy() > 0)
+
+
+def test_align_bars_fills_gaps(sample_data):
+    """Symbols with missing or later bars are aligned on the union index"""
+    a = sample_data(100, seed=1)
+    b = sample_data(50, seed=2, start='2024-01-02').drop(index=[pd.Timestamp('2024-01-02 05:00')])
+    panels = align_bars({'A': a, 'B': b})
+
+    assert panels['close'].shape == (100, 2)
+    assert not panels['tradable']['B'].iloc[:24].any()
+    assert not panels['tradable'].loc['2024-01-02 05:00', 'B']
+    assert panels['close'].loc['2024-01-02 05:00', 'B'] == b['close'].loc['2024-01-02 04:00']
+
+
+def test_many_assets(sample_data):
+    """Hundreds of symbols run through the same matrix path"""
+    bars = {f"S{i}": sample_data(300, seed=i) for i in range(200)}
+    result = backtest_portfolio(bars, lambda s: create_strategy({}), allocation='inverse_vol', max_weight=0.05)
+    assert result['weights'].shape == (300, 200)
+    assert result['weights'].to_numpy().max() <= 0.05
+    assert result['drawdown'].max() <= 0
@@ -0,0 +1,70 @@
+"""
+Test Streaming HTML Report
+
+Verifies min/max decimation bounds and that large trade logs render paginated
+"""
+
+import json
+import re
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from utils.report import MinMaxDecimator, render_html
+
+
+def test_decimator_bounds_and_extremes():
+    """Decimated output stays bounded and keeps the global extremes"""
+    rng = np.random.default_rng(0)
+    y = np.cumsum(rng.normal(size=200_000))
+    x = np.arange(len(y))
+
+    dec = MinMaxDecimator(max_points=500)
+    for start in range(0, len(y), 7_777):
+        dec.add(x[start:start + 7_777], y[start:start + 7_777])
+
+    px, py = dec.points()
+    assert len(px) <= 502
+    assert np.all(np.diff(px) > 0)
+    assert py.max() == y.max()
+    assert py.min() == y.min()
+
+
+def test_report_paginates_large_trade_log(tmp_path):
+    """Thousands of trades produce paginated, bounded chart output"""
+    n_bars = 50_000
+    rng = np.random.default_rng(1)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.001, n_bars)))
+    prices = tmp_path / 'prices.csv'
+    pd.DataFrame({
+        'Timestamp': 1_600_000_000 + 3600 * np.arange(n_bars),
+        'Open': close, 'High': close, 'Low': close, 'Close': close, 'Volume': 1.0,
+    }).to_csv(prices, index=False)
+
+    trades = []
+    for k, idx in enumerate(range(10, n_bars - 10, 20)):
+        action = 'BUY' if k % 2 == 0 else 'SELL'
+        trade = {'trade_number': k + 1, 'action': action, 'price': float(close[idx]),
+                 'date': '2020-01-01 00:00:00', 'candle_index': idx}
+        if action == 'SELL':
+            trade['pnl_percent'] = 0.1
+        trades.append(trade)
+
+    result = {'ticker': 'QQQ', 'interval': '1h', 'strategy': 'adaptive_ema_v1',
+              'timestamp': '20250101_000000', 'candles': n_bars,
+              'performance': {'total_return': 1.0}, 'parameters': {'fast_low': 8},
+              'trades': trades}
+
+    path = render_html(result, tmp_path / 'report.html', prices=prices,
+                       max_points=1000, page_size=100)
+    text = Path(path).read_text()
+
+    assert text.count('class="trade-page"') == -(-len(trades) // 100)
+    chart = json.loads(re.search(r'id="chartData">(.*?)</script>', text).group(1))
+    assert len(chart['price']) <= 1002
+    assert len(chart['equity']) <= 1002
+    assert len(chart['trades']) <= 1000
@@ -0,0 +1,164 @@
+"""
+Test Result Store
+
+Verifies import of optimizer JSON results, idempotent appends and indexed queries
+"""
+
+import json
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from strategies import get_strategy_factory
+from utils.data_loader import dataset_fingerprint, load_data, save_data
+from utils.result_store import ResultStore, check_run_matches, param_hash
+from utils.report import locate_run, render_html
+from utils.simulator import simulate, trade_log
+
+
+RESULTS_DIR = Path(__file__).parent.parent / 'opencl' / 'strategies'
+PRICES = Path(__file__).parent.parent / 'opencl' / 'data' / 'qqq_1h.csv'
+
+
+def _run(ticker: str, calmar: float, timestamp: str, fast_low: int = 8) -> dict:
+    """Build a minimal run in the optimizer JSON format"""
+    return {
+        'ticker': ticker,
+        'interval': '1h',
+        'strategy': 'adaptive_ema_v1',
+        'timestamp': timestamp,
+        'candles': 446,
+        'performance': {'total_return': 1.0, 'max_drawdown': 2.0, 'calmar_ratio': calmar,
+                        'sharpe_ratio': 0.5, 'total_trades': 3, 'buy_hold_return': 0.5,
+                        'outperformance': 0.5},
+        'parameters': {'fast_low': float(fast_low), 'slow_low': 74.0},
+        'trades': [],
+    }
+
+
+def test_import_existing_results(tmp_path):
+    """Existing optimizer JSON files import once and round-trip"""
+    store = ResultStore(tmp_path / 'results.db')
+    imported = store.import_results_dir(RESULTS_DIR)
+    assert imported == 2
+    assert store.import_results_dir(RESULTS_DIR) == 0
+    assert store.count() == 2
+
+    run = store.query(ticker='qqq')[0]
+    with open(RESULTS_DIR / 'adaptive_ema_v1/results/qqq/1h/20251123_142917_QQQ_1h.json') as f:
+        original = json.load(f)
+    assert run['performance'] == original['performance']
+    assert run['trades'] == original['trades']
+
+    report = render_html(run, tmp_path / 'report.html')
+    assert 'QQQ 1h Strategy Results' in Path(report).read_text()
+
+
+def test_best_runs_per_ticker(tmp_path):
+    """Best Calmar per ticker honours the time window"""
+    now = datetime.now()
+    recent = (now - timedelta(days=1)).strftime('%Y%m%d_%H%M%S')
+    old = (now - timedelta(days=30)).strftime('%Y%m%d_%H%M%S')
+
+    store = ResultStore(tmp_path / 'results.db')
+    store.add_run(_run('QQQ', 1.5, recent, fast_low=8))
+    store.add_run(_run('QQQ', 0.5, recent, fast_low=9))
+    store.add_run(_run('QQQ', 9.0, old, fast_low=10))
+    store.add_run(_run('SPY', 0.7, recent))
+
+    best = store.best_runs('calmar_ratio', since=now - timedelta(days=7))
+    assert [(r['ticker'], r['performance']['calmar_ratio']) for r in best] == [('QQQ', 1.5), ('SPY', 0.7)]
+
+    best_all = store.best_runs('calmar_ratio')
+    assert best_all[0]['performance']['calmar_ratio'] == 9.0
+
+    # A run without the metric is never ranked best
+    missing = _run('IWM', 0.0, recent)
+    missing['performance'] = {'total_return': 1.0}
+    store.add_run(missing)
+    assert [r['ticker'] for r in store.best_runs('max_drawdown')] == ['QQQ', 'SPY']
+
+
+def test_runs_with_parameters(tmp_path):
+    """Parameter lookups ignore key order and int/float formatting"""
+    store = ResultStore(tmp_path / 'results.db')
+    store.add_run(_run('QQQ', 1.0, '20250101_000000'))
+    store.add_run(_run('SPY', 1.0, '20250101_000000'))
+    store.add_run(_run('SPY', 1.0, '20250102_000000', fast_low=12))
+
+    assert param_hash({'slow_low': 74, 'fast_low': 8}) == param_hash({'fast_low': 8.0, 'slow_low': 74.0})
+    runs = store.runs_with_parameters({'slow_low': 74, 'fast_low': 8})
+    assert sorted(r['ticker'] for r in runs) == ['QQQ', 'SPY']
+
+
+def test_opencl_and_python_names_match(tmp_path):
+    """OpenCL and strategy parameter names hash and store the same"""
+    assert param_hash({'fast_low': 8, 'slow_low': 74}) == param_hash({'fast_length_low': 8, 'slow_length_low': 74})
+
+    store = ResultStore(tmp_path / 'results.db')
+    store.add_run(_run('QQQ', 1.0, '20250101_000000'))
+    python_run = _run('SPY', 1.0, '20250101_000000')
+    python_run['parameters'] = {'fast_length_low': 8, 'slow_length_low': 74}
+    store.add_run(python_run)
+
+    runs = store.runs_with_parameters({'fast_low': 8, 'slow_low': 74})
+    assert sorted(r['ticker'] for r in runs) == ['QQQ', 'SPY']
+    assert all(r['parameters'] == {'fast_length_low': 8, 'slow_length_low': 74} for r in runs)
+
+    run = next(r for r in runs if r['ticker'] == 'QQQ')
+    check_run_matches(run, 'qqq', '1H', 'adaptive_ema_v1')
+    with pytest.raises(ValueError, match='not SPY 1h'):
+        check_run_matches(run, 'SPY', '1h', 'adaptive_ema_v1')
+
+
+def test_legacy_parameter_names_migrated(tmp_path):
+    """Runs stored under OpenCL names by older versions are rewritten on open"""
+    path = tmp_path / 'results.db'
+    store = ResultStore(path)
+    store.add_run(_run('QQQ', 1.0, '20250101_000000'))
+    store.conn.execute("UPDATE runs SET parameters = ?, param_hash = ?",
+                       (json.dumps({'fast_low': 8, 'slow_low': 74}), 'legacy'))
+    store.conn.commit()
+    store.close()
+
+    store = ResultStore(path)
+    runs = store.runs_with_parameters({'fast_length_low': 8, 'slow_length_low': 74})
+    assert len(runs) == 1 and runs[0]['parameters'] == {'fast_length_low': 8, 'slow_length_low': 74}
+
+
+def test_report_locates_run_window(tmp_path):
+    """Trades are placed relative to the run's first bar; changed data is refused"""
+    data = load_data(PRICES)
+    window = data.tail(300)
+    signals = get_strategy_factory('adaptive_ema_v1', '1h')({}).generate_signals(window)['signal']
+    position = simulate(window, signals, include_equity=True)['position']
+    run = _run('QQQ', 1.0, '20250101_000000')
+    run.update(dataset=dataset_fingerprint(window), candles=len(window), trades=trade_log(window, position))
+
+    store = ResultStore(tmp_path / 'results.db')
+    run = store.get_run(store.add_run(run))
+    assert locate_run(PRICES, run) == len(data) - 300
+    render_html(run, tmp_path / 'report.html', prices=PRICES)
+
+    changed = data.copy()
+    changed.iloc[-10, changed.columns.get_loc('close')] += 1.0
+    save_data(changed, tmp_path / 'qqq_1h.csv')
+    with pytest.raises(ValueError, match='checksum'):
+        render_html(run, tmp_path / 'report.html', prices=tmp_path / 'qqq_1h.csv')
+
+
+def test_report_checks_imported_trades(tmp_path):
+    """Imported runs without a fingerprint are checked against their trade prices"""
+    with open(RESULTS_DIR / 'adaptive_ema_v1/results/qqq/1h/20251123_142917_QQQ_1h.json') as f:
+        run = json.load(f)
+    assert locate_run(PRICES, run) == 0
+
+    save_data(load_data(PRICES).iloc[5:], tmp_path / 'qqq_1h.csv')
+    with pytest.raises(ValueError, match='trade 1'):
+        locate_run(tmp_path / 'qqq_1h.csv', run)
@@ -0,0 +1,74 @@
+"""
+Test Strategy Registry and Indicator Library
+
+Verifies lookup by name, the shared interval factories, and that the
+vectorized indicators agree with their pandas definitions in batch form
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from strategies import get_strategy, get_strategy_factory, indicators, list_strategies, strategy_intervals
+from strategies.adaptive_ema_v1 import AdaptiveEmaV1Strategy
+
+
+def test_registry_lookup():
+    assert 'adaptive_ema_v1' in list_strategies()
+    assert get_strategy('adaptive_ema_v1') is AdaptiveEmaV1Strategy
+    assert {'1h', '1d'} <= set(strategy_intervals('adaptive_ema_v1'))
+
+    create_strategy = get_strategy_factory('adaptive_ema_v1', '1d')
+    strategy = create_strategy({'atr_length': 9})
+    assert isinstance(strategy, AdaptiveEmaV1Strategy)
+    assert strategy.atr_length == 9 and strategy.slow_high == 90
+
+    with pytest.raises(ValueError):
+        get_strategy('missing_strategy')
+    with pytest.raises(ValueError):
+        get_strategy_factory('adaptive_ema_v1', '7m')
+    with pytest.raises(ValueError, match='fast_low'):
+        create_strategy({'fast_low': 8})
+
+    strategy = create_strategy({'initial_capital': 5000, 'atr_length': 9})
+    assert strategy.initial_capital == 5000 and strategy.atr_length == 9
+    assert 'initial_capital' not in strategy.get_parameters()
+    with pytest.raises(ValueError, match='Fast EMA'):
+        create_strategy({'fast_length_low': 90, 'slow_length_low': 80})
+
+
+def test_indicators_match_pandas(sample_data):
+    df = sample_data(600, seed=11)
+    assert np.allclose(indicators.ema(df['close'], 20), df['close'].ewm(span=20, adjust=False).mean())
+
+    tr = pd.concat([df['high'] - df['low'], (df['high'] - df['close'].shift()).abs(),
+                    (df['low'] - df['close'].shift()).abs()], axis=1).max(axis=1)
+    assert np.allclose(indicators.atr(df['high'], df['low'], df['close'], 14),
+                       tr.ewm(span=14, adjust=False).mean())
+
+    values = df['close'].to_numpy()
+    ranks = indicators.rolling_rank(values, 30)
+    i = 100
+    assert ranks[i] == (values[i - 30:i] <= values[i]).sum() / 30 * 100
+    assert (ranks[:30] == 50.0).all()
+
+    fast, slow = np.array([1, 2, 3, 2, 1.0]), np.array([2, 2, 2, 2, 2.0])
+    assert indicators.crossover_signals(fast, slow).tolist() == [0, 0, 1, 0, -1]
+
+
+def test_batch_matches_single_series(sample_data):
+    paths = [sample_data(600, seed=s) for s in range(4)]
+    batch = {col: np.column_stack([p[col].to_numpy() for p in paths]) for col in ('open', 'high', 'low', 'close', 'volume')}
+
+    assert np.allclose(indicators.rolling_rank(batch['close'], 25)[:, 2],
+                       indicators.rolling_rank(batch['close'][:, 2], 25))
+
+    strategy = get_strategy_factory('adaptive_ema_v1', '1h')({})
+    signals = strategy.batch_signals(batch)
+    for j, data in enumerate(paths):
+        assert np.array_equal(signals[:, j], strategy.generate_signals(data)['signal'].to_numpy())
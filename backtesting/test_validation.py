@@ -0,0 +1,86 @@
+"""
+Test Dataset Validation
+
+Verifies the vectorized checks, the repair pass and the manifest cache
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from utils.data_loader import load_data, save_data
+from utils.validation import load_manifest, repair_bars, validate_bars, validate_file
+
+
+def _session_bars(days: int = 5) -> pd.DataFrame:
+    """Hourly bars 08:00-16:00 ET (stored as naive UTC) on consecutive weekdays"""
+    dates = pd.bdate_range('2025-03-10', periods=days)
+    local = [d + pd.Timedelta(hours=h) for d in dates for h in range(8, 17)]
+    index = pd.DatetimeIndex(local).tz_localize('America/New_York').tz_convert('UTC').tz_localize(None)
+    close = 100 + np.arange(len(index), dtype=float) * 0.1
+    return pd.DataFrame({
+        'open': close, 'high': close + 0.5, 'low': close - 0.5, 'close': close, 'volume': 1e5,
+    }, index=pd.Index(index, name='timestamp'))
+
+
+def test_clean_data_is_valid():
+    report = validate_bars(_session_bars(), '1h')
+    assert report['valid']
+    assert not any(report['issues'].values())
+
+
+def test_detects_and_repairs_defects():
+    data = _session_bars()
+    data.iloc[3, data.columns.get_loc('low')] = data['high'].iloc[3] + 1   # high < low
+    data.iloc[5, data.columns.get_loc('close')] = -1.0                    # bad price
+    data.iloc[7, data.columns.get_loc('volume')] = 1.0                    # low volume
+    broken = pd.concat([data.iloc[:10], data.iloc[[9]], data.iloc[12:20], data.iloc[10:12], data.iloc[20:]])
+
+    report = validate_bars(broken, '1h', session='regular')
+    assert not report['valid']
+    for name in ('duplicates', 'non_monotonic', 'high_below_low', 'bad_prices', 'low_volume', 'outside_session'):
+        assert report['issues'][name] > 0, name
+
+    repaired, repairs = repair_bars(broken, '1h', session='regular')
+    assert repairs['duplicates_dropped'] == 1
+    assert repairs['bad_prices_dropped'] == 1
+    assert repairs['high_low_swapped'] == 1
+    assert repairs['outside_session_dropped'] == 2 * 5    # 08:00 and 16:00 bars
+    assert repaired.index.is_monotonic_increasing and repaired.index.is_unique
+    assert validate_bars(repaired, '1h', session='regular')['valid']
+
+
+def test_gaps_and_fill():
+    data = _session_bars().drop(_session_bars().index[[20, 21]])    # two bars inside day 3
+    data = data[data.index.normalize() != data.index[30].normalize()]  # a whole day missing
+    report = validate_bars(data, '1h')
+    assert report['issues']['intraday_gaps'] == 1
+    assert report['issues']['missing_bars'] == 2
+    assert report['issues']['missing_sessions'] == 1
+
+    filled, repairs = repair_bars(data, '1h', fill_gaps=True)
+    assert repairs['gap_bars_inserted'] == 2
+    assert validate_bars(filled, '1h')['issues']['intraday_gaps'] == 0
+
+
+def test_manifest_skips_rescan(tmp_path):
+    path = tmp_path / 'qqq_1h.csv'
+    save_data(_session_bars(), path)
+    assert load_data(path).equals(_session_bars().astype(float))
+
+    first = validate_file(path, '1h')
+    assert not first['cached']
+    assert validate_file(path, '1h')['cached']
+    assert load_manifest(tmp_path)['qqq_1h.csv']['report']['rows'] == first['rows']
+
+    # Touching the file keeps the result (same content hash); changing it re-scans
+    os.utime(path, ns=(0, 0))
+    assert validate_file(path, '1h')['cached']
+    save_data(_session_bars(days=3), path)
+    assert not validate_file(path, '1h')['cached']
+    assert load_data(path, validate=True).shape[0] == 27
@@ -0,0 +1,59 @@
+"""
+Test Warmup Derivation
+
+Verifies exact and tolerance-based warmup against the strategy parameters
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from strategies import get_strategy_factory
+from strategies.indicators import ema_lookback
+from utils.warmup import history_days, search_warmup
+
+
+create_strategy = get_strategy_factory('adaptive_ema_v1', '1h')
+
+
+def test_exact_warmup_covers_slowest_indicator():
+    strategy = create_strategy({'slow_length_high': 120, 'atr_length': 14, 'volatility_length': 63})
+    assert strategy.get_warmup_period() == 120
+
+    strategy = create_strategy({'slow_length_med': 90, 'slow_length_high': 95, 'atr_length': 20, 'volatility_length': 80})
+    assert strategy.get_warmup_period() == 20 + 80
+
+
+def test_tolerance_bounds_seed_weight():
+    for span in (5, 38, 120):
+        alpha = 2 / (span + 1)
+        for tolerance in (0.2, 0.01):
+            k = ema_lookback(span, tolerance)
+            assert (1 - alpha) ** k <= tolerance < (1 - alpha) ** (k - 1)
+
+
+def test_tolerance_warmup_converges():
+    """After the warmup, a run started later agrees with the full history"""
+    rng = np.random.default_rng(0)
+    close = pd.Series(100 * np.exp(np.cumsum(rng.normal(0, 0.01, 1000))))
+    span, tolerance, offset = 120, 0.01, 300
+    k = ema_lookback(span, tolerance)
+
+    full = close.ewm(span=span, adjust=False).mean()
+    late = close.iloc[offset:].ewm(span=span, adjust=False).mean()
+    error = abs(late.iloc[k] - full.iloc[offset + k])
+    assert error <= tolerance * abs(close.iloc[offset] - full.iloc[offset]) + 1e-12
+
+
+def test_search_warmup_and_history():
+    ranges = {'slow_length_high': [110, 120, 130], 'atr_length': [14], 'volatility_length': [60, 63]}
+    assert search_warmup(create_strategy, ranges) == 130
+    assert search_warmup(create_strategy, ranges, tolerance=0.01) > 130
+    # The top of both ranges (130 / 120) is not a valid strategy, but bounds the search
+    assert search_warmup(create_strategy, {'fast_length_high': range(30, 131), 'slow_length_high': [120]}) == 130
+    # 7 regular-session 1h bars per day: 700 bars -> 100 sessions -> 140 days + holiday slack
+    assert history_days(700, '1h') == 150
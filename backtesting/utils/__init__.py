@@ -0,0 +1,11 @@
+"""Backtesting utilities - data loading and validation, simulation, replay, result storage and reporting"""
+
+from .result_store import ResultStore, canonical_params, param_hash
+from .result_cache import ResultCache
+from .portfolio import backtest_portfolio
+from .replay import ReplayEngine, run_replay
+from .robustness import run_robustness
+from .validation import repair_bars, validate_bars, validate_file
+
+__all__ = ['ReplayEngine', 'ResultStore', 'ResultCache', 'backtest_portfolio', 'canonical_params', 'param_hash',
+           'repair_bars', 'run_replay', 'run_robustness', 'validate_bars', 'validate_file']
@@ -0,0 +1,128 @@
+"""
+Config Header Parsing - Read OpenCL strategy config headers from Python
+
+Parses opencl/strategies/<strategy>/config_<interval>.h so the Python tools
+use the same default parameters, search ranges and settings as the OpenCL
+optimizer.
+"""
+
+import itertools
+import re
+from pathlib import Path
+
+
+_DEFINE = re.compile(r'^\s*#define\s+(\w+)(?:\s+([^\s/]+))?')
+
+# Header parameter prefix -> (strategy parameter name, SEARCH_PERCENT prefix)
+PARAMETER_MAP = [
+    ('FAST_LOW', 'fast_length_low', 'FAST_LOW'),
+    ('SLOW_LOW', 'slow_length_low', 'SLOW_LOW'),
+    ('FAST_MED', 'fast_length_med', 'FAST_MED'),
+    ('SLOW_MED', 'slow_length_med', 'SLOW_MED'),
+    ('FAST_HIGH', 'fast_length_high', 'FAST_HIGH'),
+    ('SLOW_HIGH', 'slow_length_high', 'SLOW_HIGH'),
+    ('ATR_LENGTH', 'atr_length', 'ATR'),
+    ('VOL_LENGTH', 'volatility_length', 'VOL'),
+    ('LOW_VOL_PCT', 'low_vol_percentile', 'LOW_PCT'),
+    ('HIGH_VOL_PCT', 'high_vol_percentile', 'HIGH_PCT'),
+]
+
+
+def _parse_value(text: str):
+    """Parse a #define value as int or float (C float suffix allowed)"""
+    text = text.rstrip('fF') if re.match(r'^[-\d.]+[fF]$', text) else text
+    for cast in (int, float):
+        try:
+            return cast(text)
+        except ValueError:
+            continue
+    return text
+
+
+def parse_config_header(path) -> dict:
+    """
+    Parse #define lines from a config header
+
+    Args:
+        path: Header file path
+
+    Returns:
+        Dictionary of macro name -> value (flag macros map to True)
+    """
+    defines = {}
+    for line in Path(path).read_text().splitlines():
+        match = _DEFINE.match(line)
+        if not match:
+            continue
+        name, value = match.groups()
+        defines[name] = True if value is None else _parse_value(value)
+    return defines
+
+
+def default_parameters(config: dict, interval: str) -> dict:
+    """Return the strategy parameters defined in a config header"""
+    suffix = interval.upper()
+    return {param: config[f"{prefix}_{suffix}"] for prefix, param, _ in PARAMETER_MAP}
+
+
+def strategy_settings(config: dict, interval: str) -> dict:
+    """
+    Return the simulation settings defined in a config header
+
+    Returns:
+        Dictionary with initial_capital, min_trades, max_drawdown_filter, warmup,
+        commission_bps and slippage_bps
+    """
+    suffix = interval.upper()
+    return {
+        'initial_capital': float(config.get(f"INITIAL_CAPITAL_{suffix}", 10000.0)),
+        'min_trades': int(config.get(f"MIN_TRADES_{suffix}", 1)),
+        'max_drawdown_filter': float(config.get(f"MAX_DRAWDOWN_FILTER_{suffix}", 100.0)),
+        'warmup': int(config.get(f"WARMUP_PERIOD_{suffix}", 0)),
+        'commission_bps': float(config.get(f"COMMISSION_BPS_{suffix}", 0.0)),
+        'slippage_bps': float(config.get(f"SLIPPAGE_BPS_{suffix}", 0.0)),
+    }
+
+
+def search_ranges(config: dict, interval: str) -> dict:
+    """
+    Return the inclusive integer search range for every strategy parameter
+
+    Ranges are the default value +/- SEARCH_PERCENT_<NAME>_<INTERVAL> percent,
+    matching USE_PERCENT_RANGE in the OpenCL optimizer.
+
+    Returns:
+        Dictionary of parameter name -> list of candidate values
+    """
+    suffix = interval.upper()
+    defaults = default_parameters(config, interval)
+    ranges = {}
+    for prefix, param, search_prefix in PARAMETER_MAP:
+        value = defaults[param]
+        percent = float(config.get(f"SEARCH_PERCENT_{search_prefix}_{suffix}", 0))
+        spread = value * percent / 100.0
+        low = max(1, int(round(value - spread)))
+        high = max(low, int(round(value + spread)))
+        ranges[param] = list(range(low, high + 1))
+    return ranges
+
+
+def iter_candidates(ranges: dict):
+    """
+    Yield every valid parameter combination from search ranges
+
+    Combinations violating fast < slow or low percentile < high percentile
+    are skipped.
+    """
+    names = list(ranges)
+    for values in itertools.product(*(ranges[n] for n in names)):
+        params = dict(zip(names, values))
+        if params['fast_length_low'] >= params['slow_length_low']:
+            continue
+        if params['fast_length_med'] >= params['slow_length_med']:
+            continue
+        if params['fast_length_high'] >= params['slow_length_high']:
+            continue
+        if params['low_vol_percentile'] >= params['high_vol_percentile']:
+            continue
+        yield params
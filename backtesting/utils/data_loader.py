@@ -0,0 +1,94 @@
+"""
+Data Loader - Read OHLCV CSV files written by opencl/fetch_data.py
+
+CSV format: Timestamp (unix seconds), Open, High, Low, Close, Volume
+"""
+
+import hashlib
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+OHLCV_COLUMNS = ['open', 'high', 'low', 'close', 'volume']
+
+
+def load_data(path, validate: bool = False, interval: str = None, session: str = None,
+              start: int = 0, nrows: int = None) -> pd.DataFrame:
+    """
+    Load an OHLCV CSV into a DataFrame indexed by timestamp
+
+    Args:
+        path: CSV file path (e.g. opencl/data/qqq_1h.csv)
+        validate: Validate the file first (cached in data/manifest.json) and
+                  raise ValueError if it has duplicate, out-of-order or
+                  invalid bars
+        interval: Bar interval for validation (default: from the file name)
+        session: Session for validation (None or 'regular')
+        start: First row to read
+        nrows: Number of rows to read (default: to the end of the file)
+
+    Returns:
+        DataFrame with lowercase open/high/low/close/volume columns and a
+        DatetimeIndex (UTC, timezone-naive)
+    """
+    if validate:
+        from .validation import format_report, validate_file
+        interval = interval or Path(path).stem.rsplit('_', 1)[-1]
+        report = validate_file(path, interval, session=session)
+        if not report['valid']:
+            raise ValueError(f"Invalid dataset {path}:\n" + '\n'.join(format_report(report)))
+
+    df = pd.read_csv(path, skiprows=range(1, start + 1), nrows=nrows)
+    df.columns = [c.lower() for c in df.columns]
+    df.index = pd.to_datetime(df.pop('timestamp'), unit='s')
+    df.index.name = 'timestamp'
+    return df[OHLCV_COLUMNS].astype(float)
+
+
+def save_data(data: pd.DataFrame, path):
+    """
+    Write bars in the CSV format read by load_data and the OpenCL optimizer
+
+    Args:
+        data: DataFrame with open/high/low/close/volume and a DatetimeIndex
+        path: CSV file path
+    """
+    out = pd.DataFrame({
+        'Timestamp': data.index.values.astype('datetime64[s]').astype(np.int64),
+        **{col.capitalize(): data[col].to_numpy() for col in OHLCV_COLUMNS},
+    })
+    out.to_csv(path, index=False, header=True)
+
+
+def dataset_checksum(data: pd.DataFrame) -> str:
+    """
+    Return a checksum of the bar contents (timestamps and OHLCV values)
+
+    Two DataFrames with identical bars produce the same checksum regardless
+    of where they were loaded from.
+    """
+    h = hashlib.sha1()
+    h.update(np.ascontiguousarray(data.index.asi8).tobytes())
+    h.update(np.ascontiguousarray(data[OHLCV_COLUMNS].to_numpy(dtype=np.float64)).tobytes())
+    return h.hexdigest()
+
+
+def dataset_fingerprint(data: pd.DataFrame) -> dict:
+    """
+    Identify the bars a run was evaluated on
+
+    Stored with each run so reports can find the run's window in a data file
+    and detect when the file no longer holds the same bars.
+
+    Returns:
+        Dictionary with checksum (dataset_checksum), start (first bar, unix
+        seconds) and bars
+    """
+    start = data.index[:1].values.astype('datetime64[s]').astype(np.int64)
+    return {
+        'checksum': dataset_checksum(data),
+        'start': int(start[0]) if len(start) else None,
+        'bars': len(data),
+    }
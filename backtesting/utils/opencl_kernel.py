@@ -0,0 +1,330 @@
+"""
+OpenCL Kernel Host - CPU emulation, OpenCL execution and conformance checks
+
+The OpenCL optimizer runs opencl/strategies/<strategy>/kernel.cl with one
+work-item per parameter combination. This module provides:
+- emulate_kernel: a NumPy emulation of the kernel's work-item loop, running
+  every work-item in lockstep over the bars (float32 by default, matching
+  the device arithmetic)
+- run_opencl_kernel: executes kernel.cl on any OpenCL device via pyopencl,
+  including CPU runtimes such as PoCL (optional dependency)
+- reference_trace / compare_traces: bar-for-bar conformance against the
+  Python AdaptiveEmaV1Strategy and utils.simulator
+"""
+
+from pathlib import Path
+
+import numpy as np
+
+from .simulator import BARS_PER_YEAR, simulate
+
+
+KERNEL_DIR = Path(__file__).parent.parent.parent / 'opencl' / 'strategies'
+
+# Must match the #defines in kernel.cl
+NUM_PARAMS = 10
+NUM_RESULTS = 5
+NUM_TRACE = 4
+MAX_VOL_LENGTH = 256
+
+PARAM_ORDER = [
+    'fast_length_low', 'slow_length_low',
+    'fast_length_med', 'slow_length_med',
+    'fast_length_high', 'slow_length_high',
+    'atr_length', 'volatility_length',
+    'low_vol_percentile', 'high_vol_percentile',
+]
+RESULT_FIELDS = ['total_return', 'max_drawdown', 'calmar_ratio', 'sharpe_ratio', 'total_trades']
+TRACE_FIELDS = ['ema_fast', 'ema_slow', 'vol_percentile', 'signal']
+
+
+def check_params_array(params: np.ndarray) -> np.ndarray:
+    """
+    Reject parameter rows the kernel cannot evaluate like the Python strategy
+
+    kernel.cl keeps the volatility window in a private array of
+    MAX_VOL_LENGTH floats, while the Python strategy has no limit.
+
+    Args:
+        params: (combinations x NUM_PARAMS) array, see params_to_array
+
+    Returns:
+        params, unchanged
+
+    Raises:
+        ValueError: A volatility_length outside 1..MAX_VOL_LENGTH
+    """
+    vol_length = np.asarray(params)[:, PARAM_ORDER.index('volatility_length')]
+    bad = (vol_length < 1) | (vol_length > MAX_VOL_LENGTH)
+    if bad.any():
+        raise ValueError(f"volatility_length must be 1..{MAX_VOL_LENGTH} for the kernel, "
+                         f"got {vol_length[bad][0]:g} (combination {int(np.flatnonzero(bad)[0])})")
+    return params
+
+
+def params_to_array(candidates: list) -> np.ndarray:
+    """
+    Pack parameter dictionaries into the kernel's (combinations x NUM_PARAMS) layout
+
+    Raises:
+        ValueError: A candidate the kernel cannot evaluate (see check_params_array)
+    """
+    return check_params_array(np.array([[c[name] for name in PARAM_ORDER] for c in candidates], dtype=np.float32))
+
+
+def _results_to_dict(results: np.ndarray) -> dict:
+    """Unpack a (combinations x NUM_RESULTS) array into named columns"""
+    return {name: results[:, i] for i, name in enumerate(RESULT_FIELDS)}
+
+
+def emulate_kernel(close, high, low, params: np.ndarray, warmup: int = 0,
+                   initial_capital: float = 10000.0, bars_per_year: float = BARS_PER_YEAR['1h'],
+                   dtype=np.float32, trace: bool = False) -> dict:
+    """
+    Emulate kernel.cl on the CPU, all work-items in lockstep
+
+    Args:
+        close, high, low: Price arrays
+        params: (combinations x NUM_PARAMS) array, see params_to_array
+        warmup, initial_capital, bars_per_year: Kernel arguments
+        dtype: np.float32 reproduces device arithmetic; np.float64 matches
+            the Python strategy
+        trace: Also return per-bar traces (bars x combinations) for
+            ema_fast, ema_slow, vol_percentile and signal
+
+    Returns:
+        Dictionary of result arrays (one value per combination), plus the
+        trace arrays when requested
+    """
+    f = dtype
+    close = np.asarray(close, dtype=f)
+    high = np.asarray(high, dtype=f)
+    low = np.asarray(low, dtype=f)
+    p = check_params_array(np.asarray(params, dtype=f))
+    n_bars, k = len(close), len(p)
+    rows = np.arange(k)
+
+    alpha = (f(2.0) / (p[:, :7] + f(1.0))).astype(f)
+    ema_alpha, atr_alpha = alpha[:, :6], alpha[:, 6]
+    vol_length = p[:, 7].astype(int)
+    low_pct, high_pct = p[:, 8], p[:, 9]
+
+    window = np.zeros((k, vol_length.max()), dtype=f)
+    in_window = np.arange(window.shape[1])[None, :] < vol_length[:, None]
+
+    # EMA order: fast_low, slow_low, fast_med, slow_med, fast_high, slow_high
+    emas = np.full((k, 6), close[0], dtype=f)
+    atr = np.full(k, high[0] - low[0], dtype=f)
+
+    prev_fast = np.zeros(k, dtype=f)
+    prev_slow = np.zeros(k, dtype=f)
+    position = np.zeros(k, dtype=bool)
+    equity = np.full(k, initial_capital, dtype=f)
+    peak = equity.copy()
+    max_dd = np.zeros(k, dtype=f)
+    trades = np.zeros(k, dtype=np.int64)
+    n_returns = 0
+    mean_ret = np.zeros(k, dtype=f)
+    m2_ret = np.zeros(k, dtype=f)
+
+    if trace:
+        traces = {name: np.empty((n_bars, k), dtype=f) for name in TRACE_FIELDS}
+
+    for i in range(n_bars):
+        c = close[i]
+        if i > 0:
+            pc = close[i - 1]
+            tr = max(high[i] - low[i], abs(high[i] - pc), abs(low[i] - pc))
+            atr = atr_alpha * tr + (f(1.0) - atr_alpha) * atr
+            emas = ema_alpha * c + (f(1.0) - ema_alpha) * emas
+        natr = atr / c * f(100.0)
+
+        count = ((window <= natr[:, None]) & in_window).sum(axis=1)
+        pct = np.where(i >= vol_length, count.astype(f) / vol_length.astype(f) * f(100.0), f(50.0)).astype(f)
+        window[rows, i % vol_length] = natr
+
+        is_low = pct < low_pct
+        is_high = pct >= high_pct
+        fast = np.where(is_low, emas[:, 0], np.where(is_high, emas[:, 4], emas[:, 2]))
+        slow = np.where(is_low, emas[:, 1], np.where(is_high, emas[:, 5], emas[:, 3]))
+
+        signal = np.zeros(k, dtype=np.int8)
+        if i > 0:
+            buy = (prev_fast <= prev_slow) & (fast > slow)
+            sell = ~buy & (prev_fast >= prev_slow) & (fast < slow)
+            signal[buy] = 1
+            signal[sell] = -1
+        prev_fast, prev_slow = fast, slow
+
+        if trace:
+            traces['ema_fast'][i] = fast
+            traces['ema_slow'][i] = slow
+            traces['vol_percentile'][i] = pct
+            traces['signal'][i] = signal
+
+        if i > 0:
+            r = np.where(position, c / close[i - 1] - f(1.0), f(0.0)).astype(f)
+            equity = equity * (f(1.0) + r)
+            if i > warmup:
+                n_returns += 1
+                delta = r - mean_ret
+                mean_ret = mean_ret + delta / f(n_returns)
+                m2_ret = m2_ret + delta * (r - mean_ret)
+        if i >= warmup:
+            peak = np.maximum(peak, equity)
+            max_dd = np.maximum(max_dd, f(1.0) - equity / peak)
+            trades += (signal == -1) & position
+            position = np.where(signal == 1, True, np.where(signal == -1, False, position))
+
+    total_return = (equity / f(initial_capital) - f(1.0)) * f(100.0)
+    max_drawdown = max_dd * f(100.0)
+    std_ret = np.sqrt(m2_ret / f(n_returns)) if n_returns > 1 else np.zeros(k, dtype=f)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        calmar = np.where(max_drawdown > 0, total_return / max_drawdown, f(0.0))
+        sharpe = np.where(std_ret > 0, mean_ret / std_ret * f(np.sqrt(bars_per_year)), f(0.0))
+
+    result = {
+        'total_return': total_return,
+        'max_drawdown': max_drawdown,
+        'calmar_ratio': calmar.astype(f),
+        'sharpe_ratio': sharpe.astype(f),
+        'total_trades': trades.astype(f),
+    }
+    if trace:
+        result.update(traces)
+    return result
+
+
+def list_opencl_devices() -> list:
+    """
+    Return available OpenCL devices as (platform name, device name, device) tuples
+
+    Returns an empty list when pyopencl is not installed.
+    """
+    try:
+        import pyopencl as cl
+    except ImportError:
+        return []
+    devices = []
+    for platform in cl.get_platforms():
+        for device in platform.get_devices():
+            devices.append((platform.name, device.name, device))
+    return devices
+
+
+def run_opencl_kernel(close, high, low, params: np.ndarray, warmup: int = 0,
+                      initial_capital: float = 10000.0, bars_per_year: float = BARS_PER_YEAR['1h'],
+                      strategy: str = 'adaptive_ema_v1', device=None, trace: bool = False,
+                      build_options: str = '') -> dict:
+    """
+    Execute kernel.cl on an OpenCL device
+
+    Args:
+        close, high, low, params, warmup, initial_capital, bars_per_year:
+            Same as emulate_kernel
+        strategy: Strategy directory containing kernel.cl
+        device: pyopencl device (default: first available, any type)
+        trace: Run trace_strategy and return per-bar traces
+        build_options: OpenCL compiler options (e.g. '-cl-fast-relaxed-math')
+
+    Returns:
+        Same structure as emulate_kernel
+    """
+    try:
+        import pyopencl as cl
+    except ImportError:
+        raise ImportError("pyopencl is required for the OpenCL path. Install with: pip install pyopencl "
+                          "(add pocl-binary-distribution for a CPU runtime)")
+
+    if device is None:
+        devices = list_opencl_devices()
+        if not devices:
+            raise RuntimeError("No OpenCL devices found")
+        device = devices[0][2]
+
+    source = (KERNEL_DIR / strategy / 'kernel.cl').read_text()
+    ctx = cl.Context([device])
+    queue = cl.CommandQueue(ctx)
+    program = cl.Program(ctx, source).build(options=build_options)
+
+    mf = cl.mem_flags
+    close = np.ascontiguousarray(close, dtype=np.float32)
+    high = np.ascontiguousarray(high, dtype=np.float32)
+    low = np.ascontiguousarray(low, dtype=np.float32)
+    params = check_params_array(np.ascontiguousarray(params, dtype=np.float32))
+    n_bars, k = len(close), len(params)
+
+    close_buf = cl.Buffer(ctx, mf.READ_ONLY | mf.COPY_HOST_PTR, hostbuf=close)
+    high_buf = cl.Buffer(ctx, mf.READ_ONLY | mf.COPY_HOST_PTR, hostbuf=high)
+    low_buf = cl.Buffer(ctx, mf.READ_ONLY | mf.COPY_HOST_PTR, hostbuf=low)
+    params_buf = cl.Buffer(ctx, mf.READ_ONLY | mf.COPY_HOST_PTR, hostbuf=params)
+    results = np.empty((k, NUM_RESULTS), dtype=np.float32)
+    results_buf = cl.Buffer(ctx, mf.WRITE_ONLY, results.nbytes)
+
+    scalars = (np.int32(n_bars), np.int32(k), np.int32(warmup),
+               np.float32(initial_capital), np.float32(bars_per_year))
+    if trace:
+        trace_out = np.empty((k, n_bars, NUM_TRACE), dtype=np.float32)
+        trace_buf = cl.Buffer(ctx, mf.WRITE_ONLY, trace_out.nbytes)
+        program.trace_strategy(queue, (k,), None, close_buf, high_buf, low_buf,
+                               params_buf, results_buf, trace_buf, *scalars)
+        cl.enqueue_copy(queue, trace_out, trace_buf)
+    else:
+        program.optimize_strategy(queue, (k,), None, close_buf, high_buf, low_buf,
+                                  params_buf, results_buf, *scalars)
+    cl.enqueue_copy(queue, results, results_buf)
+    queue.finish()
+
+    result = _results_to_dict(results)
+    if trace:
+        for i, name in enumerate(TRACE_FIELDS):
+            result[name] = trace_out[:, :, i].T
+    return result
+
+
+def reference_trace(data, create_strategy, params: dict, warmup: int = 0,
+                    initial_capital: float = 10000.0,
+                    bars_per_year: float = BARS_PER_YEAR['1h']) -> dict:
+    """
+    Run the Python strategy and simulator for one parameter set
+
+    Returns:
+        Dictionary with per-bar traces (same fields as the kernel trace, one
+        column) and the simulator metrics
+    """
+    df = create_strategy(params).generate_signals(data)
+    metrics = simulate(data, df['signal'], initial_capital=initial_capital,
+                       warmup=warmup, bars_per_year=bars_per_year)
+    result = {name: df[name].to_numpy(dtype=float)[:, None] for name in TRACE_FIELDS}
+    result.update({name: np.array([metrics[name]], dtype=float) for name in RESULT_FIELDS})
+    return result
+
+
+def compare_traces(reference: dict, candidate: dict, rtol: float = 1e-9, atol: float = 1e-9) -> dict:
+    """
+    Compare two traces bar for bar
+
+    Args:
+        reference, candidate: Outputs of reference_trace / emulate_kernel /
+            run_opencl_kernel (with trace=True), for the same combinations
+        rtol, atol: Tolerances for indicator values; signals must match exactly
+
+    Returns:
+        Dictionary of field -> {'mismatches': count, 'first_bar': index or None,
+        'max_abs_diff': float}
+    """
+    report = {}
+    for name in TRACE_FIELDS:
+        ref = np.asarray(reference[name], dtype=float)
+        cand = np.asarray(candidate[name], dtype=float)
+        if name == 'signal':
+            bad = ref != cand
+        else:
+            bad = ~np.isclose(cand, ref, rtol=rtol, atol=atol)
+        bad_bars = np.flatnonzero(bad.any(axis=1))
+        report[name] = {
+            'mismatches': int(bad.sum()),
+            'first_bar': int(bad_bars[0]) if len(bad_bars) else None,
+            'max_abs_diff': float(np.max(np.abs(cand - ref))) if ref.size else 0.0,
+        }
+    return report
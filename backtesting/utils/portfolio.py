@@ -0,0 +1,216 @@
+"""
+Portfolio Backtest - Many symbols sharing one pool of capital
+
+Aligns every symbol's bars onto a common timestamp index, applies each
+symbol's strategy signals, converts them into target weights with an
+allocation rule and computes portfolio equity and drawdown as matrix
+operations over (time x assets).
+
+Trading model per symbol matches utils.simulator: long-only, with the same
+fill model (commission/slippage in bps, close or next-open execution).
+Weights are rebalanced to target at every execution point. Costs are charged
+on the turnover from the weights after each bar's price drift to the
+target, so rebalancing a drifted portfolio back to target is costed like any
+other trade. Each symbol's warmup counts from its own first bar. A symbol
+whose data ends (delisted, or a shorter history) is closed out after its
+last bar and its capital is freed.
+
+Allocation rules:
+- 'equal': each symbol owns 1/N of the portfolio; idle slots stay in cash
+- 'active': capital is split equally between the symbols currently long
+- 'inverse_vol': like 'active', weighted by inverse rolling volatility
+"""
+
+import numpy as np
+import pandas as pd
+
+from .simulator import BARS_PER_YEAR, equity_metrics, execution_factors, signals_to_position
+
+
+ALLOCATION_RULES = ('equal', 'active', 'inverse_vol')
+
+
+def align_bars(bars: dict) -> dict:
+    """
+    Align many symbols' bars onto a common timestamp index
+
+    Args:
+        bars: Dictionary of symbol -> OHLCV DataFrame (DatetimeIndex)
+
+    Returns:
+        Dictionary of field -> DataFrame (time x symbols) for open, high, low,
+        close and volume, plus 'tradable' marking bars that exist for a symbol.
+        Prices are forward-filled over missing bars, so a symbol's return is
+        zero while it has no bar.
+    """
+    symbols = list(bars)
+    index = bars[symbols[0]].index
+    for symbol in symbols[1:]:
+        index = index.union(bars[symbol].index)
+
+    panels = {}
+    for field in ('open', 'high', 'low', 'close', 'volume'):
+        panel = pd.concat({s: bars[s][field] for s in symbols}, axis=1).reindex(index)
+        panels[field] = panel
+    panels['tradable'] = panels['close'].notna()
+    for field in ('open', 'high', 'low', 'close'):
+        panels[field] = panels[field].ffill()
+    panels['volume'] = panels['volume'].fillna(0.0)
+    return panels
+
+
+def signal_matrix(bars: dict, create_strategy, index: pd.DatetimeIndex) -> pd.DataFrame:
+    """
+    Compute each symbol's signals on its own bars and align them
+
+    Args:
+        bars: Dictionary of symbol -> OHLCV DataFrame
+        create_strategy: Factory taking a symbol and returning a strategy, or a
+            dictionary of symbol -> strategy instance
+        index: Common timestamp index (from align_bars)
+
+    Returns:
+        DataFrame (time x symbols) of 1 (BUY), -1 (SELL) or 0
+    """
+    columns = {}
+    for symbol, data in bars.items():
+        if isinstance(create_strategy, dict):
+            strategy = create_strategy[symbol]
+        else:
+            strategy = create_strategy(symbol)
+        columns[symbol] = pd.Series(strategy.generate_signals(data)['signal'].to_numpy(), index=data.index)
+    return pd.DataFrame(columns).reindex(index).fillna(0).astype(np.int8)
+
+
+def listed_mask(tradable: np.ndarray) -> np.ndarray:
+    """
+    Mark the bars on or before each symbol's last bar
+
+    Args:
+        tradable: Boolean matrix (time x symbols) of bars that exist
+
+    Returns:
+        Boolean matrix, False after a symbol's last bar
+    """
+    return np.logical_or.accumulate(tradable[::-1], axis=0)[::-1]
+
+
+def positions_from_signals(signals: pd.DataFrame, tradable: np.ndarray, warmup: int = 0) -> np.ndarray:
+    """
+    Convert a signal matrix into a long/flat position matrix
+
+    Args:
+        signals: Signal matrix (time x symbols) from signal_matrix
+        tradable: Boolean matrix (time x symbols) of bars that exist
+        warmup: Signals on each symbol's first `warmup` bars are ignored,
+            counted from that symbol's first bar, so a symbol listed later
+            in the panel still gets its indicator warmup
+
+    Returns:
+        Float array (time x symbols) of 1.0 (long after the bar close) or
+        0.0, flat after a symbol's last bar
+    """
+    values = signals.to_numpy(dtype=float).copy()
+    values[np.cumsum(tradable, axis=0) <= warmup] = 0
+    return signals_to_position(values) * listed_mask(tradable)
+
+
+def target_weights(position: np.ndarray, close: np.ndarray, allocation: str = 'equal',
+                   max_weight: float = None, vol_lookback: int = 63) -> np.ndarray:
+    """
+    Convert positions into portfolio weights
+
+    Args:
+        position: Position matrix (time x symbols) of 1.0 / 0.0
+        close: Aligned close prices (time x symbols)
+        allocation: One of ALLOCATION_RULES
+        max_weight: Optional cap per symbol; the excess stays in cash
+        vol_lookback: Bars of return history for 'inverse_vol'
+
+    Returns:
+        Weight matrix (time x symbols); each row sums to at most 1
+    """
+    if allocation not in ALLOCATION_RULES:
+        raise ValueError(f"Unknown allocation: {allocation} (valid: {', '.join(ALLOCATION_RULES)})")
+
+    n_assets = position.shape[1]
+    if allocation == 'equal':
+        weights = position / n_assets
+    else:
+        if allocation == 'active':
+            raw = position
+        else:
+            returns = np.zeros_like(close)
+            returns[1:] = close[1:] / close[:-1] - 1.0
+            vol = pd.DataFrame(returns).rolling(vol_lookback, min_periods=2).std().to_numpy()
+            with np.errstate(divide='ignore'):
+                inv_vol = np.where(vol > 0, 1.0 / vol, 0.0)
+            raw = position * np.nan_to_num(inv_vol)
+        total = raw.sum(axis=1, keepdims=True)
+        weights = np.divide(raw, total, out=np.zeros_like(raw), where=total > 0)
+
+    if max_weight is not None:
+        weights = np.minimum(weights, max_weight)
+    return weights
+
+
+def backtest_portfolio(bars: dict, create_strategy, allocation: str = 'equal',
+                       initial_capital: float = 10000.0, warmup: int = 0,
+                       bars_per_year: float = BARS_PER_YEAR['1h'], max_weight: float = None,
+                       vol_lookback: int = 63, commission_bps: float = 0.0,
+                       slippage_bps: float = 0.0, fill: str = 'close') -> dict:
+    """
+    Backtest a strategy across a basket of symbols with shared capital
+
+    Args:
+        bars: Dictionary of symbol -> OHLCV DataFrame
+        create_strategy: Factory taking a symbol and returning a strategy, or a
+            dictionary of symbol -> strategy instance
+        allocation: One of ALLOCATION_RULES
+        initial_capital: Starting capital shared by all symbols
+        warmup: Bars excluded from the metrics window, and from trading for
+            each symbol counted from its first bar
+        bars_per_year: Used to annualize the Sharpe ratio
+        max_weight: Optional cap on any single symbol's weight
+        vol_lookback: Bars of return history for 'inverse_vol'
+        commission_bps: Commission per side, in basis points
+        slippage_bps: Half-spread plus slippage per side, in basis points
+        fill: 'close' or 'next_open'
+
+    Returns:
+        Dictionary with portfolio metrics (same keys as utils.simulator.simulate)
+        plus 'equity' and 'drawdown' Series and 'weights' DataFrame
+    """
+    panels = align_bars(bars)
+    index = panels['close'].index
+    symbols = list(panels['close'].columns)
+    close = panels['close'].to_numpy(dtype=float)
+
+    signals = signal_matrix(bars, create_strategy, index)
+    position = positions_from_signals(signals, panels['tradable'].to_numpy(), warmup)
+    weights = target_weights(position, close, allocation, max_weight, vol_lookback)
+
+    factors = execution_factors(close, panels['open'].to_numpy(dtype=float), weights,
+                                fill, commission_bps + slippage_bps)
+    portfolio_returns = factors - 1.0
+
+    equity = initial_capital * np.cumprod(factors)
+    drawdown = equity / np.maximum.accumulate(equity) - 1.0
+    metrics = equity_metrics(equity, portfolio_returns, initial_capital, warmup, bars_per_year)
+
+    total_trades = int((np.diff(position[warmup:], axis=0) < 0).sum())
+
+    # Equal-weight buy & hold of every symbol from its first bar after warmup
+    window = close[warmup:]
+    first_valid = pd.DataFrame(window).bfill().to_numpy()[0]
+    buy_hold = float(np.nanmean(window[-1] / first_valid - 1.0) * 100.0) if len(window) else 0.0
+
+    return {
+        **metrics,
+        'total_trades': total_trades,
+        'buy_hold_return': buy_hold,
+        'outperformance': metrics['total_return'] - buy_hold,
+        'equity': pd.Series(equity, index=index),
+        'drawdown': pd.Series(drawdown * 100.0, index=index),
+        'weights': pd.DataFrame(weights, index=index, columns=symbols),
+    }
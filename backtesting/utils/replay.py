@@ -0,0 +1,313 @@
+"""
+Replay Engine - Event-time paper trading from stored bars
+
+Streams a stored dataset (data/<ticker>_<interval>.csv, or a Parquet file)
+bar by bar through a strategy's incremental update() path, as a live feed
+would deliver it, and emits signals and fills as an async event stream.
+
+- speed: event-time pacing. The gap between two bars' timestamps is replayed
+  as gap / speed seconds of wall time (speed=3600 plays an hour bar per
+  second). None or 0 replays as fast as possible.
+- max_delay: caps the wall-time wait between two bars, so overnight and
+  weekend gaps do not stall a paced replay.
+- fill: 'close' fills on the signal bar's close, 'next_open' on the open of
+  the following bar (the same conventions as the simulator). Long/flat,
+  signals before `warmup` are ignored, so the fills equal
+  trade_log(data, position) of a batch backtest.
+
+A feed task reads the file in chunks and puts bars on an asyncio queue; the
+strategy loop takes them off and yields events. Every bar is stamped when it
+arrives: at its scheduled wall time in a paced replay, or when the feed puts
+it on the queue at full speed. Event latency is measured end to end from
+that stamp, so it includes feed lag, time queued behind earlier bars and the
+consumer's handling of earlier events. The strategy's update() time is
+recorded separately. The engine keeps all latencies for summary().
+
+    engine = ReplayEngine(strategy, 'data/qqq_1h.csv', speed=3600)
+    async for event in engine.events():
+        print(event)
+    print(engine.summary())
+"""
+
+import asyncio
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .data_loader import OHLCV_COLUMNS
+from .simulator import FILL_MODES
+
+
+EVENT_TYPES = ('signal', 'fill')
+LATENCY_PERCENTILES = (50, 90, 99)
+
+DEFAULT_CHUNK_SIZE = 10000
+DEFAULT_QUEUE_SIZE = 1000
+
+
+def _normalize(df: pd.DataFrame) -> pd.DataFrame:
+    """Lowercase columns and index by timestamp, as load_data does"""
+    df.columns = [c.lower() for c in df.columns]
+    if 'timestamp' in df.columns:
+        timestamps = df.pop('timestamp')
+        unit = 's' if pd.api.types.is_numeric_dtype(timestamps) else None
+        df.index = pd.to_datetime(timestamps, unit=unit)
+    df.index.name = 'timestamp'
+    return df[OHLCV_COLUMNS].astype(float)
+
+
+def iter_chunks(source, chunksize: int = DEFAULT_CHUNK_SIZE):
+    """
+    Read bars in chunks without loading the whole dataset
+
+    Args:
+        source: CSV or Parquet path, or a DataFrame of bars
+        chunksize: Bars per chunk (CSV only; Parquet is read per row group)
+
+    Yields:
+        DataFrames with open/high/low/close/volume and a DatetimeIndex
+    """
+    if isinstance(source, pd.DataFrame):
+        for start in range(0, len(source), chunksize):
+            yield source.iloc[start:start + chunksize]
+        return
+
+    path = Path(source)
+    if path.suffix in ('.parquet', '.pq'):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("Parquet replay requires pyarrow: pip install pyarrow") from None
+        parquet = pq.ParquetFile(path)
+        for group in range(parquet.num_row_groups):
+            yield _normalize(parquet.read_row_group(group).to_pandas())
+        return
+
+    for chunk in pd.read_csv(path, chunksize=chunksize):
+        yield _normalize(chunk)
+
+
+def latency_percentiles(latencies_ns, percentiles=LATENCY_PERCENTILES) -> dict:
+    """
+    Summarize latencies in microseconds
+
+    Args:
+        latencies_ns: Latencies in nanoseconds
+        percentiles: Percentiles to report
+
+    Returns:
+        Dictionary with 'p50', 'p90', ... plus 'mean' and 'max' (all 0.0 if empty)
+    """
+    values = np.asarray(latencies_ns, dtype=float) / 1000.0
+    if len(values) == 0:
+        values = np.zeros(1)
+    summary = {f"p{p:g}": float(v) for p, v in zip(percentiles, np.percentile(values, percentiles))}
+    summary['mean'] = float(values.mean())
+    summary['max'] = float(values.max())
+    return summary
+
+
+class ReplayEngine:
+    """
+    Replay stored bars through a strategy's update() path
+
+    Args:
+        strategy: Strategy instance with an incremental update(bar)
+        source: CSV or Parquet path, or a DataFrame of bars
+        speed: Event-time speed-up factor (None or 0: as fast as possible)
+        fill: 'close' or 'next_open'
+        warmup: Signals before this bar are ignored
+        max_delay: Maximum wall-time wait between two bars in seconds
+        chunksize: Bars read from the file at a time
+        queue_size: Bars buffered between the feed and the strategy
+    """
+
+    def __init__(self, strategy, source, speed: float = None, fill: str = 'close', warmup: int = 0,
+                 max_delay: float = None, chunksize: int = DEFAULT_CHUNK_SIZE,
+                 queue_size: int = DEFAULT_QUEUE_SIZE):
+        if fill not in FILL_MODES:
+            raise ValueError(f"Unknown fill mode: {fill} (expected one of {FILL_MODES})")
+        self.strategy = strategy
+        self.source = source
+        self.speed = speed or None
+        self.fill = fill
+        self.warmup = warmup
+        self.max_delay = max_delay
+        self.chunksize = chunksize
+        self.queue_size = queue_size
+
+        self.bars = 0
+        self.trades = []
+        self.latencies = {event_type: [] for event_type in EVENT_TYPES}
+        self.bar_latencies = []
+        self.update_latencies = []
+        self.elapsed = 0.0
+        self._entry_price = None
+
+    async def _feed(self, queue: asyncio.Queue):
+        """Put (arrival_ns, bar) on the queue at event-time pace, then None"""
+        cancelled = False
+        try:
+            start_ns = time.perf_counter_ns()
+            target = 0.0
+            prev_ts = None
+            for chunk in iter_chunks(self.source, self.chunksize):
+                columns = {col: chunk[col].to_numpy(dtype=float) for col in OHLCV_COLUMNS}
+                for i, ts in enumerate(chunk.index):
+                    if self.speed is not None and prev_ts is not None:
+                        delay = (ts - prev_ts).total_seconds() / self.speed
+                        if self.max_delay is not None:
+                            delay = min(delay, self.max_delay)
+                        target += max(delay, 0.0)
+                        wait = target - (time.perf_counter_ns() - start_ns) / 1e9
+                        if wait > 0:
+                            await asyncio.sleep(wait)
+                    prev_ts = ts
+                    bar = {col: float(values[i]) for col, values in columns.items()}
+                    bar['timestamp'] = ts
+                    if self.speed is not None:
+                        arrival = start_ns + int(target * 1e9)
+                    else:
+                        arrival = time.perf_counter_ns()
+                    await queue.put((arrival, bar))
+                # Let the strategy loop drain the queue between file reads
+                await asyncio.sleep(0)
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+        finally:
+            # The end marker also wakes the strategy loop after a read error;
+            # when the loop stopped early and cancelled the feed, nobody waits
+            # for it (and the queue may be full)
+            if not cancelled:
+                await queue.put(None)
+
+    def _trade(self, action: str, price: float, timestamp, index: int) -> dict:
+        """Record a fill in the trade_log format"""
+        trade = {
+            'trade_number': len(self.trades) + 1,
+            'action': action,
+            'price': round(price, 2),
+            'date': timestamp.strftime('%Y-%m-%d %H:%M:%S'),
+            'candle_index': index,
+        }
+        if action == 'BUY':
+            self._entry_price = price
+        else:
+            trade['pnl_percent'] = round((price - self._entry_price) / self._entry_price * 100.0, 2)
+        self.trades.append(trade)
+        return trade
+
+    def _event(self, event_type: str, arrival: int, **fields) -> dict:
+        """Build an event and record its latency since the bar arrived"""
+        latency = time.perf_counter_ns() - arrival
+        self.latencies[event_type].append(latency)
+        return {'type': event_type, 'latency_ns': latency, **fields}
+
+    async def events(self):
+        """
+        Replay the source and yield events
+
+        Yields:
+            {'type': 'signal', 'index', 'timestamp', 'signal', 'close', 'latency_ns'}
+            for every BUY (1) or SELL (-1) signal after warmup, and
+            {'type': 'fill', 'index', 'timestamp', 'trade', 'latency_ns'} for
+            every position change, with trade in the trade_log format
+        """
+        self.strategy.reset()
+        self.bars = 0
+        self.trades = []
+        self.latencies = {event_type: [] for event_type in EVENT_TYPES}
+        self.bar_latencies = []
+        self.update_latencies = []
+        self._entry_price = None
+        long = False
+        pending = None
+
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        feed = asyncio.create_task(self._feed(queue))
+        started = time.perf_counter()
+        try:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    break
+                arrival, bar = item
+                index = self.bars
+                self.bars += 1
+                ts = bar['timestamp']
+
+                emitted = []
+                if pending is not None:
+                    trade = self._trade(pending, bar['open'], ts, index)
+                    emitted.append(self._event('fill', arrival, index=index, timestamp=ts, trade=trade))
+                    pending = None
+
+                update_start = time.perf_counter_ns()
+                signal = self.strategy.update(bar)
+                self.update_latencies.append(time.perf_counter_ns() - update_start)
+                if signal and index >= self.warmup:
+                    emitted.append(self._event('signal', arrival, index=index, timestamp=ts,
+                                               signal=signal, close=bar['close']))
+                    if (signal > 0) != long:
+                        long = signal > 0
+                        action = 'BUY' if long else 'SELL'
+                        if self.fill == 'close':
+                            trade = self._trade(action, bar['close'], ts, index)
+                            emitted.append(self._event('fill', arrival, index=index, timestamp=ts, trade=trade))
+                        else:
+                            pending = action
+                self.bar_latencies.append(time.perf_counter_ns() - arrival)
+
+                # A bar's events are complete before the consumer sees the first one
+                for event in emitted:
+                    yield event
+            await feed
+        finally:
+            feed.cancel()
+            await asyncio.gather(feed, return_exceptions=True)
+            self.elapsed = time.perf_counter() - started
+
+    def summary(self) -> dict:
+        """
+        Summarize the last replay
+
+        Returns:
+            Dictionary with bars, trades, elapsed, bars_per_sec and latency
+            percentiles (microseconds): 'bar' (arrival to fully processed),
+            'update' (strategy.update alone) and one entry per event type
+        """
+        return {
+            'bars': self.bars,
+            'trades': len(self.trades),
+            'elapsed': self.elapsed,
+            'bars_per_sec': self.bars / self.elapsed if self.elapsed > 0 else 0.0,
+            'latency': {
+                'bar': latency_percentiles(self.bar_latencies),
+                'update': latency_percentiles(self.update_latencies),
+                **{event_type: latency_percentiles(values) for event_type, values in self.latencies.items()},
+            },
+        }
+
+
+def run_replay(strategy, source, **settings) -> tuple:
+    """
+    Replay a source to the end and collect its events
+
+    Args:
+        strategy: Strategy instance with an incremental update(bar)
+        source: CSV or Parquet path, or a DataFrame of bars
+        **settings: ReplayEngine settings (speed, fill, warmup, max_delay, ...)
+
+    Returns:
+        (events, summary)
+    """
+    engine = ReplayEngine(strategy, source, **settings)
+
+    async def collect():
+        return [event async for event in engine.events()]
+
+    events = asyncio.run(collect())
+    return events, engine.summary()
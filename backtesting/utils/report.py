@@ -0,0 +1,419 @@
+"""
+HTML Report Rendering
+
+Renders stored optimizer runs (see utils.result_store) into standalone HTML
+reports on demand, using the same layout as the reports the OpenCL optimizer
+writes next to each results JSON.
+
+Reports are written in a streaming fashion so cost stays proportional to the
+number of plotted points rather than the number of bars:
+- Price data is read from CSV in chunks and the price/equity curves are
+  reduced with streaming min/max decimation to at most `max_points` points.
+- The trade log is written as paginated JSON blocks that the browser only
+  parses when a page is shown.
+
+Trades are placed by candle_index, relative to the first bar the run was
+evaluated on. Before plotting, locate_run finds that bar in the price file
+and checks the file still holds the run's bars (dataset checksum for runs
+that store one, trade prices for older imported runs); a mismatch raises
+ValueError instead of plotting misaligned curves.
+"""
+
+import html
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .data_loader import dataset_checksum, load_data
+
+
+_STYLE = """
+    * { margin: 0; padding: 0; box-sizing: border-box; }
+    body { font-family: 'Segoe UI', system-ui, sans-serif; background: #0a0e17; color: #e4e4e7; padding: 20px; }
+    .container { max-width: 1400px; margin: 0 auto; }
+    h1 { font-size: 2.5rem; margin-bottom: 10px; color: #60a5fa; }
+    h2 { font-size: 1.5rem; margin: 30px 0 15px; color: #a78bfa; border-bottom: 2px solid #374151; padding-bottom: 10px; }
+    .meta { color: #9ca3af; margin-bottom: 30px; font-size: 0.95rem; }
+    .meta span { margin-right: 20px; }
+    .metrics { display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 15px; margin-bottom: 30px; }
+    .metric-card { background: #1e293b; padding: 20px; border-radius: 8px; border-left: 4px solid #60a5fa; }
+    .metric-label { font-size: 0.85rem; color: #9ca3af; text-transform: uppercase; letter-spacing: 0.5px; }
+    .metric-value { font-size: 1.8rem; font-weight: 700; margin-top: 8px; }
+    .positive { color: #34d399; }
+    .negative { color: #f87171; }
+    .neutral { color: #60a5fa; }
+    .chart-container { background: #1e293b; padding: 20px; border-radius: 8px; margin-bottom: 30px; }
+    .params { background: #1e293b; padding: 20px; border-radius: 8px; margin-bottom: 30px; }
+    .param-grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(180px, 1fr)); gap: 12px; }
+    .param-item { padding: 10px; background: #0f172a; border-radius: 4px; }
+    .param-name { font-size: 0.8rem; color: #9ca3af; }
+    .param-value { font-size: 1.1rem; font-weight: 600; color: #e4e4e7; margin-top: 4px; }
+    .trades-table { width: 100%; background: #1e293b; border-radius: 8px; overflow: hidden; }
+    .pager { padding: 12px; color: #9ca3af; }
+    .pager button { background: #0f172a; color: #e4e4e7; border: 1px solid #374151; border-radius: 4px; padding: 4px 12px; margin: 0 6px; cursor: pointer; }
+    table { width: 100%; border-collapse: collapse; }
+    th { background: #0f172a; padding: 12px; text-align: left; font-weight: 600; color: #a78bfa; font-size: 0.85rem; text-transform: uppercase; }
+    td { padding: 12px; border-top: 1px solid #374151; }
+    tr:hover { background: #0f172a; }
+    .buy { color: #34d399; font-weight: 600; }
+    .sell { color: #f87171; font-weight: 600; }
+"""
+
+_SCRIPT = """
+    const pages = document.querySelectorAll('script.trade-page');
+    let currentPage = 0;
+    function showPage(n) {
+      if (pages.length === 0) return;
+      currentPage = Math.max(0, Math.min(pages.length - 1, n));
+      const trades = JSON.parse(pages[currentPage].textContent);
+      document.getElementById('tradesBody').innerHTML = trades.map(t => {
+        const pnl = t.pnl_percent;
+        const pnlClass = pnl === undefined ? '' : (pnl > 0 ? 'positive' : 'negative');
+        const pnlText = pnl === undefined ? '-' : (pnl > 0 ? '+' : '') + pnl.toFixed(2) + '%';
+        return `<tr><td>${t.trade_number}</td><td class="${t.action.toLowerCase()}">${t.action}</td><td>$${t.price.toFixed(2)}</td><td>${t.date}</td><td class="${pnlClass}">${pnlText}</td></tr>`;
+      }).join('');
+      document.getElementById('pageInfo').textContent = `Page ${currentPage + 1} of ${pages.length}`;
+    }
+    showPage(0);
+
+    const chartData = JSON.parse(document.getElementById('chartData').textContent);
+    const timeTick = v => new Date(v).toISOString().slice(0, 10);
+    const datasets = [
+      { label: 'Price', data: chartData.price, borderColor: '#60a5fa', borderWidth: 1, pointRadius: 0, yAxisID: 'y' },
+      { label: 'Equity', data: chartData.equity, borderColor: '#a78bfa', borderWidth: 1, pointRadius: 0, yAxisID: 'y1' },
+      { label: 'Trades', type: 'scatter', data: chartData.trades, yAxisID: 'y', pointRadius: 4,
+        pointBackgroundColor: chartData.trades.map(t => t.action === 'BUY' ? '#34d399' : '#f87171') }
+    ];
+    new Chart(document.getElementById('priceChart').getContext('2d'), {
+      type: 'line',
+      data: { datasets: datasets },
+      options: {
+        responsive: true, aspectRatio: 2.5, animation: false, parsing: false, normalized: true,
+        plugins: { legend: { labels: { color: '#e4e4e7' } } },
+        scales: {
+          x: { type: 'linear', ticks: { color: '#9ca3af', maxTicksLimit: 12, callback: timeTick }, grid: { color: '#374151' } },
+          y: { position: 'left', ticks: { color: '#9ca3af' }, grid: { color: '#374151' } },
+          y1: { position: 'right', ticks: { color: '#a78bfa' }, grid: { drawOnChartArea: false } }
+        }
+      }
+    });
+"""
+
+METRIC_LABELS = [
+    ('total_return', 'Total Return', '%'),
+    ('max_drawdown', 'Max Drawdown', '%'),
+    ('calmar_ratio', 'Calmar Ratio', ''),
+    ('sharpe_ratio', 'Sharpe Ratio', ''),
+    ('total_trades', 'Total Trades', ''),
+    ('buy_hold_return', 'Buy & Hold', '%'),
+    ('outperformance', 'Outperformance', '%'),
+]
+
+
+class MinMaxDecimator:
+    """
+    Streaming min/max decimation of a series to a bounded number of points.
+
+    Samples are grouped into fixed-size buckets and only the minimum and
+    maximum of each bucket are kept. When the number of buckets exceeds the
+    budget, adjacent buckets are merged and the bucket size doubles, so memory
+    stays O(max_points) no matter how many samples are added.
+    """
+
+    def __init__(self, max_points: int = 2000):
+        self.max_buckets = max(1, max_points // 2)
+        self.bucket_size = 1
+        self.count = 0
+        empty = np.empty(0)
+        self._xmin, self._ymin, self._xmax, self._ymax = empty, empty, empty, empty
+        self._pending_x, self._pending_y = empty, empty
+
+    def add(self, x, y):
+        """Add a chunk of samples (x must be increasing)"""
+        x = np.concatenate([self._pending_x, np.asarray(x, dtype=float)])
+        y = np.concatenate([self._pending_y, np.asarray(y, dtype=float)])
+        self.count += len(x) - len(self._pending_x)
+
+        n_full = len(x) // self.bucket_size
+        if n_full:
+            size = n_full * self.bucket_size
+            xb = x[:size].reshape(n_full, self.bucket_size)
+            yb = y[:size].reshape(n_full, self.bucket_size)
+            rows = np.arange(n_full)
+            imin = yb.argmin(axis=1)
+            imax = yb.argmax(axis=1)
+            self._xmin = np.concatenate([self._xmin, xb[rows, imin]])
+            self._ymin = np.concatenate([self._ymin, yb[rows, imin]])
+            self._xmax = np.concatenate([self._xmax, xb[rows, imax]])
+            self._ymax = np.concatenate([self._ymax, yb[rows, imax]])
+            x, y = x[size:], y[size:]
+        self._pending_x, self._pending_y = x, y
+
+        while len(self._xmin) > self.max_buckets:
+            self._merge_pairs()
+
+    def _merge_pairs(self):
+        """Merge adjacent buckets, halving the bucket count"""
+        n_pairs = len(self._xmin) // 2
+        size = n_pairs * 2
+        rows = np.arange(n_pairs)
+
+        ymin = self._ymin[:size].reshape(n_pairs, 2)
+        xmin = self._xmin[:size].reshape(n_pairs, 2)
+        pick = ymin.argmin(axis=1)
+        new_xmin, new_ymin = xmin[rows, pick], ymin[rows, pick]
+
+        ymax = self._ymax[:size].reshape(n_pairs, 2)
+        xmax = self._xmax[:size].reshape(n_pairs, 2)
+        pick = ymax.argmax(axis=1)
+        new_xmax, new_ymax = xmax[rows, pick], ymax[rows, pick]
+
+        # An odd trailing bucket is kept as-is
+        self._xmin = np.concatenate([new_xmin, self._xmin[size:]])
+        self._ymin = np.concatenate([new_ymin, self._ymin[size:]])
+        self._xmax = np.concatenate([new_xmax, self._xmax[size:]])
+        self._ymax = np.concatenate([new_ymax, self._ymax[size:]])
+        self.bucket_size *= 2
+
+    def points(self) -> tuple:
+        """
+        Return the decimated series
+
+        Returns:
+            (x, y) arrays in increasing x order, at most max_points + 2 long
+        """
+        xs = [self._xmin, self._xmax]
+        ys = [self._ymin, self._ymax]
+        if len(self._pending_x):
+            i, j = self._pending_y.argmin(), self._pending_y.argmax()
+            xs += [self._pending_x[[i]], self._pending_x[[j]]]
+            ys += [self._pending_y[[i]], self._pending_y[[j]]]
+        x = np.concatenate(xs)
+        y = np.concatenate(ys)
+        x, keep = np.unique(x, return_index=True)
+        return x, y[keep]
+
+
+def _metric_class(key: str, value) -> str:
+    """Return the CSS class used to color a metric value"""
+    if value is None or key in ('calmar_ratio', 'sharpe_ratio', 'total_trades'):
+        return 'neutral'
+    if key == 'max_drawdown':
+        return 'negative'
+    return 'positive' if value > 0 else 'negative'
+
+
+def _json_block(obj) -> str:
+    """Serialize an object for embedding inside a <script> element"""
+    return json.dumps(obj, separators=(',', ':')).replace('</', '<\\/')
+
+
+def locate_run(prices, result: dict, chunksize: int = 50000) -> int:
+    """
+    Find a run's first bar in a price CSV and check the file holds its bars
+
+    Runs with a stored dataset fingerprint are located by their first bar's
+    timestamp and verified by checksum. Older runs (imported OpenCL JSON) are
+    assumed to start at the first row and verified by their trade prices,
+    which must equal the close (or next-open) at each candle_index.
+
+    Args:
+        prices: OHLCV CSV path
+        result: Run dictionary
+        chunksize: CSV rows read per chunk while searching
+
+    Returns:
+        Row of the run's first bar in the file
+
+    Raises:
+        ValueError: The file no longer holds the bars the run used
+    """
+    dataset = result.get('dataset')
+    if dataset:
+        row = None
+        offset = 0
+        for chunk in pd.read_csv(prices, usecols=['Timestamp'], chunksize=chunksize):
+            hits = np.flatnonzero(chunk['Timestamp'].to_numpy(dtype=np.int64) == dataset['start'])
+            if len(hits):
+                row = offset + int(hits[0])
+                break
+            offset += len(chunk)
+        if row is None:
+            raise ValueError(f"{prices} does not contain the run's first bar "
+                             f"({pd.Timestamp(dataset['start'], unit='s')})")
+        data = load_data(prices, start=row, nrows=dataset['bars'])
+        if len(data) != dataset['bars'] or dataset_checksum(data) != dataset['checksum']:
+            raise ValueError(f"{prices} has changed since the run (dataset checksum mismatch)")
+        return row
+
+    trades = result.get('trades', [])
+    if trades:
+        last = max(t['candle_index'] for t in trades)
+        bars = pd.read_csv(prices, usecols=['Open', 'Close'], nrows=last + 1)
+        for trade in trades:
+            idx = trade['candle_index']
+            if idx >= len(bars) or not np.isclose(
+                    [bars['Close'].iat[idx], bars['Open'].iat[idx]], trade['price'], rtol=0, atol=0.01).any():
+                raise ValueError(f"{prices} does not match the run: trade {trade['trade_number']} "
+                                 f"at candle {idx} was filled at {trade['price']}")
+    return 0
+
+
+def _stream_curves(prices, trades: list, initial_capital: float,
+                   max_points: int, chunksize: int, start: int = 0, nrows: int = None) -> tuple:
+    """
+    Stream a price CSV and decimate the price and equity curves.
+
+    Only the run's rows are read: nrows bars from row start, the bar that
+    candle_index 0 refers to.
+
+    Equity follows the optimizer's all-in, long-only model: BUY converts all
+    cash to shares at the trade price, SELL converts back.
+
+    Returns:
+        (price_decimator, equity_decimator, {candle_index: timestamp_ms})
+    """
+    price_dec = MinMaxDecimator(max_points)
+    equity_dec = MinMaxDecimator(max_points)
+    trade_times = {}
+
+    events = sorted(trades, key=lambda t: t['candle_index'])
+    event_pos = 0
+    cash, shares = float(initial_capital), 0.0
+    offset = 0
+
+    for chunk in pd.read_csv(prices, usecols=['Timestamp', 'Close'], chunksize=chunksize,
+                             skiprows=range(1, start + 1), nrows=nrows):
+        n = len(chunk)
+        times = chunk['Timestamp'].to_numpy(dtype=np.int64) * 1000
+        close = chunk['Close'].to_numpy(dtype=float)
+
+        # Holdings at each bar close; piecewise constant between trades
+        cash_arr = np.empty(n)
+        shares_arr = np.empty(n)
+        seg = 0
+        while event_pos < len(events) and events[event_pos]['candle_index'] < offset + n:
+            trade = events[event_pos]
+            i = trade['candle_index'] - offset
+            cash_arr[seg:i] = cash
+            shares_arr[seg:i] = shares
+            if trade['action'] == 'BUY' and shares == 0:
+                shares, cash = cash / trade['price'], 0.0
+            elif trade['action'] == 'SELL' and shares > 0:
+                shares, cash = 0.0, shares * trade['price']
+            if i >= 0:
+                trade_times[trade['candle_index']] = int(times[i])
+            seg = max(i, 0)
+            event_pos += 1
+        cash_arr[seg:] = cash
+        shares_arr[seg:] = shares
+
+        price_dec.add(times, close)
+        equity_dec.add(times, cash_arr + shares_arr * close)
+        offset += n
+
+    return price_dec, equity_dec, trade_times
+
+
+def render_html(result: dict, path, prices=None, initial_capital: float = 10000.0,
+                max_points: int = 2000, page_size: int = 100, chunksize: int = 50000) -> str:
+    """
+    Render a run to a standalone HTML report.
+
+    Args:
+        result: Run dictionary in the optimizer JSON format
+        path: Output HTML file path
+        prices: Optional OHLCV CSV the run was optimized on; when given the
+            report plots decimated price and equity curves over the run's bars
+        initial_capital: Starting capital used to rebuild the equity curve
+        max_points: Maximum plotted points per curve
+        page_size: Trades per page in the trade log
+        chunksize: CSV rows read per chunk
+
+    Returns:
+        Path of the written report
+
+    Raises:
+        ValueError: prices no longer holds the bars the run used (see locate_run)
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    ticker = html.escape(result['ticker'])
+    interval = html.escape(result['interval'])
+    strategy = html.escape(result['strategy'])
+    trades = result.get('trades', [])
+
+    # Chart data: decimated curves plus (at most max_points) trade markers
+    if prices is not None and Path(prices).exists():
+        start = locate_run(prices, result, chunksize)
+        nrows = result['dataset']['bars'] if result.get('dataset') else None
+        price_dec, equity_dec, trade_times = _stream_curves(
+            prices, trades, initial_capital, max_points, chunksize, start, nrows
+        )
+        price_x, price_y = price_dec.points()
+        equity_x, equity_y = equity_dec.points()
+        marked = [t for t in trades if t['candle_index'] in trade_times]
+        marker_x = lambda t: trade_times[t['candle_index']]
+    else:
+        price_x, price_y = np.empty(0), np.empty(0)
+        equity_x, equity_y = np.empty(0), np.empty(0)
+        marked = trades
+        marker_x = lambda t: int(pd.Timestamp(t['date']).value // 10**6)
+    if len(marked) > max_points:
+        keep = np.linspace(0, len(marked) - 1, max_points).astype(int)
+        marked = [marked[i] for i in keep]
+
+    with open(path, 'w') as f:
+        f.write('<!DOCTYPE html>\n<html lang="en">\n<head>\n  <meta charset="UTF-8">\n')
+        f.write(f'  <title>{ticker} {interval} - {strategy} Results</title>\n')
+        f.write('  <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>\n')
+        f.write(f'  <style>{_STYLE}  </style>\n</head>\n<body>\n  <div class="container">\n')
+        f.write(f'    <h1>{ticker} {interval} Strategy Results</h1>\n')
+        f.write(f'    <div class="meta"><span><strong>Strategy:</strong> {strategy}</span>'
+                f'<span><strong>Run:</strong> {html.escape(str(result.get("timestamp", "")))}</span>'
+                f'<span><strong>Candles:</strong> {result.get("candles", "")}</span></div>\n')
+
+        f.write('    <h2>Performance Metrics</h2>\n    <div class="metrics">\n')
+        performance = result.get('performance', {})
+        for key, label, suffix in METRIC_LABELS:
+            value = performance.get(key)
+            text = '-' if value is None else f"{value:.2f}{suffix}"
+            f.write(f'      <div class="metric-card"><div class="metric-label">{label}</div>'
+                    f'<div class="metric-value {_metric_class(key, value)}">{text}</div></div>\n')
+        f.write('    </div>\n')
+
+        f.write('    <h2>Price Chart with Trades</h2>\n    <div class="chart-container"><canvas id="priceChart"></canvas></div>\n')
+
+        f.write('    <h2>Optimized Parameters</h2>\n    <div class="params"><div class="param-grid">\n')
+        for key, value in result.get('parameters', {}).items():
+            f.write(f'      <div class="param-item"><div class="param-name">{html.escape(key.replace("_", " "))}</div>'
+                    f'<div class="param-value">{value}</div></div>\n')
+        f.write('    </div></div>\n')
+
+        f.write('    <h2>Trade Log</h2>\n    <div class="trades-table"><table>\n')
+        f.write('      <thead><tr><th>#</th><th>Action</th><th>Price</th><th>Date</th><th>P&amp;L</th></tr></thead>\n')
+        f.write('      <tbody id="tradesBody"></tbody>\n    </table>\n')
+        f.write('    <div class="pager"><button onclick="showPage(currentPage - 1)">&lsaquo; Prev</button>'
+                '<span id="pageInfo"></span><button onclick="showPage(currentPage + 1)">Next &rsaquo;</button></div>\n')
+        f.write('    </div>\n  </div>\n')
+
+        # Trade pages are inert JSON until displayed
+        for start in range(0, len(trades), page_size):
+            f.write('  <script type="application/json" class="trade-page">')
+            f.write(_json_block(trades[start:start + page_size]))
+            f.write('</script>\n')
+
+        f.write('  <script type="application/json" id="chartData">{"price":')
+        f.write(_json_block([{'x': int(x), 'y': round(float(y), 4)} for x, y in zip(price_x, price_y)]))
+        f.write(',"equity":')
+        f.write(_json_block([{'x': int(x), 'y': round(float(y), 2)} for x, y in zip(equity_x, equity_y)]))
+        f.write(',"trades":')
+        f.write(_json_block([{'x': marker_x(t), 'y': t['price'], 'action': t['action']} for t in marked]))
+        f.write('}</script>\n')
+
+        f.write(f'  <script>{_SCRIPT}  </script>\n</body>\n</html>\n')
+
+    return str(path)
@@ -0,0 +1,195 @@
+"""
+Result Cache - Persistent memoization of candidate evaluations
+
+The optimizer consults this cache before evaluating a parameter set, so
+overlapping sweeps (e.g. after nudging FAST_LOW_1H or a SEARCH_PERCENT_*
+value) only pay for the new points.
+
+Entries are keyed by:
+- dataset checksum (bar contents, see utils.data_loader.dataset_checksum)
+- date range of the evaluated data
+- strategy version (hash of the strategy, its base classes, the indicator
+  modules they use and the simulator source)
+- canonical parameters from strategy.get_parameters() plus simulation settings
+
+The cache is size-bounded: when it grows past max_entries, the least
+recently used entries are evicted.
+"""
+
+import hashlib
+import inspect
+import json
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+from . import simulator
+from .result_store import canonical_params
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache (
+    key TEXT PRIMARY KEY,
+    result TEXT NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_cache_last_used ON cache (last_used);
+"""
+
+# Writes are committed in batches; lookups and inserts stay cheap
+COMMIT_EVERY = 1000
+
+
+def strategy_modules(strategy) -> list:
+    """
+    Return the modules whose source determines a strategy's results
+
+    These are the modules of every class in the strategy's MRO within the
+    strategy's top-level package, plus the modules they import from it (e.g.
+    strategies.indicators), and the simulator.
+    """
+    package = type(strategy).__module__.split('.', 1)[0]
+    modules = []
+    for cls in type(strategy).__mro__:
+        module = sys.modules.get(cls.__module__)
+        if module is None or module.__name__.split('.', 1)[0] != package:
+            continue
+        dependencies = [value for value in vars(module).values()
+                        if inspect.ismodule(value) and value.__name__.split('.', 1)[0] == package]
+        for dependency in [module] + dependencies:
+            if dependency not in modules:
+                modules.append(dependency)
+    modules.append(simulator)
+    return modules
+
+
+def strategy_version(strategy) -> str:
+    """
+    Return a version hash for a strategy instance
+
+    Derived from the source of strategy_modules(strategy), so editing the
+    strategy, a base class, a shared indicator or the simulator invalidates
+    previously cached results automatically.
+    """
+    h = hashlib.sha1()
+    for module in strategy_modules(strategy):
+        try:
+            h.update(inspect.getsource(module).encode('utf-8'))
+        except (OSError, TypeError):
+            h.update(module.__name__.encode('utf-8'))
+    return h.hexdigest()[:16]
+
+
+def make_key(dataset: str, start, end, version: str, params: dict) -> str:
+    """
+    Build a cache key
+
+    Args:
+        dataset: Dataset checksum
+        start, end: First and last timestamp of the evaluated data
+        version: Strategy version (see strategy_version)
+        params: Strategy parameters and simulation settings
+    """
+    payload = json.dumps([dataset, str(start), str(end), version, canonical_params(params)],
+                         sort_keys=True, separators=(',', ':'))
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+class ResultCache:
+    """
+    SQLite-backed LRU cache of evaluation results
+
+    Tracks hits and misses for the current session; see report().
+    """
+
+    def __init__(self, path: str = 'result_cache.db', max_entries: int = 1_000_000):
+        """
+        Open (or create) a result cache
+
+        Args:
+            path: SQLite database file, or ':memory:'
+            max_entries: Maximum number of cached results before eviction
+        """
+        self.path = str(path)
+        if self.path != ':memory:':
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.conn = sqlite3.connect(self.path)
+        self.conn.executescript(_SCHEMA)
+        self._size = self.conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+        self._pending = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def close(self):
+        """Flush pending writes and close the underlying database connection"""
+        self.flush()
+        self.conn.close()
+
+    def flush(self):
+        """Commit pending writes"""
+        self.conn.commit()
+        self._pending = 0
+
+    def _wrote(self):
+        """Count a write, committing in batches to keep lookups cheap"""
+        self._pending += 1
+        if self._pending >= COMMIT_EVERY:
+            self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def get(self, key: str):
+        """Return the cached result for a key, or None"""
+        row = self.conn.execute("SELECT result FROM cache WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.conn.execute("UPDATE cache SET last_used = ? WHERE key = ?", (time.time(), key))
+        self._wrote()
+        return json.loads(row[0])
+
+    def put(self, key: str, result: dict):
+        """Store a result, evicting least recently used entries if over capacity"""
+        cursor = self.conn.execute(
+            "INSERT OR IGNORE INTO cache (key, result, last_used) VALUES (?, ?, ?)",
+            (key, json.dumps(result), time.time()),
+        )
+        self._size += cursor.rowcount
+        self._wrote()
+        self._evict()
+
+    def _evict(self):
+        """Trim the cache back to max_entries, least recently used first"""
+        excess = self._size - self.max_entries
+        if excess <= 0:
+            return
+        self.conn.execute(
+            "DELETE FROM cache WHERE key IN "
+            "(SELECT key FROM cache ORDER BY last_used ASC LIMIT ?)",
+            (excess,),
+        )
+        self._size -= excess
+        self.evictions += excess
+        self._wrote()
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache this session"""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def report(self) -> str:
+        """Return a one-line summary of cache usage"""
+        return (f"Cache: {self.hits} hits, {self.misses} misses ({self.hit_rate * 100:.1f}% hit rate), "
+                f"{self.evictions} evicted, {len(self)}/{self.max_entries} entries")
@@ -0,0 +1,368 @@
+"""
+Result Store - Indexed, append-only storage for optimizer runs
+
+Replaces the per-run JSON/HTML file pairs written to
+results/<ticker>/<interval>/ with a single SQLite database. Every run is
+keyed by ticker, interval, strategy, parameter hash and timestamp so that
+cross-ticker comparisons are a single indexed query instead of a directory
+walk. HTML reports are rendered on demand from stored runs (see utils.report).
+
+Typical usage:
+    store = ResultStore('results.db')
+    store.import_results_dir('strategies')
+    store.best_runs('calmar_ratio', since=datetime.now() - timedelta(days=7))
+    store.runs_with_parameters({'fast_length_low': 8, 'slow_length_low': 74, ...})
+
+Parameters are stored under the strategy's get_parameters() names. The
+OpenCL results JSON uses shorter names (fast_low, ...); canonical_params maps
+them, so a parameter set hashes the same whichever tool produced the run.
+"""
+
+import hashlib
+import json
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+
+
+# Performance metrics stored as indexed columns (matches optimizer JSON output)
+METRIC_COLUMNS = [
+    'total_return',
+    'max_drawdown',
+    'calmar_ratio',
+    'sharpe_ratio',
+    'total_trades',
+    'buy_hold_return',
+    'outperformance',
+]
+
+# Metrics where a lower value is better
+LOWER_IS_BETTER = {'max_drawdown'}
+
+RUN_TIMESTAMP_FORMAT = '%Y%m%d_%H%M%S'
+
+# OpenCL results JSON parameter name -> strategy.get_parameters() name
+PARAMETER_ALIASES = {
+    'fast_low': 'fast_length_low',
+    'slow_low': 'slow_length_low',
+    'fast_med': 'fast_length_med',
+    'slow_med': 'slow_length_med',
+    'fast_high': 'fast_length_high',
+    'slow_high': 'slow_length_high',
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    ticker TEXT NOT NULL,
+    interval TEXT NOT NULL,
+    strategy TEXT NOT NULL,
+    param_hash TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    run_time REAL NOT NULL,
+    candles INTEGER,
+    total_return REAL,
+    max_drawdown REAL,
+    calmar_ratio REAL,
+    sharpe_ratio REAL,
+    total_trades INTEGER,
+    buy_hold_return REAL,
+    outperformance REAL,
+    parameters TEXT NOT NULL,
+    trades TEXT NOT NULL,
+    source TEXT,
+    dataset TEXT,
+    UNIQUE (ticker, interval, strategy, param_hash, timestamp)
+);
+CREATE INDEX IF NOT EXISTS idx_runs_key ON runs (ticker, interval, strategy, run_time);
+CREATE INDEX IF NOT EXISTS idx_runs_params ON runs (param_hash, strategy);
+CREATE INDEX IF NOT EXISTS idx_runs_time ON runs (run_time);
+"""
+
+
+def canonical_params(params: dict) -> dict:
+    """
+    Normalize a parameter dictionary so equal parameter sets compare equal.
+
+    OpenCL parameter names are mapped to strategy parameter names (see
+    PARAMETER_ALIASES), keys are sorted and integral floats (8.0, as written
+    by the optimizer) are converted to ints.
+
+    Args:
+        params: Parameter dictionary
+
+    Returns:
+        New dictionary with canonical keys and values
+    """
+    canonical = {}
+    for key, value in params.items():
+        if isinstance(value, float) and value.is_integer():
+            value = int(value)
+        canonical[PARAMETER_ALIASES.get(key, key)] = value
+    return dict(sorted(canonical.items()))
+
+
+def param_hash(params: dict) -> str:
+    """Return a stable short hash of a parameter dictionary"""
+    payload = json.dumps(canonical_params(params), sort_keys=True, separators=(',', ':'))
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()[:16]
+
+
+def check_run_matches(run: dict, ticker: str, interval: str, strategy: str):
+    """
+    Check that a stored run belongs to a ticker, interval and strategy
+
+    Args:
+        run: Stored run (ResultStore.get_run)
+        ticker, interval, strategy: Expected values
+
+    Raises:
+        ValueError: The run was made for a different ticker, interval or strategy
+    """
+    expected = (ticker.upper(), interval.lower(), strategy)
+    actual = (run['ticker'], run['interval'], run['strategy'])
+    if actual != expected:
+        raise ValueError(f"Run {run['id']} is {' '.join(actual)}, not {' '.join(expected)}")
+
+
+class ResultStore:
+    """
+    SQLite-backed store of optimizer runs.
+
+    Runs are only ever inserted; importing the same run twice is a no-op.
+    """
+
+    def __init__(self, path: str = 'results.db'):
+        """
+        Open (or create) a result store
+
+        Args:
+            path: SQLite database file, or ':memory:'
+        """
+        self.path = str(path)
+        if self.path != ':memory:':
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(_SCHEMA)
+        self._migrate_dataset_column()
+        self._migrate_parameter_names()
+
+    def _migrate_dataset_column(self):
+        """Add the dataset column to stores created before it existed"""
+        columns = {row['name'] for row in self.conn.execute("PRAGMA table_info(runs)")}
+        if 'dataset' not in columns:
+            with self.conn:
+                self.conn.execute("ALTER TABLE runs ADD COLUMN dataset TEXT")
+
+    def _migrate_parameter_names(self):
+        """Rewrite runs stored under OpenCL parameter names to canonical names and hashes"""
+        rows = self.conn.execute(
+            "SELECT id, parameters FROM runs WHERE "
+            + ' OR '.join("parameters LIKE ?" for _ in PARAMETER_ALIASES),
+            [f'%"{alias}"%' for alias in PARAMETER_ALIASES],
+        ).fetchall()
+        with self.conn:
+            for row in rows:
+                params = canonical_params(json.loads(row['parameters']))
+                # A run imported under both names is the same run; keep one
+                self.conn.execute(
+                    "UPDATE OR REPLACE runs SET parameters = ?, param_hash = ? WHERE id = ?",
+                    (json.dumps(params, sort_keys=True), param_hash(params), row['id']),
+                )
+
+    def close(self):
+        """Close the underlying database connection"""
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def add_run(self, result: dict, source: str = None) -> int:
+        """
+        Append a run to the store.
+
+        Args:
+            result: Run dictionary in the optimizer JSON format (ticker, interval,
+                strategy, timestamp, candles, performance, parameters, trades and
+                optionally dataset, see utils.data_loader.dataset_fingerprint)
+            source: Optional origin of the run (e.g. imported JSON path)
+
+        Returns:
+            Row id of the run, or None if the run was already stored
+        """
+        timestamp = result.get('timestamp') or datetime.now().strftime(RUN_TIMESTAMP_FORMAT)
+        run_time = datetime.strptime(timestamp, RUN_TIMESTAMP_FORMAT).timestamp()
+        params = canonical_params(result.get('parameters', {}))
+        performance = result.get('performance', {})
+
+        row = {
+            'ticker': result['ticker'].upper(),
+            'interval': result['interval'].lower(),
+            'strategy': result['strategy'],
+            'param_hash': param_hash(params),
+            'timestamp': timestamp,
+            'run_time': run_time,
+            'candles': result.get('candles'),
+            'parameters': json.dumps(params, sort_keys=True),
+            'trades': json.dumps(result.get('trades', [])),
+            'source': source,
+            'dataset': json.dumps(result['dataset']) if result.get('dataset') else None,
+        }
+        for metric in METRIC_COLUMNS:
+            row[metric] = performance.get(metric)
+
+        columns = ', '.join(row)
+        placeholders = ', '.join(f':{c}' for c in row)
+        with self.conn:
+            cursor = self.conn.execute(
+                f"INSERT OR IGNORE INTO runs ({columns}) VALUES ({placeholders})", row
+            )
+        return cursor.lastrowid if cursor.rowcount else None
+
+    def import_json(self, path) -> int:
+        """
+        Import a single optimizer results JSON file
+
+        Returns:
+            Row id of the imported run, or None if it was already stored
+        """
+        with open(path) as f:
+            result = json.load(f)
+        return self.add_run(result, source=str(path))
+
+    def import_results_dir(self, root) -> int:
+        """
+        Import every optimizer results JSON file below a directory.
+
+        Args:
+            root: Directory to scan recursively, e.g. 'strategies'
+
+        Returns:
+            Number of newly imported runs
+        """
+        imported = 0
+        for path in sorted(Path(root).rglob('*.json')):
+            if 'results' not in path.parts:
+                continue
+            try:
+                if self.import_json(path) is not None:
+                    imported += 1
+            except (KeyError, ValueError) as e:
+                print(f"   ⚠️  Skipping {path}: {e}")
+        return imported
+
+    def get_run(self, run_id: int) -> dict:
+        """Return a stored run in the optimizer JSON format, or None"""
+        row = self.conn.execute("SELECT * FROM runs WHERE id = ?", (run_id,)).fetchone()
+        return self._row_to_result(row) if row is not None else None
+
+    def query(self, ticker: str = None, interval: str = None, strategy: str = None,
+              since: datetime = None, until: datetime = None, limit: int = None) -> list:
+        """
+        Return runs matching the given filters, newest first
+
+        Args:
+            ticker, interval, strategy: Optional exact-match filters
+            since, until: Optional run time bounds
+            limit: Maximum number of runs to return
+        """
+        where, args = self._filters(ticker, interval, strategy, since, until)
+        sql = f"SELECT * FROM runs {where} ORDER BY run_time DESC"
+        if limit:
+            sql += f" LIMIT {int(limit)}"
+        return [self._row_to_result(r) for r in self.conn.execute(sql, args)]
+
+    def best_runs(self, metric: str = 'calmar_ratio', group_by: str = 'ticker',
+                  ticker: str = None, interval: str = None, strategy: str = None,
+                  since: datetime = None, until: datetime = None) -> list:
+        """
+        Return the best run per group for a metric.
+
+        Example - best Calmar per ticker in the last week:
+            store.best_runs('calmar_ratio', since=datetime.now() - timedelta(days=7))
+
+        Args:
+            metric: One of METRIC_COLUMNS
+            group_by: 'ticker', 'interval', 'strategy' or 'param_hash'
+            ticker, interval, strategy, since, until: Optional filters
+
+        Returns:
+            List of runs (one per group) with the metric set, best first
+        """
+        if metric not in METRIC_COLUMNS:
+            raise ValueError(f"Unknown metric: {metric} (valid: {', '.join(METRIC_COLUMNS)})")
+        if group_by not in ('ticker', 'interval', 'strategy', 'param_hash'):
+            raise ValueError(f"Cannot group by: {group_by}")
+
+        order = 'ASC' if metric in LOWER_IS_BETTER else 'DESC'
+        where, args = self._filters(ticker, interval, strategy, since, until)
+        # Runs without the metric (e.g. imported JSON missing it) are not ranked
+        where = f"{where} AND {metric} IS NOT NULL" if where else f"WHERE {metric} IS NOT NULL"
+        sql = f"""
+            SELECT * FROM (
+                SELECT *, ROW_NUMBER() OVER (
+                    PARTITION BY {group_by} ORDER BY {metric} {order}, run_time DESC
+                ) AS rank
+                FROM runs {where}
+            ) WHERE rank = 1
+            ORDER BY {metric} {order}
+        """
+        return [self._row_to_result(r) for r in self.conn.execute(sql, args)]
+
+    def runs_with_parameters(self, params: dict, strategy: str = None) -> list:
+        """Return all runs that used exactly these parameters, newest first"""
+        sql = "SELECT * FROM runs WHERE param_hash = ?"
+        args = [param_hash(params)]
+        if strategy:
+            sql += " AND strategy = ?"
+            args.append(strategy)
+        sql += " ORDER BY run_time DESC"
+        return [self._row_to_result(r) for r in self.conn.execute(sql, args)]
+
+    def count(self) -> int:
+        """Return the number of stored runs"""
+        return self.conn.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
+
+    @staticmethod
+    def _filters(ticker, interval, strategy, since, until) -> tuple:
+        """Build a WHERE clause and its arguments from optional filters"""
+        clauses = []
+        args = []
+        if ticker:
+            clauses.append("ticker = ?")
+            args.append(ticker.upper())
+        if interval:
+            clauses.append("interval = ?")
+            args.append(interval.lower())
+        if strategy:
+            clauses.append("strategy = ?")
+            args.append(strategy)
+        if since:
+            clauses.append("run_time >= ?")
+            args.append(since.timestamp())
+        if until:
+            clauses.append("run_time < ?")
+            args.append(until.timestamp())
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+        return where, args
+
+    @staticmethod
+    def _row_to_result(row: sqlite3.Row) -> dict:
+        """Convert a database row back into the optimizer JSON format"""
+        return {
+            'id': row['id'],
+            'ticker': row['ticker'],
+            'interval': row['interval'],
+            'strategy': row['strategy'],
+            'timestamp': row['timestamp'],
+            'candles': row['candles'],
+            'param_hash': row['param_hash'],
+            'performance': {metric: row[metric] for metric in METRIC_COLUMNS},
+            'parameters': json.loads(row['parameters']),
+            'trades': json.loads(row['trades']),
+            'dataset': json.loads(row['dataset']) if row['dataset'] else None,
+        }
@@ -0,0 +1,288 @@
+"""
+Robustness Engine - Monte Carlo and bootstrap tests for a parameter set
+
+A single backtest path says little about a parameter set. This module
+evaluates one strategy parameter set on thousands of alternative paths:
+
+- 'iid': bars resampled independently (destroys autocorrelation)
+- 'block': circular block bootstrap (keeps short-range structure such as
+  volatility clustering within each block)
+- 'random_entry': the real prices, with the strategy's holding periods
+  placed at random times (same number of trades and bars in the market)
+
+Bootstrap paths resample whole bars: the close-to-close log return plus the
+open/high/low of the bar relative to its close, so every synthetic bar keeps
+a valid OHLC shape. Each chunk is evaluated as (bars x paths) NumPy
+matrices: paths are generated together, signals come from the strategy's
+batch_signals, and simulate_paths applies the optimizer's trading model to
+every column at once.
+
+Chunks are seeded from numpy SeedSequence.spawn and have a fixed size, so
+results are reproducible for a seed and independent of the worker count.
+Chunks are spread over a process pool, so throughput scales with cores.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from .simulator import simulate, simulate_paths
+
+
+METHODS = ('iid', 'block', 'random_entry')
+METRICS = ('total_return', 'max_drawdown', 'calmar_ratio', 'sharpe_ratio', 'total_trades')
+
+DEFAULT_CHUNK_SIZE = 50
+
+# Per-process state set by _init_worker: (data, create_strategy, params, settings)
+_worker_state = None
+
+
+def bar_components(data: pd.DataFrame) -> dict:
+    """
+    Split bars into resamplable log components
+
+    Returns:
+        Dictionary of arrays for bars 1..n-1: 'ret' (close-to-close), 'gap'
+        (open vs previous close), 'high' and 'low' (vs own close), 'volume'
+    """
+    close = data['close'].to_numpy(dtype=float)
+    prev = close[:-1]
+    return {
+        'ret': np.log(close[1:] / prev),
+        'gap': np.log(data['open'].to_numpy(dtype=float)[1:] / prev),
+        'high': np.log(data['high'].to_numpy(dtype=float)[1:] / close[1:]),
+        'low': np.log(data['low'].to_numpy(dtype=float)[1:] / close[1:]),
+        'volume': data['volume'].to_numpy(dtype=float)[1:],
+    }
+
+
+def resample_indices(n: int, n_paths: int, rng: np.random.Generator, block_size: int = 1) -> np.ndarray:
+    """
+    Draw bootstrap indices into n bars for a batch of paths
+
+    Args:
+        n: Number of bars to sample from (and per path)
+        n_paths: Paths in the batch
+        rng: Random generator
+        block_size: 1 for iid, otherwise circular blocks of this length
+
+    Returns:
+        Integer array (n_paths x n)
+    """
+    if block_size <= 1:
+        return rng.integers(0, n, size=(n_paths, n))
+    n_blocks = -(-n // block_size)
+    starts = rng.integers(0, n, size=(n_paths, n_blocks, 1))
+    idx = (starts + np.arange(block_size)) % n
+    return idx.reshape(n_paths, -1)[:, :n]
+
+
+def bootstrap_paths(data: pd.DataFrame, n_paths: int, rng: np.random.Generator,
+                    block_size: int = 1) -> dict:
+    """
+    Generate synthetic OHLCV paths by resampling bars
+
+    The first bar is kept; every later bar is a resampled bar scaled to the
+    synthetic previous close.
+
+    Args:
+        data: DataFrame with open/high/low/close/volume
+        n_paths: Number of paths
+        rng: Random generator
+        block_size: 1 for iid, otherwise the block length
+
+    Returns:
+        Dictionary of open/high/low/close/volume arrays (n_paths x bars)
+    """
+    parts = bar_components(data)
+    idx = resample_indices(len(parts['ret']), n_paths, rng, block_size)
+
+    first = data.iloc[0]
+    log_close = np.log(first['close']) + np.cumsum(parts['ret'][idx], axis=1)
+    close = np.exp(np.concatenate([np.full((n_paths, 1), np.log(first['close'])), log_close], axis=1))
+    paths = {
+        'close': close,
+        'open': np.concatenate([np.full((n_paths, 1), first['open']),
+                                close[:, :-1] * np.exp(parts['gap'][idx])], axis=1),
+        'high': np.concatenate([np.full((n_paths, 1), first['high']),
+                                close[:, 1:] * np.exp(parts['high'][idx])], axis=1),
+        'low': np.concatenate([np.full((n_paths, 1), first['low']),
+                               close[:, 1:] * np.exp(parts['low'][idx])], axis=1),
+        'volume': np.concatenate([np.full((n_paths, 1), first['volume']), parts['volume'][idx]], axis=1),
+    }
+    return paths
+
+
+def random_entry_positions(position: np.ndarray, n_paths: int, rng: np.random.Generator,
+                           warmup: int = 0) -> np.ndarray:
+    """
+    Place a position series' holding periods at random times
+
+    The holding periods (runs of bars in the market) after warmup are
+    shuffled and spread over the window with uniformly random flat gaps, so
+    every path has the same trades and exposure as the strategy.
+
+    Args:
+        position: Long/flat position series (1.0 / 0.0)
+        n_paths: Number of paths
+        rng: Random generator
+        warmup: Bars kept flat at the start
+
+    Returns:
+        Float array (n_paths x bars) of positions
+    """
+    window = np.asarray(position, dtype=float)[warmup:]
+    n = len(window)
+    changes = np.diff(np.concatenate([[0.0], window, [0.0]]))
+    lengths = np.flatnonzero(changes < 0) - np.flatnonzero(changes > 0)
+    k = len(lengths)
+    positions = np.zeros((n_paths, warmup + n))
+    if k == 0:
+        return positions
+
+    # Choose which of the (flat bars + runs) slots are runs, then map slots to bars
+    flat = n - int(lengths.sum())
+    slots = np.sort(rng.random((n_paths, flat + k)).argsort(axis=1)[:, :k], axis=1)
+    runs = rng.permuted(np.broadcast_to(lengths, (n_paths, k)), axis=1)
+    before = np.cumsum(runs, axis=1) - runs
+    starts = slots - np.arange(k) + before
+
+    edges = np.zeros((n_paths, n + 1))
+    rows = np.repeat(np.arange(n_paths), k)
+    np.add.at(edges, (rows, starts.ravel()), 1.0)
+    np.add.at(edges, (rows, (starts + runs).ravel()), -1.0)
+    positions[:, warmup:] = np.cumsum(edges, axis=1)[:, :n]
+    return positions
+
+
+def position_to_signals(position: np.ndarray) -> np.ndarray:
+    """Convert long/flat positions (bars,) or (bars x paths) to BUY (1) / SELL (-1) signals"""
+    return np.diff(np.asarray(position, dtype=float), axis=0, prepend=0.0)
+
+
+def _init_worker(data, create_strategy, params, settings):
+    """Set the per-process evaluation state"""
+    global _worker_state
+    _worker_state = (data, create_strategy, params, settings)
+
+
+def _evaluate_chunk(task) -> np.ndarray:
+    """
+    Evaluate one chunk of paths
+
+    Args:
+        task: (method, n_paths, seed sequence, block_size)
+
+    Returns:
+        Array (n_paths x len(METRICS))
+    """
+    method, n_paths, seed, block_size = task
+    data, create_strategy, params, settings = _worker_state
+    rng = np.random.default_rng(seed)
+    strategy = create_strategy(params)
+
+    if method == 'random_entry':
+        signals = strategy.generate_signals(data)['signal']
+        base = simulate(data, signals, include_equity=True, **settings)['position'].to_numpy()
+        positions = random_entry_positions(base, n_paths, rng, settings.get('warmup', 0)).T
+        shape = positions.shape
+        close = np.broadcast_to(data['close'].to_numpy(dtype=float)[:, None], shape)
+        open_ = np.broadcast_to(data['open'].to_numpy(dtype=float)[:, None], shape)
+        signals = position_to_signals(positions)
+    else:
+        paths = bootstrap_paths(data, n_paths, rng, block_size if method == 'block' else 1)
+        bars = {col: values.T for col, values in paths.items()}
+        close, open_ = bars['close'], bars['open']
+        signals = strategy.batch_signals(bars, index=data.index)
+
+    metrics = simulate_paths(close, open_, signals, **settings)
+    return np.column_stack([metrics[m] for m in METRICS])
+
+
+def confidence_intervals(samples: dict, confidence: float = 0.95) -> dict:
+    """
+    Summarize metric samples
+
+    Args:
+        samples: Metric name -> array of per-path values
+        confidence: Two-sided interval coverage
+
+    Returns:
+        Metric name -> dict with mean, std, lower, median and upper
+    """
+    tail = (1.0 - confidence) / 2.0 * 100.0
+    summary = {}
+    for name, values in samples.items():
+        lower, median, upper = np.percentile(values, [tail, 50.0, 100.0 - tail])
+        summary[name] = {
+            'mean': float(np.mean(values)),
+            'std': float(np.std(values)),
+            'lower': float(lower),
+            'median': float(median),
+            'upper': float(upper),
+        }
+    return summary
+
+
+def run_robustness(data: pd.DataFrame, create_strategy, params: dict, method: str = 'block',
+                   n_paths: int = 1000, block_size: int = 20, seed: int = 0,
+                   workers: int = None, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                   confidence: float = 0.95, **settings) -> dict:
+    """
+    Evaluate a parameter set over Monte Carlo / bootstrap paths
+
+    Args:
+        data: Historical bars (utils.data_loader.load_data)
+        create_strategy: Strategy factory taking a parameter dictionary
+        params: Parameter set to test
+        method: 'iid', 'block' or 'random_entry'
+        n_paths: Number of paths
+        block_size: Block length for 'block'
+        seed: Seed for the root SeedSequence
+        workers: Worker processes (default: CPU count; 1 runs in-process)
+        chunk_size: Paths per task (part of the seeding, keep fixed to reproduce)
+        confidence: Confidence interval coverage
+        **settings: Simulation settings passed to simulate (warmup, costs, ...)
+
+    Returns:
+        Dictionary with 'actual' metrics on the real data, per-path 'samples',
+        'summary' confidence intervals, 'prob_loss' (share of paths with a
+        negative return) and 'p_value' (share of paths with a total return at
+        least the actual one; for random_entry, a low value means the timing
+        adds value)
+    """
+    if method not in METHODS:
+        raise ValueError(f"Unknown method: {method} (valid: {', '.join(METHODS)})")
+
+    sizes = [min(chunk_size, n_paths - start) for start in range(0, n_paths, chunk_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    tasks = [(method, size, s, block_size) for size, s in zip(sizes, seeds)]
+    state = (data, create_strategy, params, settings)
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(tasks) == 1:
+        _init_worker(*state)
+        chunks = [_evaluate_chunk(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks)),
+                                 initializer=_init_worker, initargs=state) as pool:
+            chunks = list(pool.map(_evaluate_chunk, tasks))
+
+    values = np.concatenate(chunks) if chunks else np.empty((0, len(METRICS)))
+    samples = {name: values[:, i] for i, name in enumerate(METRICS)}
+    actual = simulate(data, create_strategy(params).generate_signals(data)['signal'], **settings)
+    actual = {m: actual[m] for m in METRICS}
+
+    return {
+        'method': method,
+        'paths': int(len(values)),
+        'confidence': confidence,
+        'actual': actual,
+        'samples': samples,
+        'summary': confidence_intervals(samples, confidence),
+        'prob_loss': float((samples['total_return'] < 0).mean()) if len(values) else 0.0,
+        'p_value': float((1 + (samples['total_return'] >= actual['total_return']).sum()) / (len(values) + 1)),
+    }
@@ -0,0 +1,284 @@
+"""
+Vectorized Trade Simulator
+
+Simulates the optimizer's trading model on a signal series without a per-bar
+loop: long-only, BUY/SELL filled at the bar close. Metrics use the same
+definitions as the OpenCL optimizer's results JSON.
+
+Fill model (all vectorized, defaults reproduce the optimizer's cost-free model):
+- commission_bps: commission per side, in basis points of traded notional
+- slippage_bps: half-spread plus slippage per side, in basis points
+- fill: 'close' (signal bar close) or 'next_open' (open of the following bar)
+- position_size: fraction of equity held while long. It is rebalanced to
+  that fraction every bar, and the rebalancing trades pay commission and
+  slippage like entries and exits (turnover is measured from the weights
+  after the bar's price move), so a fractional size costs more than its
+  round trips alone
+
+simulate_paths runs the same model on many independent series at once
+(bars x paths matrices), e.g. bootstrap paths or randomized entries.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+# Approximate bars per year, used to annualize the Sharpe ratio
+BARS_PER_YEAR = {
+    '15m': 252 * 26,
+    '1h': 252 * 7,
+    '4h': 252 * 2,
+    '1d': 252,
+}
+
+FILL_MODES = ('close', 'next_open')
+
+
+def signals_to_position(signals, warmup: int = 0) -> np.ndarray:
+    """
+    Convert a BUY/SELL signal series into a long/flat position series
+
+    Args:
+        signals: Array-like of 1 (BUY), -1 (SELL) or 0, shape (bars,) or
+            (bars, columns)
+        warmup: Signals before this bar are ignored
+
+    Returns:
+        Float array of 1.0 (long after this bar's close) or 0.0 (flat)
+    """
+    signals = np.asarray(signals, dtype=float).copy()
+    signals[:warmup] = 0
+    state = pd.DataFrame(np.where(signals != 0, signals, np.nan).reshape(len(signals), -1)).ffill().fillna(0.0)
+    return (state.to_numpy() > 0).astype(float).reshape(signals.shape)
+
+
+def execution_factors(close: np.ndarray, open_: np.ndarray, weights: np.ndarray,
+                      fill: str = 'close', cost_bps: float = 0.0, combine: bool = True) -> np.ndarray:
+    """
+    Compute per-bar equity growth factors for target weights
+
+    Args:
+        close, open_: Prices (time x assets); open_ is only used for 'next_open'
+        weights: Target weights decided at each bar close (time x assets)
+        fill: 'close' executes at the decision bar's close, 'next_open' at
+            the following bar's open
+        cost_bps: Commission plus slippage per side, in basis points of the
+            traded notional (turnover from the drifted to the target weights)
+        combine: True for one portfolio of the assets; False treats every
+            column as a separate account
+
+    Returns:
+        Array of equity growth factors (1 + return) per bar, (time,) if
+        combined, otherwise (time x assets)
+    """
+    if fill not in FILL_MODES:
+        raise ValueError(f"Unknown fill: {fill} (valid: {', '.join(FILL_MODES)})")
+
+    # Weights actually held after execution at each bar, and before it
+    held = weights
+    if fill == 'next_open':
+        held = np.zeros_like(weights)
+        held[1:] = weights[:-1]
+    prev = np.zeros_like(held)
+    prev[1:] = held[:-1]
+    total = (lambda x: x.sum(axis=1)) if combine else (lambda x: x)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        if fill == 'close':
+            # Returns from the last execution up to this one
+            moved = np.zeros_like(close)
+            moved[1:] = close[1:] / close[:-1] - 1.0
+            moved = np.nan_to_num(moved, nan=0.0, posinf=0.0, neginf=0.0)
+            factors = 1.0 + total(prev * moved)
+        else:
+            # Previous weights ride the gap to the open, new weights the session
+            moved = np.zeros_like(close)
+            moved[1:] = open_[1:] / close[:-1] - 1.0
+            intra = close / open_ - 1.0
+            moved = np.nan_to_num(moved, nan=0.0, posinf=0.0, neginf=0.0)
+            intra = np.nan_to_num(intra, nan=0.0, posinf=0.0, neginf=0.0)
+            factors = (1.0 + total(prev * moved)) * (1.0 + total(held * intra))
+
+    if cost_bps:
+        # Trades run from the drifted weights (previous weights after the
+        # move) to the target, so holding a fraction or a mix of assets on
+        # target also pays for its rebalancing trades
+        with np.errstate(invalid='ignore', divide='ignore'):
+            value = 1.0 + total(prev * moved)
+            drifted = prev * (1.0 + moved) / (value[:, None] if combine else value)
+        drifted = np.nan_to_num(drifted, nan=0.0, posinf=0.0, neginf=0.0)
+        turnover = total(np.abs(held - drifted))
+        factors = factors * (1.0 - turnover * cost_bps / 10000.0)
+    return factors
+
+
+def equity_metrics(equity: np.ndarray, returns: np.ndarray, initial_capital: float,
+                   warmup: int = 0, bars_per_year: float = BARS_PER_YEAR['1h']) -> dict:
+    """
+    Compute return and risk metrics from an equity curve
+
+    Args:
+        equity: Equity per bar, (bars,) or one curve per column (bars x paths)
+        returns: Per-bar returns that produced the equity curve
+        initial_capital: Starting capital
+        warmup: Bars excluded from the metrics window
+        bars_per_year: Used to annualize the Sharpe ratio
+
+    Returns:
+        Dictionary with total_return, max_drawdown, calmar_ratio and
+        sharpe_ratio; floats for one curve, arrays (paths,) for a matrix
+    """
+    window = equity[warmup:]
+    peak = np.maximum.accumulate(window, axis=0)
+    if len(window):
+        max_drawdown = np.max(1.0 - window / peak, axis=0) * 100.0
+        total_return = (equity[-1] / initial_capital - 1.0) * 100.0
+    else:
+        max_drawdown = total_return = np.zeros(equity.shape[1:])
+    with np.errstate(invalid='ignore', divide='ignore'):
+        calmar = np.where(max_drawdown > 0, total_return / max_drawdown, 0.0)
+
+    active = returns[warmup + 1:]
+    std = active.std(axis=0) if len(active) > 1 else np.zeros(returns.shape[1:])
+    with np.errstate(invalid='ignore', divide='ignore'):
+        sharpe = np.where(std > 0, active.mean(axis=0) / std * np.sqrt(bars_per_year), 0.0) if len(active) else std
+
+    metrics = {
+        'total_return': total_return,
+        'max_drawdown': max_drawdown,
+        'calmar_ratio': calmar,
+        'sharpe_ratio': sharpe,
+    }
+    if np.ndim(equity) == 1:
+        metrics = {name: float(value) for name, value in metrics.items()}
+    return metrics
+
+
+def simulate(data: pd.DataFrame, signals, initial_capital: float = 10000.0,
+             warmup: int = 0, bars_per_year: float = BARS_PER_YEAR['1h'],
+             commission_bps: float = 0.0, slippage_bps: float = 0.0,
+             fill: str = 'close', position_size: float = 1.0,
+             include_equity: bool = False) -> dict:
+    """
+    Simulate trading a signal series
+
+    Args:
+        data: DataFrame with a 'close' column (and 'open' for fill='next_open')
+        signals: Array-like of 1 (BUY), -1 (SELL) or 0, aligned with data
+        initial_capital: Starting capital
+        warmup: Bars excluded from trading and from the metrics window
+        bars_per_year: Used to annualize the Sharpe ratio
+        commission_bps: Commission per side, in basis points
+        slippage_bps: Half-spread plus slippage per side, in basis points
+        fill: 'close' or 'next_open'
+        position_size: Fraction of equity held while long, rebalanced every bar
+        include_equity: Also return the 'equity' and 'position' series
+
+    Returns:
+        Dictionary with total_return, max_drawdown, calmar_ratio, sharpe_ratio,
+        total_trades (completed round trips), buy_hold_return and outperformance
+    """
+    close = data['close'].to_numpy(dtype=float)
+    open_ = data['open'].to_numpy(dtype=float) if fill == 'next_open' else close
+    position = signals_to_position(signals, warmup)
+
+    factors = execution_factors(close[:, None], open_[:, None], (position * position_size)[:, None],
+                                fill, commission_bps + slippage_bps)
+    strategy_returns = factors - 1.0
+
+    equity = initial_capital * np.cumprod(factors)
+    metrics = equity_metrics(equity, strategy_returns, initial_capital, warmup, bars_per_year)
+
+    changes = np.diff(position[warmup:], prepend=0.0)
+    total_trades = int((changes < 0).sum())
+
+    buy_hold = (close[-1] / close[warmup] - 1.0) * 100.0 if len(close) > warmup else 0.0
+
+    result = {
+        **metrics,
+        'total_trades': total_trades,
+        'buy_hold_return': float(buy_hold),
+        'outperformance': float(metrics['total_return'] - buy_hold),
+    }
+    if include_equity:
+        result['equity'] = pd.Series(equity, index=data.index)
+        result['position'] = pd.Series(position, index=data.index)
+    return result
+
+
+def trade_log(data: pd.DataFrame, position, fill: str = 'close') -> list:
+    """
+    Build a trade list in the optimizer results JSON format from a position series
+
+    Args:
+        data: DataFrame with 'open'/'close' columns and DatetimeIndex
+        position: Position series from simulate(..., include_equity=True)
+        fill: 'close' or 'next_open'; next-open fills are reported on the
+            following bar at its open price
+
+    Returns:
+        List of trade dictionaries (trade_number, action, price, date,
+        candle_index and pnl_percent for SELLs)
+    """
+    position = np.asarray(position, dtype=float)
+    changes = np.diff(position, prepend=0.0)
+    prices = data['close'].to_numpy(dtype=float)
+    offset = 0
+    if fill == 'next_open':
+        prices = data['open'].to_numpy(dtype=float)
+        offset = 1
+
+    trades = []
+    entry_price = None
+    for signal_idx in np.flatnonzero(changes):
+        idx = signal_idx + offset
+        if idx >= len(prices):
+            break
+        price = float(prices[idx])
+        trade = {
+            'trade_number': len(trades) + 1,
+            'action': 'BUY' if changes[signal_idx] > 0 else 'SELL',
+            'price': round(price, 2),
+            'date': data.index[idx].strftime('%Y-%m-%d %H:%M:%S'),
+            'candle_index': int(idx),
+        }
+        if trade['action'] == 'BUY':
+            entry_price = price
+        else:
+            trade['pnl_percent'] = round((price - entry_price) / entry_price * 100.0, 2)
+        trades.append(trade)
+    return trades
+
+
+def simulate_paths(close: np.ndarray, open_: np.ndarray, signals: np.ndarray,
+                   initial_capital: float = 10000.0, warmup: int = 0,
+                   bars_per_year: float = BARS_PER_YEAR['1h'],
+                   commission_bps: float = 0.0, slippage_bps: float = 0.0,
+                   fill: str = 'close', position_size: float = 1.0) -> dict:
+    """
+    Simulate many independent series at once
+
+    Every column is its own account with the simulate() trading model, and
+    the whole batch is evaluated as (bars x paths) matrix operations.
+
+    Args:
+        close, open_: Prices (bars x paths); open_ is only used for 'next_open'
+        signals: Signals (bars x paths) of 1 (BUY), -1 (SELL) or 0
+        Other arguments as for simulate
+
+    Returns:
+        Dictionary with total_return, max_drawdown, calmar_ratio, sharpe_ratio
+        and total_trades, each an array (paths,) equal to simulate() per column
+    """
+    close = np.asarray(close, dtype=float)
+    open_ = np.asarray(open_, dtype=float) if fill == 'next_open' else close
+    position = signals_to_position(signals, warmup)
+
+    factors = execution_factors(close, open_, position * position_size, fill,
+                                commission_bps + slippage_bps, combine=False)
+    equity = initial_capital * np.cumprod(factors, axis=0)
+    metrics = equity_metrics(equity, factors - 1.0, initial_capital, warmup, bars_per_year)
+
+    changes = np.diff(position[warmup:], axis=0, prepend=0.0)
+    metrics['total_trades'] = (changes < 0).sum(axis=0)
+    return metrics
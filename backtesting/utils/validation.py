@@ -0,0 +1,299 @@
+"""
+Dataset Validation - Vectorized sanity checks and repair for OHLCV bars
+
+Runs on ingest (opencl/fetch_data.py) and before backtests. All checks are
+array operations over the whole dataset:
+
+Errors (dataset is not usable as-is):
+- non_monotonic: timestamp goes backwards
+- duplicates: repeated timestamp
+- bad_prices: zero, negative or missing open/high/low/close
+- high_below_low: high < low
+
+Warnings:
+- ohlc_outside_range: open or close outside [low, high]
+- intraday_gaps / missing_bars: missing bars inside a trading session
+- missing_sessions: whole weekdays without bars (may be market holidays)
+- zero_volume / low_volume / high_volume: volume outliers versus the median
+- outside_session: bars outside regular hours (only with session='regular')
+
+Validation results are cached per file in a manifest (data/manifest.json)
+keyed by size, modification time and SHA-256, so a validated dataset is
+never re-scanned.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .data_loader import load_data
+
+
+INTERVAL_SECONDS = {'15m': 900, '1h': 3600, '4h': 14400, '1d': 86400}
+
+MARKET_TIMEZONE = 'America/New_York'
+REGULAR_OPEN = 9 * 3600 + 30 * 60
+REGULAR_CLOSE = 16 * 3600
+
+ERROR_CHECKS = ('non_monotonic', 'duplicates', 'bad_prices', 'high_below_low')
+
+MANIFEST_NAME = 'manifest.json'
+MAX_EXAMPLES = 5
+
+
+def _market_time(index: pd.DatetimeIndex) -> pd.DatetimeIndex:
+    """Convert a naive UTC index to exchange local time"""
+    return index.tz_localize('UTC').tz_convert(MARKET_TIMEZONE)
+
+
+def session_mask(index: pd.DatetimeIndex, interval: str) -> np.ndarray:
+    """
+    Return True for bars that overlap regular trading hours (09:30-16:00 ET)
+
+    Bars are stamped at their start, so a 1h bar at 09:00 (covering the
+    open) is inside the session while the 08:00 bar is not. Daily bars are
+    always inside.
+    """
+    seconds = INTERVAL_SECONDS[interval]
+    if seconds >= 86400:
+        return np.ones(len(index), dtype=bool)
+    local = _market_time(index)
+    start = local.hour * 3600 + local.minute * 60 + local.second
+    start = np.asarray(start)
+    weekday = np.asarray(local.weekday) < 5
+    return weekday & (start + seconds > REGULAR_OPEN) & (start < REGULAR_CLOSE)
+
+
+def validate_bars(data: pd.DataFrame, interval: str, session: str = None,
+                  low_volume_ratio: float = 0.01, high_volume_ratio: float = 20.0) -> dict:
+    """
+    Validate OHLCV bars
+
+    Args:
+        data: DataFrame from utils.data_loader.load_data
+        interval: '15m', '1h', '4h' or '1d'
+        session: None (all bars) or 'regular' (flag bars outside 09:30-16:00 ET)
+        low_volume_ratio: Volume below this fraction of the median is an outlier
+        high_volume_ratio: Volume above this multiple of the median is an outlier
+
+    Returns:
+        Report dictionary with 'valid', 'rows', 'start', 'end', 'issues'
+        (check -> count) and 'examples' (check -> first few timestamps)
+    """
+    if interval not in INTERVAL_SECONDS:
+        raise ValueError(f"Invalid interval: {interval} (valid: {', '.join(INTERVAL_SECONDS)})")
+
+    index = data.index
+    ts = index.values.astype('datetime64[s]').astype(np.int64)
+    step = INTERVAL_SECONDS[interval]
+    o, h, l, c = (data[col].to_numpy(dtype=float) for col in ('open', 'high', 'low', 'close'))
+    volume = data['volume'].to_numpy(dtype=float)
+
+    flags = {}
+    diffs = np.diff(ts)
+    flags['non_monotonic'] = np.concatenate([[False], diffs < 0])
+    flags['duplicates'] = np.concatenate([[False], diffs == 0])
+
+    prices = np.column_stack([o, h, l, c])
+    flags['bad_prices'] = ~np.isfinite(prices).all(axis=1) | (prices <= 0).any(axis=1)
+    flags['high_below_low'] = h < l
+    flags['ohlc_outside_range'] = (np.maximum(o, c) > h) | (np.minimum(o, c) < l)
+
+    # Gaps: compare consecutive bars in exchange local time
+    local = _market_time(index)
+    dates = np.asarray(local.normalize().tz_localize(None).values.astype('datetime64[D]'))
+    missing_bars = np.zeros(len(ts), dtype=np.int64)
+    if step < 86400:
+        same_day = np.concatenate([[False], dates[1:] == dates[:-1]])
+        gap = np.concatenate([[0], diffs]) > step
+        flags['intraday_gaps'] = same_day & gap
+        missing_bars[flags['intraday_gaps']] = (np.concatenate([[0], diffs])[flags['intraday_gaps']] // step) - 1
+    skipped_days = np.zeros(len(ts), dtype=np.int64)
+    if len(dates) > 1:
+        skipped_days[1:] = np.maximum(np.busday_count(dates[:-1], dates[1:]) - 1, 0)
+    flags['missing_sessions'] = skipped_days > 0
+
+    # Volume outliers versus the median of non-zero volume
+    positive = volume[volume > 0]
+    median = np.median(positive) if len(positive) else 0.0
+    flags['zero_volume'] = volume <= 0
+    flags['low_volume'] = (volume > 0) & (volume < median * low_volume_ratio)
+    flags['high_volume'] = volume > median * high_volume_ratio
+
+    if session == 'regular':
+        flags['outside_session'] = ~session_mask(index, interval)
+    elif session is not None:
+        raise ValueError(f"Unknown session: {session} (valid: None, 'regular')")
+
+    issues = {name: int(mask.sum()) for name, mask in flags.items()}
+    issues['missing_bars'] = int(missing_bars.sum())
+    issues['missing_session_days'] = int(skipped_days.sum())
+    examples = {
+        name: [str(t) for t in index[np.flatnonzero(mask)[:MAX_EXAMPLES]]]
+        for name, mask in flags.items() if mask.any()
+    }
+
+    return {
+        'valid': not any(issues[name] for name in ERROR_CHECKS),
+        'rows': int(len(data)),
+        'start': str(index[0]) if len(index) else None,
+        'end': str(index[-1]) if len(index) else None,
+        'interval': interval,
+        'session': session,
+        'issues': issues,
+        'examples': examples,
+    }
+
+
+def repair_bars(data: pd.DataFrame, interval: str, session: str = None,
+                fill_gaps: bool = False) -> tuple:
+    """
+    Repair OHLCV bars
+
+    - sorts by timestamp and drops duplicate timestamps (keeping the first)
+    - drops bars with zero, negative or missing prices
+    - swaps high/low when inverted and widens high/low to contain open/close
+    - with session='regular', drops bars outside regular trading hours
+    - with fill_gaps, inserts flat zero-volume bars for missing intraday bars
+
+    Args:
+        data: DataFrame with open/high/low/close/volume and a DatetimeIndex
+        interval: '15m', '1h', '4h' or '1d'
+        session: None or 'regular'
+        fill_gaps: Insert placeholder bars for intraday gaps
+
+    Returns:
+        (repaired DataFrame, dictionary of repair -> rows affected)
+    """
+    repairs = {}
+    df = data.sort_index(kind='stable')
+    repairs['reordered'] = int((df.index != data.index).sum())
+
+    duplicated = df.index.duplicated(keep='first')
+    repairs['duplicates_dropped'] = int(duplicated.sum())
+    df = df[~duplicated]
+
+    prices = df[['open', 'high', 'low', 'close']].to_numpy(dtype=float)
+    bad = ~np.isfinite(prices).all(axis=1) | (prices <= 0).any(axis=1)
+    repairs['bad_prices_dropped'] = int(bad.sum())
+    df = df[~bad].copy()
+
+    inverted = df['high'] < df['low']
+    repairs['high_low_swapped'] = int(inverted.sum())
+    df.loc[inverted, ['high', 'low']] = df.loc[inverted, ['low', 'high']].to_numpy()
+    body_high = df[['open', 'close']].max(axis=1)
+    body_low = df[['open', 'close']].min(axis=1)
+    repairs['range_widened'] = int(((body_high > df['high']) | (body_low < df['low'])).sum())
+    df['high'] = np.maximum(df['high'], body_high)
+    df['low'] = np.minimum(df['low'], body_low)
+
+    if session == 'regular':
+        inside = session_mask(df.index, interval)
+        repairs['outside_session_dropped'] = int((~inside).sum())
+        df = df[inside]
+
+    if fill_gaps and INTERVAL_SECONDS[interval] < 86400 and len(df) > 1:
+        step = pd.Timedelta(seconds=INTERVAL_SECONDS[interval])
+        local_dates = _market_time(df.index).date
+        filled = []
+        for _, day in df.groupby(local_dates, sort=False):
+            full = pd.date_range(day.index[0], day.index[-1], freq=step)
+            filled.append(day.reindex(full))
+        out = pd.concat(filled)
+        added = out['close'].isna()
+        out['close'] = out['close'].ffill()
+        for col in ('open', 'high', 'low'):
+            out[col] = out[col].fillna(out['close'])
+        out['volume'] = out['volume'].fillna(0.0)
+        repairs['gap_bars_inserted'] = int(added.sum())
+        out.index.name = df.index.name
+        df = out
+
+    return df, repairs
+
+
+def _file_sha256(path: Path) -> str:
+    """Return the SHA-256 of a file"""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+def load_manifest(directory) -> dict:
+    """Load the dataset manifest for a data directory (empty if missing)"""
+    path = Path(directory) / MANIFEST_NAME
+    if not path.exists():
+        return {}
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(directory, manifest: dict):
+    """Write the dataset manifest for a data directory"""
+    path = Path(directory) / MANIFEST_NAME
+    tmp = path.with_suffix('.tmp')
+    with open(tmp, 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    tmp.replace(path)
+
+
+def validate_file(path, interval: str, session: str = None, force: bool = False) -> dict:
+    """
+    Validate an OHLCV CSV, using the cached result from the manifest when the
+    file is unchanged
+
+    Args:
+        path: CSV file path
+        interval: '15m', '1h', '4h' or '1d'
+        session: None or 'regular'
+        force: Re-scan even if a cached result exists
+
+    Returns:
+        Validation report (see validate_bars), with 'cached' set when the
+        result came from the manifest
+    """
+    path = Path(path)
+    stat = path.stat()
+    manifest = load_manifest(path.parent)
+    entry = manifest.get(path.name)
+    settings = {'interval': interval, 'session': session}
+
+    if entry and not force and all(entry['report'].get(k) == v for k, v in settings.items()):
+        if entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns:
+            return {**entry['report'], 'cached': True}
+        if entry['size'] == stat.st_size and entry['sha256'] == _file_sha256(path):
+            entry['mtime_ns'] = stat.st_mtime_ns
+            save_manifest(path.parent, manifest)
+            return {**entry['report'], 'cached': True}
+
+    report = validate_bars(load_data(path), interval, session=session)
+    manifest[path.name] = {
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'sha256': _file_sha256(path),
+        'report': report,
+    }
+    save_manifest(path.parent, manifest)
+    return {**report, 'cached': False}
+
+
+def format_report(report: dict) -> list:
+    """Return human-readable summary lines for a validation report"""
+    status = '✅ Valid' if report['valid'] else '❌ Invalid'
+    cached = ' (cached)' if report.get('cached') else ''
+    lines = [f"{status}{cached}: {report['rows']} bars, {report['start']} to {report['end']}"]
+    for name, count in report['issues'].items():
+        if count:
+            marker = '❌' if name in ERROR_CHECKS else '⚠️ '
+            example = report['examples'].get(name, [])
+            example_text = f" (e.g. {', '.join(example[:2])})" if example else ''
+            lines.append(f"   {marker} {name}: {count}{example_text}")
+    return lines
@@ -0,0 +1,72 @@
+"""
+Warmup Derivation - Bars of history needed before indicators are usable
+
+The warmup is derived from the strategy parameters instead of a fixed bar
+count. Strategies report it through get_warmup_period(tolerance), built on
+strategies.indicators.ema_lookback; this module bounds a whole parameter
+search and converts bars into calendar days of history.
+
+Two modes:
+- Exact (tolerance=None): an EMA of span N is used after N bars, the same
+  convention as Pine Script's ta.ema, and a rolling window of length L after
+  L further bars. This is not convergence: an EMA seeded with the first value
+  (adjust=False) still gives the seed a weight of (1 - alpha)^N, about
+  e^-2 ~ 13.5%, after N bars. Use a tolerance when values must not depend on
+  where the history starts.
+- Tolerance: an EMA seeded with the first value (adjust=False) keeps a seed
+  weight of (1 - alpha)^k after k updates. It counts as warm once that weight
+  is <= tolerance: k = ceil(log(tolerance) / log(1 - alpha)). Looser
+  tolerances need less history, tighter ones more.
+"""
+
+import math
+
+
+# Bars per regular trading session (09:30-16:00 ET), counting partial bars
+BARS_PER_SESSION = {'15m': 26, '1h': 7, '4h': 2, '1d': 1}
+
+# Calendar slack for market holidays when converting sessions to days
+HOLIDAY_MARGIN_DAYS = 10
+
+
+def search_warmup(create_strategy, ranges: dict, tolerance: float = None) -> int:
+    """
+    Return a warmup that covers every candidate in a parameter search
+
+    Warmup grows with every length parameter, so the top of each range
+    bounds the whole search. The bound is computed from the parameters with
+    the strategy's warmup_for_params, without constructing a strategy, since
+    the top of every range together need not be a valid parameter set (e.g.
+    a fast EMA range reaching past the slow EMA). Using one warmup for all
+    candidates keeps their metrics comparable (same evaluation window).
+
+    Args:
+        create_strategy: StrategyFactory (strategies.get_strategy_factory)
+        ranges: Parameter name -> candidate values (utils.config_header.search_ranges)
+        tolerance: EMA convergence tolerance, None for exact
+
+    Returns:
+        Warmup in bars
+    """
+    upper = dict(create_strategy.default_params)
+    upper.update({name: max(values) for name, values in ranges.items()})
+    return create_strategy.strategy_class.warmup_for_params(upper, tolerance)
+
+
+def history_days(bars: int, interval: str) -> int:
+    """
+    Return the calendar days of history to request for a number of bars
+
+    Counts regular-session bars per trading day (a lower bound when extended
+    hours are included, so enough history is always requested), converts
+    trading days to calendar days and adds slack for holidays.
+
+    Args:
+        bars: Bars needed (including warmup)
+        interval: '15m', '1h', '4h' or '1d'
+
+    Returns:
+        Calendar days
+    """
+    sessions = math.ceil(bars / BARS_PER_SESSION[interval])
+    return int(math.ceil(sessions * 7 / 5)) + HOLIDAY_MARGIN_DAYS
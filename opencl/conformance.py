@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Check kernel.cl against the Python strategy, and benchmark CPU vs GPU paths
+Usage: python3 conformance.py TICKER INTERVAL [--strategy NAME] [--combinations N] [--build-options OPTS]
+Example: python3 conformance.py QQQ 1h --combinations 2000
+
+Conformance: runs the default parameters from config_<interval>.h through
+  1. the Python AdaptiveEmaV1Strategy + simulator (reference)
+  2. the NumPy emulation of the kernel in float64 (must match exactly)
+  3. the NumPy emulation in float32 (device arithmetic)
+  4. kernel.cl on every available OpenCL device (GPU, or CPU via PoCL)
+and compares indicators and signals bar for bar.
+
+Benchmark: evaluates N random combinations on each path and reports tests/sec.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'backtesting'))
+
+from optimizer import evaluate
+from strategies import get_strategy_factory, list_strategies
+from utils.config_header import parse_config_header, default_parameters, strategy_settings
+from utils.data_loader import load_data
+from utils.opencl_kernel import (
+    MAX_VOL_LENGTH, RESULT_FIELDS, compare_traces, emulate_kernel, list_opencl_devices,
+    params_to_array, reference_trace, run_opencl_kernel,
+)
+from utils.simulator import BARS_PER_YEAR
+
+
+def random_candidates(defaults: dict, n: int, spread: float = 0.3, seed: int = 0) -> list:
+    """Draw n valid parameter sets within +/- spread of the defaults"""
+    rng = np.random.default_rng(seed)
+    candidates = []
+    while len(candidates) < n:
+        c = {k: max(2, int(round(v * rng.uniform(1 - spread, 1 + spread)))) for k, v in defaults.items()}
+        if (c['fast_length_low'] < c['slow_length_low'] and c['fast_length_med'] < c['slow_length_med']
+                and c['fast_length_high'] < c['slow_length_high']
+                and c['low_vol_percentile'] < c['high_vol_percentile']
+                and c['volatility_length'] <= MAX_VOL_LENGTH):
+            candidates.append(c)
+    return candidates
+
+
+def _print_report(label: str, report: dict) -> bool:
+    """Print a trace comparison; return True when signals match"""
+    ok = report['signal']['mismatches'] == 0
+    print(f"   {'✅' if ok else '❌'} {label}")
+    for name, r in report.items():
+        first = '' if r['first_bar'] is None else f" (first at bar {r['first_bar']})"
+        print(f"      {name:<15} mismatches: {r['mismatches']:>5}  max |diff|: {r['max_abs_diff']:.3g}{first}")
+    return ok
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Kernel conformance and throughput')
+    parser.add_argument('ticker')
+    parser.add_argument('interval')
+    parser.add_argument('--strategy', default='adaptive_ema_v1', choices=list_strategies())
+    parser.add_argument('--combinations', type=int, default=1000, help='Benchmark size (0 to skip)')
+    parser.add_argument('--build-options', default='', help="e.g. '-cl-fast-relaxed-math'")
+    args = parser.parse_args(argv)
+
+    ticker = args.ticker.upper()
+    interval = args.interval.lower()
+    data = load_data(Path(__file__).parent / 'data' / f"{ticker.lower()}_{interval}.csv")
+    config = parse_config_header(Path(__file__).parent / 'strategies' / args.strategy / f"config_{interval}.h")
+    params = default_parameters(config, interval)
+    settings = strategy_settings(config, interval)
+    kernel_args = {
+        'warmup': settings['warmup'],
+        'initial_capital': settings['initial_capital'],
+        'bars_per_year': BARS_PER_YEAR.get(interval, BARS_PER_YEAR['1h']),
+    }
+    create_strategy = get_strategy_factory(args.strategy, interval)
+    prices = (data['close'].to_numpy(), data['high'].to_numpy(), data['low'].to_numpy())
+
+    print(f"🔬 Conformance: {ticker} {interval} - {args.strategy} ({len(data)} bars)")
+    try:
+        packed = params_to_array([params])
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+    reference = reference_trace(data, create_strategy, params, **kernel_args)
+
+    runs = {
+        'NumPy emulation (float64)': emulate_kernel(*prices, packed, dtype=np.float64, trace=True, **kernel_args),
+        'NumPy emulation (float32)': emulate_kernel(*prices, packed, dtype=np.float32, trace=True, **kernel_args),
+    }
+    devices = list_opencl_devices()
+    if not devices:
+        print("   ⚠️  No OpenCL runtime (pip install pyopencl pocl-binary-distribution); kernel.cl not executed")
+    for platform, name, device in devices:
+        runs[f"OpenCL {name} [{platform}]"] = run_opencl_kernel(
+            *prices, packed, strategy=args.strategy, device=device, trace=True,
+            build_options=args.build_options, **kernel_args)
+
+    all_ok = True
+    for label, run in runs.items():
+        exact = 'float64' in label
+        report = compare_traces(reference, run, rtol=1e-9 if exact else 1e-5, atol=1e-9 if exact else 1e-3)
+        all_ok &= _print_report(label, report)
+
+    print("\n📊 Metrics (reference vs each path):")
+    print(f"   {'':<40}" + ''.join(f"{f:>15}" for f in RESULT_FIELDS))
+    print(f"   {'Python strategy':<40}" + ''.join(f"{float(reference[f][0]):>15.4f}" for f in RESULT_FIELDS))
+    for label, run in runs.items():
+        print(f"   {label[:40]:<40}" + ''.join(f"{float(run[f][0]):>15.4f}" for f in RESULT_FIELDS))
+
+    if args.combinations > 0:
+        candidates = random_candidates(params, args.combinations)
+        packed = params_to_array(candidates)
+        print(f"\n⏱️  Throughput ({len(candidates)} combinations, {len(data)} bars):")
+
+        sample = candidates[:min(len(candidates), 50)]
+        started = time.perf_counter()
+        for c in sample:
+            evaluate(create_strategy(c), data, **kernel_args)
+        rate = len(sample) / (time.perf_counter() - started)
+        print(f"   {'Python strategy (per candidate)':<45} {rate:>12,.0f} tests/sec")
+
+        started = time.perf_counter()
+        emulate_kernel(*prices, packed, **kernel_args)
+        rate = len(candidates) / (time.perf_counter() - started)
+        print(f"   {'NumPy emulation (float32, lockstep)':<45} {rate:>12,.0f} tests/sec")
+
+        for platform, name, device in devices:
+            # First run includes kernel compilation; time the second
+            run_opencl_kernel(*prices, packed[:1], strategy=args.strategy, device=device,
+                              build_options=args.build_options, **kernel_args)
+            started = time.perf_counter()
+            run_opencl_kernel(*prices, packed, strategy=args.strategy, device=device,
+                              build_options=args.build_options, **kernel_args)
+            rate = len(candidates) / (time.perf_counter() - started)
+            print(f"   {('OpenCL ' + name)[:45]:<45} {rate:>12,.0f} tests/sec")
+
+    print(f"\n{'✅ Kernel conforms to the Python strategy' if all_ok else '❌ Signal mismatches found'}")
+    return 0 if all_ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,18 +1,38 @@
 #!/usr/bin/env python3
 """
 Fetch historical market data using Alpaca API
-Usage: python3 fetch_data.py TICKER INTERVAL CANDLES
+Usage: python3 fetch_data.py TICKER INTERVAL CANDLES [--regular-hours] [--strategy NAME] [--warmup-tolerance TOL]
 Example: python3 fetch_data.py GOOG 1h 600
 
 Implements 24-hour caching to avoid redundant API calls
+Bars are repaired (sorted, de-duplicated, invalid prices dropped) on ingest
+and every saved file is validated; --regular-hours keeps only bars in the
+09:30-16:00 ET session
+
+The warmup fetched on top of CANDLES is derived from the strategy's search
+range in strategies/<strategy>/config_<interval>.h (exact, or EMA convergence
+within --warmup-tolerance), and the date range requested is sized from
+trading sessions rather than calendar hours
 """
 
+import argparse
 import sys
 import pandas as pd
 from datetime import datetime, timedelta
 import os
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent.parent / 'backtesting'))
+
+from strategies import get_strategy_factory
+from utils.config_header import parse_config_header, search_ranges
+from utils.data_loader import load_data, save_data
+from utils.validation import format_report, repair_bars, validate_file
+from utils.warmup import history_days, search_warmup
+
+# Used when the strategy has no config header for the interval
+DEFAULT_WARMUP_PERIOD = 50
+
 # Hardcoded Alpaca API credentials
 ALPACA_API_KEY = 'PKMAR3VY5HO7ERI6A2EAVIUYM2'
 ALPACA_SECRET_KEY = 'e4PcTCF9rhCNnaizeXGQxfhGja2RuF2bbdGq5WyJKs2'
@@ -78,9 +98,9 @@ def _check_cache(ticker: str, interval: str, num_candles: int, cache_dir: str =
             print(f"📦 Found cached data from {file_timestamp.strftime('%Y-%m-%d %H:%M:%S')} ({age_hours:.1f}h ago)")
             df = pd.read_csv(latest_file)
             
-            # If we need fewer candles than cached, just use what we need
-            if len(df) > num_candles + 50:  # +50 for warmup
-                df = df.tail(num_candles + 50)
+            # If we need fewer candles than cached, just use what we need (num_candles includes warmup)
+            if len(df) > num_candles:
+                df = df.tail(num_candles)
                 print(f"   Using {len(df)} most recent candles from cache")
             
             return df, latest_file
@@ -114,9 +134,62 @@ def _save_to_cache(df: pd.DataFrame, ticker: str, interval: str, num_candles: in
     df.to_csv(filepath, index=False, header=True)
     return str(filepath)
 
-def fetch_data(ticker, interval, num_candles):
+def _print_repairs(repairs: dict):
+    """Print the non-zero repair counts"""
+    for name, count in repairs.items():
+        if count:
+            print(f"   🔧 {name}: {count}")
+
+
+def _repair_file(filename: str, interval: str, session: str = None) -> int:
+    """
+    Run the repair pass on a saved data file, rewriting it only if anything changed.
+    Files cached (or copied into data/) before the repair pass existed are raw.
+    Returns the number of bars kept.
+    """
+    data = load_data(filename)
+    repaired, repairs = repair_bars(data, interval, session=session)
+    _print_repairs(repairs)
+    if any(repairs.values()):
+        save_data(repaired, filename)
+    return len(repaired)
+
+
+def _print_validation(filename: str, interval: str, session: str = None) -> bool:
+    """Validate a saved data file (cached in data/manifest.json) and print the report"""
+    report = validate_file(filename, interval, session=session)
+    for line in format_report(report):
+        print(f"   {line}")
+    return report['valid']
+
+
+def required_warmup(strategy: str, interval: str, tolerance: float = None) -> int:
+    """
+    Return the warmup bars needed by a strategy's search range
+    
+    Uses the strategy's default parameters when strategies/<strategy>/config_<interval>.h
+    does not exist, and DEFAULT_WARMUP_PERIOD when there is no Python
+    implementation for the interval.
+    """
+    try:
+        create_strategy = get_strategy_factory(strategy, interval)
+    except ValueError:
+        print(f"   ⚠️  No Python strategy {strategy} ({interval}), using {DEFAULT_WARMUP_PERIOD} warmup candles")
+        return DEFAULT_WARMUP_PERIOD
+    
+    config_file = Path('strategies') / strategy / f"config_{interval}.h"
+    if not config_file.exists():
+        return create_strategy({}).get_warmup_period(tolerance)
+    ranges = search_ranges(parse_config_header(config_file), interval)
+    return search_warmup(create_strategy, ranges, tolerance=tolerance)
+
+
+def fetch_data(ticker, interval, num_candles, session=None, strategy='adaptive_ema_v1', warmup_tolerance=None):
     """Fetch historical data from Alpaca and save to CSV (with 24h caching)"""
     
+    # Warmup candles needed on top of the requested candles
+    warmup_period = required_warmup(strategy, interval, warmup_tolerance)
+    
     # For standard filename compatibility
     ticker_lower = ticker.lower()
     standard_filename = f"data/{ticker_lower}_{interval}.csv"
@@ -137,19 +210,19 @@ def fetch_data(ticker, interval, num_candles):
                     print(f"   Date range: {pd.to_datetime(df_existing['Timestamp'].iloc[0], unit='s').strftime('%Y-%m-%d')} to {last_date.strftime('%Y-%m-%d')}")
                     
                     # If we need fewer candles, just use what we need
-                    if len(df_existing) >= num_candles + 50:
+                    available = _repair_file(standard_filename, interval, session)
+                    if available >= num_candles + warmup_period:
                         print(f"   ✅ Data is current and sufficient")
-                        return True
+                        return _print_validation(standard_filename, interval, session)
                     else:
-                        print(f"   ⚠️  Data exists but only has {len(df_existing)} candles (need {num_candles + 50})")
+                        print(f"   ⚠️  Data exists but only has {available} candles (need {num_candles + warmup_period})")
                 else:
                     print(f"   ⚠️  Data exists but is outdated (last: {last_date.strftime('%Y-%m-%d')})")
         except Exception as e:
             print(f"   ⚠️  Error reading existing file: {e}")
     
-    # Add warmup period buffer (50 candles needed for indicators)
-    WARMUP_PERIOD = 50
-    num_candles_with_warmup = num_candles + WARMUP_PERIOD
+    # Add warmup period buffer (derived from the strategy parameters)
+    num_candles_with_warmup = num_candles + warmup_period
     
     # Check cache first (for timestamped files)
     cached_df, cache_file = _check_cache(ticker, interval, num_candles_with_warmup)
@@ -165,13 +238,17 @@ def fetch_data(ticker, interval, num_candles):
         else:
             print(f"   ✅ Using {filename}")
         
+        # Cached files may predate the repair pass
+        _repair_file(filename, interval, session)
+        cached_df = pd.read_csv(filename)
+        
         # Show date range
         if 'Timestamp' in cached_df.columns:
             first_ts = pd.to_datetime(cached_df['Timestamp'].iloc[0], unit='s')
             last_ts = pd.to_datetime(cached_df['Timestamp'].iloc[-1], unit='s')
             print(f"   Date range: {first_ts.strftime('%Y-%m-%d')} to {last_ts.strftime('%Y-%m-%d')}")
         
-        return True
+        return _print_validation(filename, interval, session)
     
     try:
         from alpaca.data.historical import StockHistoricalDataClient
@@ -183,10 +260,10 @@ def fetch_data(ticker, interval, num_candles):
     
     # Map intervals to Alpaca TimeFrame
     interval_map = {
-        '15m': (TimeFrame(15, TimeFrameUnit.Minute), num_candles_with_warmup / 96),
-        '1h': (TimeFrame(1, TimeFrameUnit.Hour), num_candles_with_warmup / 24),
-        '4h': (TimeFrame(4, TimeFrameUnit.Hour), num_candles_with_warmup / 6),
-        '1d': (TimeFrame(1, TimeFrameUnit.Day), num_candles_with_warmup)
+        '15m': TimeFrame(15, TimeFrameUnit.Minute),
+        '1h': TimeFrame(1, TimeFrameUnit.Hour),
+        '4h': TimeFrame(4, TimeFrameUnit.Hour),
+        '1d': TimeFrame(1, TimeFrameUnit.Day)
     }
     
     if interval not in interval_map:
@@ -194,7 +271,7 @@ def fetch_data(ticker, interval, num_candles):
         print("   Valid intervals: 15m, 1h, 4h, 1d")
         return False
     
-    timeframe, days_needed = interval_map[interval]
+    timeframe = interval_map[interval]
     
     # Calculate date range
     # For 15m data, fetch all available data from 2016 to yesterday
@@ -206,8 +283,8 @@ def fetch_data(ticker, interval, num_candles):
         start_date = datetime(2016, 1, 1)
         print(f"📡 Fetching ALL {ticker} {interval} data from Alpaca (SIP feed)...")
     else:
-        # For other intervals, calculate based on requested candles
-        days_needed = int(days_needed * 1.8) + 30
+        # For other intervals, calculate from trading sessions for the requested candles
+        days_needed = history_days(num_candles_with_warmup, interval)
         start_date = max(
             end_date - timedelta(days=days_needed),
             datetime(2016, 1, 1)
@@ -215,7 +292,7 @@ def fetch_data(ticker, interval, num_candles):
         print(f"📡 Fetching {ticker} data from Alpaca...")
     
     print(f"   Interval: {interval}")
-    print(f"   Requested: {num_candles} candles (+{WARMUP_PERIOD} warmup)")
+    print(f"   Requested: {num_candles} candles (+{warmup_period} warmup)")
     print(f"   Date range: {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}")
     
     try:
@@ -310,15 +387,13 @@ def fetch_data(ticker, interval, num_candles):
         
         df = pd.concat(all_dfs, ignore_index=True)
         
-        # Remove duplicates based on timestamp
-        df = df.drop_duplicates(subset=['timestamp'], keep='first')
-        
-        # Sort by timestamp
-        df = df.sort_values('timestamp')
-        
         # Set timestamp as index
         df = df.set_index('timestamp')
         
+        # Sort, remove duplicate timestamps and invalid bars (optionally off-session bars)
+        df, repairs = repair_bars(df, interval, session=session)
+        _print_repairs(repairs)
+        
         # For non-15m intervals, limit to requested number of candles (including warmup)
         # For 15m, keep all data
         if interval != '15m':
@@ -360,7 +435,7 @@ def fetch_data(ticker, interval, num_candles):
         print(f"   ✅ Saved {len(df)} candles to {filename}")
         print(f"   Date range: {df.index[0].strftime('%Y-%m-%d')} to {df.index[-1].strftime('%Y-%m-%d')}")
         
-        return True
+        return _print_validation(filename, interval, session)
         
     except Exception as e:
         print(f"❌ Error fetching data: {e}")
@@ -369,14 +444,20 @@ def fetch_data(ticker, interval, num_candles):
         return False
 
 if __name__ == "__main__":
-    if len(sys.argv) < 4:
-        print("Usage: python3 fetch_data.py TICKER INTERVAL CANDLES")
-        print("Example: python3 fetch_data.py GOOG 1h 600")
-        sys.exit(1)
-    
-    ticker = sys.argv[1].upper()
-    interval = sys.argv[2].lower()
-    candles = int(sys.argv[3])
+    parser = argparse.ArgumentParser(description='Fetch historical market data from Alpaca')
+    parser.add_argument('ticker')
+    parser.add_argument('interval')
+    parser.add_argument('candles', type=int)
+    parser.add_argument('--regular-hours', action='store_true', help='Keep only 09:30-16:00 ET bars')
+    parser.add_argument('--strategy', default='adaptive_ema_v1', help='Strategy whose warmup to fetch')
+    parser.add_argument('--warmup-tolerance', type=float,
+                        help='Size the warmup for EMA convergence within this tolerance (e.g. 0.01)')
+    args = parser.parse_args()
     
-    success = fetch_data(ticker, interval, candles)
+    success = fetch_data(
+        args.ticker.upper(), args.interval.lower(), args.candles,
+        session='regular' if args.regular_hours else None,
+        strategy=args.strategy,
+        warmup_tolerance=args.warmup_tolerance,
+    )
     sys.exit(0 if success else 1)
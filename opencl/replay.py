@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Event-time replay of stored bars for paper trading
+Usage: python3 replay.py TICKER INTERVAL [--strategy NAME] [--run RUN_ID] [--speed X] [--max-delay S]
+                         [--fill close|next_open] [--source PATH] [--quiet]
+Example: python3 replay.py QQQ 1h --speed 3600 --max-delay 2
+
+Streams data/<ticker>_<interval>.csv (or --source, CSV or Parquet) bar by bar
+through the strategy's incremental update path with the default parameters
+from config_<interval>.h, or the parameters of a stored run (--run, made for
+the same ticker, interval and strategy), and prints signals and fills as they
+happen plus end-to-end latency percentiles (from each bar's arrival) and the
+strategy update time.
+--speed 0 (default) replays as fast as possible.
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'backtesting'))
+
+from strategies import get_strategy_factory, list_strategies
+from utils.config_header import parse_config_header, default_parameters
+from utils.replay import ReplayEngine
+from utils.result_store import ResultStore, canonical_params, check_run_matches
+from utils.simulator import FILL_MODES
+
+
+def print_event(event: dict):
+    """Print one replay event"""
+    ts = event['timestamp'].strftime('%Y-%m-%d %H:%M')
+    latency = event['latency_ns'] / 1000.0
+    if event['type'] == 'signal':
+        label = '📈 BUY ' if event['signal'] > 0 else '📉 SELL'
+        print(f"   {ts}  {label} signal @ {event['close']:.2f}  ({latency:.1f}µs)")
+    else:
+        trade = event['trade']
+        pnl = f"  P&L {trade['pnl_percent']:+.2f}%" if 'pnl_percent' in trade else ''
+        print(f"   {ts}  💱 {trade['action']:<4} fill   @ {trade['price']:.2f}{pnl}  ({latency:.1f}µs)")
+
+
+async def replay(engine: ReplayEngine, quiet: bool):
+    async for event in engine.events():
+        if not quiet:
+            print_event(event)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Event-time replay of stored bars')
+    parser.add_argument('ticker')
+    parser.add_argument('interval')
+    parser.add_argument('--strategy', default='adaptive_ema_v1', choices=list_strategies())
+    parser.add_argument('--run', type=int, help='Replay the parameters of this results.db run')
+    parser.add_argument('--db', default='results.db')
+    parser.add_argument('--source', help='CSV or Parquet file (default: data/<ticker>_<interval>.csv)')
+    parser.add_argument('--speed', type=float, default=0.0,
+                        help='Event-time speed-up, e.g. 3600 = one hour per second (0: as fast as possible)')
+    parser.add_argument('--max-delay', type=float, help='Maximum wait between two bars in seconds')
+    parser.add_argument('--fill', choices=FILL_MODES, default='close')
+    parser.add_argument('--quiet', action='store_true', help='Only print the summary')
+    args = parser.parse_args(argv)
+
+    ticker = args.ticker.upper()
+    interval = args.interval.lower()
+    source = Path(args.source) if args.source else Path('data') / f"{ticker.lower()}_{interval}.csv"
+    config_file = Path('strategies') / args.strategy / f"config_{interval}.h"
+    if not source.exists():
+        print(f"❌ Error: Could not open {source}")
+        print(f"   Run: python3 fetch_data.py {ticker} {interval} 600")
+        return 1
+
+    params = default_parameters(parse_config_header(config_file), interval)
+    if args.run is not None:
+        with ResultStore(args.db) as store:
+            run = store.get_run(args.run)
+        if run is None:
+            print(f"❌ Run {args.run} not found in {args.db}")
+            return 1
+
+    try:
+        if args.run is not None:
+            check_run_matches(run, ticker, interval, args.strategy)
+            params = canonical_params(run['parameters'])
+        strategy = get_strategy_factory(args.strategy, interval)(params)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+    warmup = strategy.get_warmup_period()
+    engine = ReplayEngine(strategy, source, speed=args.speed, fill=args.fill,
+                          warmup=warmup, max_delay=args.max_delay)
+
+    speed = f"{args.speed:g}x" if args.speed else 'max speed'
+    print(f"▶️  Replay: {ticker} {interval} - {args.strategy} ({speed}, {args.fill} fills, {warmup} warmup bars)")
+    print(f"   Source: {source} | Parameters: {params}")
+    try:
+        asyncio.run(replay(engine, args.quiet))
+    except KeyboardInterrupt:
+        print("\n⏹️  Stopped")
+
+    summary = engine.summary()
+    print(f"\n📊 {summary['bars']} bars, {summary['trades']} fills in {summary['elapsed']:.2f}s "
+          f"({summary['bars_per_sec']:,.0f} bars/sec)")
+    print(f"   {'Latency (µs)':<14} {'p50':>8} {'p90':>8} {'p99':>8} {'max':>8}")
+    for name, s in summary['latency'].items():
+        print(f"   {name:<14} {s['p50']:>8.1f} {s['p90']:>8.1f} {s['p99']:>8.1f} {s['max']:>8.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Query and manage optimizer results stored in results.db
+Usage:
+    python3 results.py import [DIR]                     # Import results JSON files (default: strategies)
+    python3 results.py best [METRIC] [--days N]         # Best run per ticker
+    python3 results.py params KEY=VALUE [KEY=VALUE...]  # All runs with these parameters
+    python3 results.py list [--ticker T] [--interval I] [--days N]
+    python3 results.py report RUN_ID [OUTPUT.html]      # Render an HTML report on demand
+
+Example: python3 results.py best calmar_ratio --days 7
+"""
+
+import argparse
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'backtesting'))
+
+from utils.result_store import ResultStore, METRIC_COLUMNS
+from utils.report import render_html
+
+
+DEFAULT_DB = 'results.db'
+
+
+def _metric(value, fmt: str = '.2f', suffix: str = '') -> str:
+    """Format a metric value, '-' when the run has none"""
+    return '-' if value is None else f"{value:{fmt}}{suffix}"
+
+
+def _print_runs(runs: list):
+    """Print a compact table of runs"""
+    if not runs:
+        print("   No matching runs")
+        return
+    print(f"   {'ID':>5}  {'Ticker':<7} {'Int':<4} {'Run':<16} {'Return':>8} {'MaxDD':>7} {'Calmar':>7} {'Trades':>6}  Params")
+    for r in runs:
+        p = r['performance']
+        params = ' '.join(f"{v}" for v in r['parameters'].values())
+        print(f"   {r['id']:>5}  {r['ticker']:<7} {r['interval']:<4} {r['timestamp']:<16} "
+              f"{_metric(p['total_return'], suffix='%'):>8} {_metric(p['max_drawdown'], suffix='%'):>7} "
+              f"{_metric(p['calmar_ratio']):>7} {_metric(p['total_trades'], '.0f'):>6}  {params}")
+
+
+def _parse_value(text: str):
+    """Parse a KEY=VALUE parameter value as int, float or string"""
+    for cast in (int, float):
+        try:
+            return cast(text)
+        except ValueError:
+            continue
+    return text
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Query optimizer results')
+    parser.add_argument('--db', default=DEFAULT_DB, help='Result store path (default: results.db)')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    p_import = sub.add_parser('import', help='Import optimizer results JSON files')
+    p_import.add_argument('dir', nargs='?', default='strategies')
+
+    p_best = sub.add_parser('best', help='Best run per ticker for a metric')
+    p_best.add_argument('metric', nargs='?', default='calmar_ratio', choices=METRIC_COLUMNS)
+    p_best.add_argument('--days', type=float, help='Only runs from the last N days')
+    p_best.add_argument('--interval')
+    p_best.add_argument('--strategy')
+
+    p_params = sub.add_parser('params', help='All runs with these parameters')
+    p_params.add_argument('params', nargs='+', metavar='KEY=VALUE')
+    p_params.add_argument('--strategy')
+
+    p_list = sub.add_parser('list', help='List runs, newest first')
+    p_list.add_argument('--ticker')
+    p_list.add_argument('--interval')
+    p_list.add_argument('--days', type=float)
+    p_list.add_argument('--limit', type=int, default=20)
+
+    p_report = sub.add_parser('report', help='Render an HTML report for a run')
+    p_report.add_argument('run_id', type=int)
+    p_report.add_argument('output', nargs='?')
+    p_report.add_argument('--max-points', type=int, default=2000, help='Maximum plotted points per curve')
+    p_report.add_argument('--page-size', type=int, default=100, help='Trades per page in the trade log')
+
+    args = parser.parse_args(argv)
+    since = datetime.now() - timedelta(days=args.days) if getattr(args, 'days', None) else None
+
+    with ResultStore(args.db) as store:
+        if args.command == 'import':
+            imported = store.import_results_dir(args.dir)
+            print(f"📦 Imported {imported} new runs from {args.dir} ({store.count()} total in {args.db})")
+
+        elif args.command == 'best':
+            print(f"🏆 Best {args.metric} per ticker" + (f" (last {args.days:g} days)" if since else ''))
+            _print_runs(store.best_runs(args.metric, interval=args.interval,
+                                        strategy=args.strategy, since=since))
+
+        elif args.command == 'params':
+            params = dict(item.split('=', 1) for item in args.params)
+            params = {k: _parse_value(v) for k, v in params.items()}
+            _print_runs(store.runs_with_parameters(params, strategy=args.strategy))
+
+        elif args.command == 'list':
+            _print_runs(store.query(ticker=args.ticker, interval=args.interval,
+                                    since=since, limit=args.limit))
+
+        elif args.command == 'report':
+            run = store.get_run(args.run_id)
+            if run is None:
+                print(f"❌ No run with id {args.run_id}")
+                return 1
+            output = args.output or (f"strategies/{run['strategy']}/results/{run['ticker'].lower()}/"
+                                     f"{run['interval']}/{run['timestamp']}_{run['ticker']}_{run['interval']}.html")
+            prices = f"data/{run['ticker'].lower()}_{run['interval']}.csv"
+            try:
+                report = render_html(run, output, prices=prices, max_points=args.max_points,
+                                     page_size=args.page_size)
+            except ValueError as e:
+                print(f"⚠️  Not plotting price and equity: {e}")
+                report = render_html(run, output, max_points=args.max_points, page_size=args.page_size)
+            print(f"📄 HTML report saved to: {report}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
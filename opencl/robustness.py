@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Monte Carlo / bootstrap robustness test for a parameter set
+Usage: python3 robustness.py TICKER INTERVAL [--strategy NAME] [--run RUN_ID] [--method iid|block|random_entry]
+                             [--paths N] [--block-size N] [--seed N] [--workers N] [--confidence C]
+Example: python3 robustness.py QQQ 1h --method block --paths 2000
+
+Tests the default parameters from config_<interval>.h, or the parameters of
+a stored run (--run, from results.db, made for the same ticker, interval and
+strategy), on resampled price paths or with randomized entries, and prints
+confidence intervals for every metric.
+Results are reproducible for a seed regardless of --workers.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'backtesting'))
+
+from strategies import get_strategy_factory, list_strategies
+from utils.config_header import parse_config_header, default_parameters, strategy_settings
+from utils.data_loader import load_data
+from utils.result_store import ResultStore, canonical_params, check_run_matches
+from utils.robustness import METHODS, METRICS, run_robustness
+from utils.simulator import BARS_PER_YEAR
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Monte Carlo / bootstrap robustness test')
+    parser.add_argument('ticker')
+    parser.add_argument('interval')
+    parser.add_argument('--strategy', default='adaptive_ema_v1', choices=list_strategies())
+    parser.add_argument('--run', type=int, help='Test the parameters of this results.db run')
+    parser.add_argument('--db', default='results.db')
+    parser.add_argument('--method', choices=METHODS, default='block')
+    parser.add_argument('--paths', type=int, default=1000)
+    parser.add_argument('--block-size', type=int, default=20, help='Bars per block (block method)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workers', type=int, help='Worker processes (default: CPU count)')
+    parser.add_argument('--confidence', type=float, default=0.95)
+    args = parser.parse_args(argv)
+
+    ticker = args.ticker.upper()
+    interval = args.interval.lower()
+    data_file = Path('data') / f"{ticker.lower()}_{interval}.csv"
+    config_file = Path('strategies') / args.strategy / f"config_{interval}.h"
+    if not data_file.exists():
+        print(f"❌ Error: Could not open {data_file}")
+        print(f"   Run: python3 fetch_data.py {ticker} {interval} 600")
+        return 1
+
+    data = load_data(data_file, validate=True, interval=interval)
+    config = parse_config_header(config_file)
+    settings = strategy_settings(config, interval)
+    params = default_parameters(config, interval)
+    if args.run is not None:
+        with ResultStore(args.db) as store:
+            run = store.get_run(args.run)
+        if run is None:
+            print(f"❌ Run {args.run} not found in {args.db}")
+            return 1
+
+    create_strategy = get_strategy_factory(args.strategy, interval)
+    try:
+        if args.run is not None:
+            check_run_matches(run, ticker, interval, args.strategy)
+            params = canonical_params(run['parameters'])
+        warmup = create_strategy(params).get_warmup_period()
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+    sim_settings = {
+        'initial_capital': settings['initial_capital'],
+        'warmup': warmup,
+        'bars_per_year': BARS_PER_YEAR.get(interval, BARS_PER_YEAR['1h']),
+        'commission_bps': settings['commission_bps'],
+        'slippage_bps': settings['slippage_bps'],
+    }
+
+    print(f"🎲 Robustness: {ticker} {interval} - {args.strategy} ({args.method}, {args.paths} paths)")
+    print(f"   Candles: {len(data)} ({sim_settings['warmup']} warmup) | Parameters: {params}")
+    started = time.perf_counter()
+    result = run_robustness(
+        data, create_strategy, params, method=args.method, n_paths=args.paths,
+        block_size=args.block_size, seed=args.seed, workers=args.workers,
+        confidence=args.confidence, **sim_settings,
+    )
+    elapsed = time.perf_counter() - started
+
+    ci = f"{args.confidence:.0%} CI"
+    print(f"\n📊 {'Metric':<15} {'Actual':>10} {'Mean':>10} {'Median':>10} {ci:>22}")
+    for name in METRICS:
+        s = result['summary'][name]
+        interval_text = f"[{s['lower']:.2f}, {s['upper']:.2f}]"
+        print(f"   {name:<15} {result['actual'][name]:>10.2f} {s['mean']:>10.2f} {s['median']:>10.2f} {interval_text:>22}")
+
+    print(f"\n   P(return < 0): {result['prob_loss']:.1%}")
+    print(f"   P(path return >= actual): {result['p_value']:.3f}")
+    print(f"   ⏱️  {result['paths']} paths in {elapsed:.1f}s ({result['paths'] / elapsed:,.0f} paths/sec)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -51,6 +51,8 @@
 #define INITIAL_CAPITAL_1H 10000.0f
 #define MIN_TRADES_1H 1
 #define MAX_DRAWDOWN_FILTER_1H 50.0f
-#define WARMUP_PERIOD_1H 50
+// Bars before trading starts: max(SLOW_HIGH, ATR_LENGTH + VOL_LENGTH) at the
+// top of the search range (get_warmup_period in the Python strategy)
+#define WARMUP_PERIOD_1H 120
 
 #endif // ADAPTIVE_EMA_V1_CONFIG_1
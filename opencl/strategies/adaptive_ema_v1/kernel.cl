@@ -0,0 +1,214 @@
+/**
+ * Adaptive EMA Strategy v1 - OpenCL Kernel
+ *
+ * One work-item evaluates one parameter combination over every bar.
+ * Semantics match backtesting/strategies/adaptive_ema_v1/base.py and
+ * backtesting/utils/simulator.py (long-only, all-in, fills at bar close):
+ *
+ *   ATR            EMA(span=atr_length, adjust=False) of True Range
+ *   Normalized ATR ATR / close * 100
+ *   Percentile     count(window[i-L, i) <= current) / L * 100, 50 during warmup
+ *   Regime         pct < low -> low EMAs, pct >= high -> high EMAs, else med
+ *   Signals        fast crosses above slow -> BUY, below -> SELL
+ *
+ * Parameter layout (NUM_PARAMS floats per combination):
+ *   fast_low, slow_low, fast_med, slow_med, fast_high, slow_high,
+ *   atr_length, volatility_length, low_vol_percentile, high_vol_percentile
+ *
+ * Result layout (NUM_RESULTS floats per combination):
+ *   total_return, max_drawdown, calmar_ratio, sharpe_ratio, total_trades
+ */
+
+#define NUM_PARAMS 10
+#define NUM_RESULTS 5
+#define NUM_TRACE 4
+#define MAX_VOL_LENGTH 256
+
+#define RESULT_TOTAL_RETURN 0
+#define RESULT_MAX_DRAWDOWN 1
+#define RESULT_CALMAR 2
+#define RESULT_SHARPE 3
+#define RESULT_TRADES 4
+
+#define TRACE_EMA_FAST 0
+#define TRACE_EMA_SLOW 1
+#define TRACE_VOL_PERCENTILE 2
+#define TRACE_SIGNAL 3
+
+inline float ema_alpha(float span) {
+    return 2.0f / (span + 1.0f);
+}
+
+/**
+ * Run one parameter combination over all bars.
+ * When trace is non-zero, per-bar indicators and signals are written to
+ * trace_out[bar * NUM_TRACE + field].
+ */
+void evaluate_combination(
+    __global const float* close,
+    __global const float* high,
+    __global const float* low,
+    __global const float* p,
+    __global float* out,
+    __global float* trace_out,
+    const int trace,
+    const int num_bars,
+    const int warmup,
+    const float initial_capital,
+    const float bars_per_year)
+{
+    const float a_fast_low = ema_alpha(p[0]);
+    const float a_slow_low = ema_alpha(p[1]);
+    const float a_fast_med = ema_alpha(p[2]);
+    const float a_slow_med = ema_alpha(p[3]);
+    const float a_fast_high = ema_alpha(p[4]);
+    const float a_slow_high = ema_alpha(p[5]);
+    const float a_atr = ema_alpha(p[6]);
+    // The host rejects volatility_length > MAX_VOL_LENGTH (check_params_array);
+    // the clamp only keeps a bad buffer from writing past the window
+    const int vol_length = min((int)p[7], MAX_VOL_LENGTH);
+    const float low_pct = p[8];
+    const float high_pct = p[9];
+
+    float window[MAX_VOL_LENGTH];
+
+    float ema_fl = close[0], ema_sl = close[0];
+    float ema_fm = close[0], ema_sm = close[0];
+    float ema_fh = close[0], ema_sh = close[0];
+    float atr = high[0] - low[0];
+
+    float prev_fast = 0.0f, prev_slow = 0.0f;
+    int position = 0;
+    float equity = initial_capital;
+    float peak = initial_capital;
+    float max_dd = 0.0f;
+    int trades = 0;
+    int n_returns = 0;
+    float mean_ret = 0.0f, m2_ret = 0.0f;
+
+    for (int i = 0; i < num_bars; i++) {
+        const float c = close[i];
+
+        // Indicators
+        if (i > 0) {
+            const float pc = close[i - 1];
+            const float tr = fmax(high[i] - low[i], fmax(fabs(high[i] - pc), fabs(low[i] - pc)));
+            atr = a_atr * tr + (1.0f - a_atr) * atr;
+            ema_fl = a_fast_low * c + (1.0f - a_fast_low) * ema_fl;
+            ema_sl = a_slow_low * c + (1.0f - a_slow_low) * ema_sl;
+            ema_fm = a_fast_med * c + (1.0f - a_fast_med) * ema_fm;
+            ema_sm = a_slow_med * c + (1.0f - a_slow_med) * ema_sm;
+            ema_fh = a_fast_high * c + (1.0f - a_fast_high) * ema_fh;
+            ema_sh = a_slow_high * c + (1.0f - a_slow_high) * ema_sh;
+        }
+        const float natr = atr / c * 100.0f;
+
+        float pct = 50.0f;
+        if (i >= vol_length) {
+            int count = 0;
+            for (int j = 0; j < vol_length; j++) {
+                count += (window[j] <= natr) ? 1 : 0;
+            }
+            pct = (float)count / (float)vol_length * 100.0f;
+        }
+        window[i % vol_length] = natr;
+
+        float fast, slow;
+        if (pct < low_pct) {
+            fast = ema_fl; slow = ema_sl;
+        } else if (pct >= high_pct) {
+            fast = ema_fh; slow = ema_sh;
+        } else {
+            fast = ema_fm; slow = ema_sm;
+        }
+
+        int signal = 0;
+        if (i > 0) {
+            if (prev_fast <= prev_slow && fast > slow) signal = 1;
+            else if (prev_fast >= prev_slow && fast < slow) signal = -1;
+        }
+        prev_fast = fast;
+        prev_slow = slow;
+
+        if (trace) {
+            trace_out[i * NUM_TRACE + TRACE_EMA_FAST] = fast;
+            trace_out[i * NUM_TRACE + TRACE_EMA_SLOW] = slow;
+            trace_out[i * NUM_TRACE + TRACE_VOL_PERCENTILE] = pct;
+            trace_out[i * NUM_TRACE + TRACE_SIGNAL] = (float)signal;
+        }
+
+        // Mark to market with the position held since the previous close
+        if (i > 0) {
+            const float r = position ? (c / close[i - 1] - 1.0f) : 0.0f;
+            equity *= 1.0f + r;
+            if (i > warmup) {
+                n_returns++;
+                const float delta = r - mean_ret;
+                mean_ret += delta / (float)n_returns;
+                m2_ret += delta * (r - mean_ret);
+            }
+        }
+        if (i >= warmup) {
+            peak = fmax(peak, equity);
+            max_dd = fmax(max_dd, 1.0f - equity / peak);
+
+            // Fill at this bar's close
+            if (signal == 1 && !position) {
+                position = 1;
+            } else if (signal == -1 && position) {
+                position = 0;
+                trades++;
+            }
+        }
+    }
+
+    const float total_return = (equity / initial_capital - 1.0f) * 100.0f;
+    const float max_drawdown = max_dd * 100.0f;
+    const float std_ret = n_returns > 1 ? sqrt(m2_ret / (float)n_returns) : 0.0f;
+
+    out[RESULT_TOTAL_RETURN] = total_return;
+    out[RESULT_MAX_DRAWDOWN] = max_drawdown;
+    out[RESULT_CALMAR] = max_drawdown > 0.0f ? total_return / max_drawdown : 0.0f;
+    out[RESULT_SHARPE] = std_ret > 0.0f ? mean_ret / std_ret * sqrt(bars_per_year) : 0.0f;
+    out[RESULT_TRADES] = (float)trades;
+}
+
+__kernel void optimize_strategy(
+    __global const float* close,
+    __global const float* high,
+    __global const float* low,
+    __global const float* params,
+    __global float* results,
+    const int num_bars,
+    const int num_combinations,
+    const int warmup,
+    const float initial_capital,
+    const float bars_per_year)
+{
+    const int gid = get_global_id(0);
+    if (gid >= num_combinations) return;
+
+    evaluate_combination(close, high, low, params + gid * NUM_PARAMS, results + gid * NUM_RESULTS,
+                         results, 0, num_bars, warmup, initial_capital, bars_per_year);
+}
+
+__kernel void trace_strategy(
+    __global const float* close,
+    __global const float* high,
+    __global const float* low,
+    __global const float* params,
+    __global float* results,
+    __global float* trace,
+    const int num_bars,
+    const int num_combinations,
+    const int warmup,
+    const float initial_capital,
+    const float bars_per_year)
+{
+    const int gid = get_global_id(0);
+    if (gid >= num_combinations) return;
+
+    evaluate_combination(close, high, low, params + gid * NUM_PARAMS, results + gid * NUM_RESULTS,
+                         trace + gid * num_bars * NUM_TRACE, 1, num_bars, warmup, initial_capital,
+                         bars_per_year);
+}
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Validate (and optionally repair) a data file
+Usage: python3 validate_data.py TICKER INTERVAL [--regular-hours] [--repair] [--fill-gaps] [--force]
+Example: python3 validate_data.py QQQ 1h --regular-hours --repair
+
+Checks data/<ticker>_<interval>.csv for out-of-order or duplicate timestamps,
+invalid prices, missing bars/sessions and volume outliers. Results are cached
+in data/manifest.json, so unchanged files are not re-scanned.
+
+--repair rewrites the file sorted and de-duplicated, with invalid bars dropped
+(and bars outside 09:30-16:00 ET with --regular-hours). --fill-gaps also
+inserts flat zero-volume bars for missing intraday bars.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'backtesting'))
+
+from utils.data_loader import load_data, save_data
+from utils.validation import format_report, repair_bars, validate_file
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Validate and repair OHLCV data files')
+    parser.add_argument('ticker')
+    parser.add_argument('interval')
+    parser.add_argument('--regular-hours', action='store_true', help='Only 09:30-16:00 ET bars are valid')
+    parser.add_argument('--repair', action='store_true', help='Rewrite the file with repairs applied')
+    parser.add_argument('--fill-gaps', action='store_true', help='With --repair, fill missing intraday bars')
+    parser.add_argument('--force', action='store_true', help='Ignore the cached result in the manifest')
+    args = parser.parse_args(argv)
+
+    ticker = args.ticker.upper()
+    interval = args.interval.lower()
+    session = 'regular' if args.regular_hours else None
+    filename = Path('data') / f"{ticker.lower()}_{interval}.csv"
+
+    if not filename.exists():
+        print(f"❌ Error: Could not open {filename}")
+        print(f"   Run: python3 fetch_data.py {ticker} {interval} 600")
+        return 1
+
+    print(f"🔎 Validating {filename}")
+    report = validate_file(filename, interval, session=session, force=args.force)
+    for line in format_report(report):
+        print(f"   {line}")
+
+    if args.repair:
+        data, repairs = repair_bars(load_data(filename), interval, session=session, fill_gaps=args.fill_gaps)
+        if not any(repairs.values()):
+            print("   ✅ Nothing to repair")
+        else:
+            for name, count in repairs.items():
+                if count:
+                    print(f"   🔧 {name}: {count}")
+            save_data(data, filename)
+            print(f"   ✅ Saved {len(data)} candles to {filename}")
+            report = validate_file(filename, interval, session=session)
+            for line in format_report(report):
+                print(f"   {line}")
+
+    return 0 if report['valid'] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())